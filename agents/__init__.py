@@ -2,15 +2,25 @@
 Multi-Agent System
 
 Specialized agents that collaborate to analyze markets and execute trades.
+
+Submodules are imported lazily (PEP 562) so `import agents` stays cheap;
+the exchange/trading/strategy tool stack loads on first attribute access.
 """
 
-from .base_agent import BaseAgent, AgentContext, AgentDecision
-from .risk_agent import RiskAgent
-from .execution_agent import ExecutionAgent
-from .research_agent import ResearchAgent
-from .manager_agent import ManagerAgent
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    "BaseAgent": ".base_agent",
+    "AgentContext": ".base_agent",
+    "AgentDecision": ".base_agent",
+    "RiskAgent": ".risk_agent",
+    "ExecutionAgent": ".execution_agent",
+    "ResearchAgent": ".research_agent",
+    "ManagerAgent": ".manager_agent",
+}
 
-__all__ = [
+__all__ = (
     "BaseAgent",
     "AgentContext",
     "AgentDecision",
@@ -18,4 +28,17 @@ __all__ = [
     "ExecutionAgent",
     "ResearchAgent",
     "ManagerAgent",
-]
+)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(__all__))
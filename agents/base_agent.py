@@ -4,12 +4,47 @@ Base Agent - Abstract Interface for All Agents
 Defines the core contract (think, act) and shared data structures.
 """
 
+import asyncio
+import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from enum import Enum
 
+import numpy as np
+
+# Long-lived event loop shared by all agents for sync -> async bridging.
+# Started lazily on a daemon thread so repeated calls reuse one loop (and the
+# HTTP connections bound to it) instead of building a fresh loop per call.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the shared background event loop."""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(
+                target=_LOOP.run_forever,
+                name="agent-event-loop",
+                daemon=True
+            ).start()
+    return _LOOP
+
+# Wall-clock/monotonic anchor pair used to turn message ts_ns values into
+# readable timestamps only when messages are serialized.
+_WALL_ANCHOR = time.time()
+_MONO_ANCHOR_NS = time.monotonic_ns()
+
+
+def _format_ts(ts_ns: int) -> str:
+    """Convert a time.monotonic_ns() reading to an ISO-8601 local timestamp."""
+    return datetime.fromtimestamp(_WALL_ANCHOR + (ts_ns - _MONO_ANCHOR_NS) / 1e9).isoformat()
+
 class AgentAction(Enum):
     """Possible actions an agent can recommend."""
     BUY = "BUY"
@@ -17,9 +52,24 @@ class AgentAction(Enum):
     HOLD = "HOLD"
     RESEARCH = "RESEARCH"  # Need more info
     ALERT = "ALERT"        # Flag for human review
+    
+    @property
+    def idx(self) -> int:
+        """Small int id for array-indexed hot paths (see _ACTION_IDX)."""
+        return _ACTION_IDX[self]
+
 
+# Fixed int ids per action; also the vote tie-break order in ManagerAgent
+_ACTION_IDX = {
+    AgentAction.BUY: 0,
+    AgentAction.SELL: 1,
+    AgentAction.HOLD: 2,
+    AgentAction.ALERT: 3,
+    AgentAction.RESEARCH: 4,
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class AgentContext:
     """Shared context passed between agents in a pipeline."""
     symbol: str
@@ -27,8 +77,8 @@ class AgentContext:
     
     # Market Data (populated by Research/Manager)
     price: Optional[float] = None
-    bids: List[List[float]] = field(default_factory=list)
-    asks: List[List[float]] = field(default_factory=list)
+    bids: np.ndarray = field(default_factory=lambda: np.empty((0, 2)))  # (N, 2) [price, volume]
+    asks: np.ndarray = field(default_factory=lambda: np.empty((0, 2)))
     sentiment_score: Optional[float] = None  # 0-100
     
     # Analysis Results (populated by specialized agents)
@@ -43,17 +93,35 @@ class AgentContext:
     # Agent Communication
     messages: List[Dict[str, Any]] = field(default_factory=list)
     
+    # Derived from symbol in __post_init__ (e.g. "BTC/USDT" -> "BTC")
+    base_asset: str = field(default="", init=False)
+    
+    def __post_init__(self):
+        self.base_asset = self.symbol.split('/')[0] if '/' in self.symbol else self.symbol
+    
     def add_message(self, agent_name: str, content: str, priority: str = "INFO"):
         """Add a message from an agent to the shared context."""
         self.messages.append({
             "agent": agent_name,
             "content": content,
             "priority": priority,
-            "timestamp": datetime.now().isoformat()
+            "ts_ns": time.monotonic_ns()
         })
+    
+    def formatted_messages(self) -> List[Dict[str, Any]]:
+        """Messages with ts_ns replaced by an ISO 'timestamp' (for output)."""
+        return [
+            {
+                "agent": m["agent"],
+                "content": m["content"],
+                "priority": m["priority"],
+                "timestamp": _format_ts(m["ts_ns"])
+            }
+            for m in self.messages
+        ]
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentDecision:
     """Output of an agent's think() method."""
     agent_name: str
@@ -68,7 +136,7 @@ class AgentDecision:
             "action": self.action.value,
             "confidence": round(self.confidence, 3),
             "rationale": self.rationale,
-            "metadata": self.metadata
+            "metadata": dict(self.metadata)  # plain, caller-owned copy (metadata may be a read-only mappingproxy)
         }
 
 
@@ -112,12 +180,61 @@ class BaseAgent(ABC):
         """
         pass
     
+    async def think_async(self, context: AgentContext) -> AgentDecision:
+        """
+        Awaitable variant of think() so agents can be scheduled concurrently.
+        
+        Agents without network I/O inherit this default, which simply
+        delegates to the synchronous think().
+        """
+        return self.think(context)
+    
+    def think_and_act(self, context: AgentContext) -> Tuple[AgentDecision, AgentContext]:
+        """
+        Think then act, returning both the decision and the updated context.
+        
+        Use this when the caller needs the decision as well, instead of
+        calling run() and then think() again.
+        """
+        decision = self.think(context)
+        return decision, self.act(decision, context)
+    
+    async def think_and_act_async(self, context: AgentContext) -> Tuple[AgentDecision, AgentContext]:
+        """
+        Awaitable variant of think_and_act().
+        """
+        decision = await self.think_async(context)
+        return decision, self.act(decision, context)
+    
     def run(self, context: AgentContext) -> AgentContext:
         """
         Convenience method: think then act.
         """
-        decision = self.think(context)
-        return self.act(decision, context)
+        return self.think_and_act(context)[1]
+    
+    async def run_async(self, context: AgentContext) -> AgentContext:
+        """
+        Awaitable convenience method: think_async then act.
+        """
+        return (await self.think_and_act_async(context))[1]
+    
+    def _run_async(self, coro):
+        """
+        Helper to run async functions from synchronous callers.
+        
+        Submits the coroutine to the shared background loop and blocks
+        until it completes. Works whether or not the caller is already
+        inside another event loop.
+        """
+        loop = _get_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coro.close()
+            raise RuntimeError("Cannot block on the agent loop from within it; await the *_async method instead")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
     
     def __repr__(self):
         return f"<{self.__class__.__name__}(name='{self.name}')>"
@@ -8,9 +8,31 @@ Focuses on:
 - Position building/unwinding strategies
 """
 
+from types import MappingProxyType
+from typing import Any, Dict
 from .base_agent import BaseAgent, AgentContext, AgentDecision, AgentAction
-from tools.trading_tools import execute_order, get_positions
-import json
+from tools.trading_tools import execute_order_dict, get_positions_dict
+import time
+
+# Short-lived positions cache shared by ExecutionAgent and RiskAgent.
+# Balances don't change between agents called milliseconds apart, so a
+# multi-symbol batch only needs one positions fetch per TTL window.
+_POS_CACHE_TTL = 2.0  # seconds
+_POS_CACHE: Dict[str, Any] = {"ts": 0.0, "data": None}
+
+
+def _get_positions_cached() -> Dict[str, Any]:
+    """Get current positions, re-fetching at most once per TTL window."""
+    now = time.monotonic()
+    if _POS_CACHE["data"] is None or now - _POS_CACHE["ts"] > _POS_CACHE_TTL:
+        _POS_CACHE["data"] = get_positions_dict()
+        _POS_CACHE["ts"] = now
+    return _POS_CACHE["data"]
+
+
+def _invalidate_positions_cache() -> None:
+    """Force the next positions lookup to hit the trading tools."""
+    _POS_CACHE["data"] = None
 
 
 class ExecutionAgent(BaseAgent):
@@ -18,6 +40,23 @@ class ExecutionAgent(BaseAgent):
     Handles intelligent order execution.
     """
     
+    # Shared decisions for the common no-trade paths. Read-only: metadata is a
+    # mappingproxy; use dataclasses.replace() to derive a modified copy.
+    _HOLD_DEFAULT = AgentDecision(
+        agent_name="ExecutionAgent",
+        action=AgentAction.HOLD,
+        confidence=0.5,
+        rationale="No clear execution signal",
+        metadata=MappingProxyType({})
+    )
+    _HOLD_RISK = AgentDecision(
+        agent_name="ExecutionAgent",
+        action=AgentAction.HOLD,
+        confidence=0.9,
+        rationale="Risk too high for execution",
+        metadata=MappingProxyType({"blocked_by": "risk"})
+    )
+    
     def __init__(self):
         super().__init__("ExecutionAgent")
         self.min_confidence_to_execute = 0.7  # Only execute if > 70% confident
@@ -26,36 +65,31 @@ class ExecutionAgent(BaseAgent):
         """
         Analyze if and how to execute based on context.
         """
-        # Get current positions
-        pos_data = json.loads(get_positions())
-        balance = pos_data.get("balance_usd", 0)
-        positions = pos_data.get("positions", {})
+        # Check risk assessment first (no I/O needed to veto)
+        risk_data = context.risk_assessment or {}
+        risk_score = risk_data.get("risk_score", 0)
         
-        # Update context with live data
-        context.available_capital = balance
-        asset = context.symbol.split('/')[0] if '/' in context.symbol else context.symbol
-        context.current_position = positions.get(asset, 0)
+        if risk_score > 0.5:
+            return self._HOLD_RISK
         
         # Check ML prediction from context
         ml_pred = context.ml_prediction or {}
         ml_signal = ml_pred.get("signal", "STATIONARY")
         ml_confidence = ml_pred.get("confidence", 0.0)
         
-        # Check risk assessment
-        risk_data = context.risk_assessment or {}
-        risk_score = risk_data.get("risk_score", 0)
+        if ml_signal not in ("UP", "DOWN") or ml_confidence < self.min_confidence_to_execute:
+            return self._HOLD_DEFAULT
         
-        # Decision logic
-        if risk_score > 0.5:
-            return AgentDecision(
-                agent_name=self.name,
-                action=AgentAction.HOLD,
-                confidence=0.9,
-                rationale="Risk too high for execution",
-                metadata={"blocked_by": "risk"}
-            )
+        # Actionable signal: now get current positions
+        pos_data = _get_positions_cached()
+        balance = pos_data.get("balance_usd", 0)
+        positions = pos_data.get("positions", {})
         
-        if ml_signal == "UP" and ml_confidence >= self.min_confidence_to_execute:
+        # Update context with live data
+        context.available_capital = balance
+        context.current_position = positions.get(context.base_asset, 0)
+        
+        if ml_signal == "UP":
             # Calculate position size (simplified: 5% of capital)
             trade_value = balance * 0.05
             quantity = trade_value / context.price if context.price else 0
@@ -73,7 +107,7 @@ class ExecutionAgent(BaseAgent):
                 }
             )
             
-        elif ml_signal == "DOWN" and ml_confidence >= self.min_confidence_to_execute:
+        elif ml_signal == "DOWN":
             # Sell existing position if any
             if context.current_position > 0:
                 return AgentDecision(
@@ -88,13 +122,7 @@ class ExecutionAgent(BaseAgent):
                     }
                 )
         
-        return AgentDecision(
-            agent_name=self.name,
-            action=AgentAction.HOLD,
-            confidence=0.5,
-            rationale="No clear execution signal",
-            metadata={}
-        )
+        return self._HOLD_DEFAULT
     
     def act(self, decision: AgentDecision, context: AgentContext) -> AgentContext:
         """
@@ -102,15 +130,16 @@ class ExecutionAgent(BaseAgent):
         """
         if decision.action in [AgentAction.BUY, AgentAction.SELL]:
             meta = decision.metadata
-            asset = context.symbol.split('/')[0] if '/' in context.symbol else context.symbol
+            asset = context.base_asset
             
-            result_json = execute_order(
+            result = execute_order_dict(
                 symbol=asset,
                 side=decision.action.value,
                 quantity=meta.get("quantity", 0),
                 price=meta.get("price", 0)
             )
-            result = json.loads(result_json)
+            if result.get("status") == "FILLED":
+                _invalidate_positions_cache()
             
             context.add_message(
                 self.name,
@@ -125,3 +154,12 @@ class ExecutionAgent(BaseAgent):
             )
         
         return context
+
+
+# Shared instance reused by every ManagerAgent
+_singleton = ExecutionAgent()
+
+
+def get_agent() -> ExecutionAgent:
+    """Get the shared ExecutionAgent instance."""
+    return _singleton
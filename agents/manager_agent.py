@@ -9,11 +9,14 @@ Orchestrates the multi-agent pipeline:
 Aggregates decisions and provides final recommendation.
 """
 
-from typing import List, Dict, Any
+import asyncio
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional
+import numpy as np
 from .base_agent import BaseAgent, AgentContext, AgentDecision, AgentAction
-from .research_agent import ResearchAgent
-from .risk_agent import RiskAgent
-from .execution_agent import ExecutionAgent
+from .research_agent import get_agent as get_research_agent
+from .risk_agent import get_agent as get_risk_agent
+from .execution_agent import get_agent as get_execution_agent
 
 
 class ManagerAgent(BaseAgent):
@@ -21,34 +24,53 @@ class ManagerAgent(BaseAgent):
     Coordinates multiple specialized agents in a pipeline.
     """
     
+    # Vote slots by AgentAction.idx, which is also the tie-break order
+    # (argmax picks the first maximum)
+    _ACTION_ORDER = tuple(sorted(AgentAction, key=lambda action: action.idx))
+    _ACTION_BY_VALUE = {action.value: action for action in AgentAction}
+    
+    # Voting weights by agent (read-only; unknown agents get 0.2)
+    _WEIGHTS = MappingProxyType({
+        "ResearchAgent": 0.4,
+        "RiskAgent": 0.3,
+        "ExecutionAgent": 0.3
+    })
+    
     def __init__(self):
         super().__init__("ManagerAgent")
         
-        # Initialize sub-agents
-        self.research_agent = ResearchAgent()
-        self.risk_agent = RiskAgent()
-        self.execution_agent = ExecutionAgent()
+        # Sub-agents are shared module-level instances (stateless w.r.t. context)
+        self.research_agent = get_research_agent()
+        self.risk_agent = get_risk_agent()
+        self.execution_agent = get_execution_agent()
         
         # Pipeline configuration
         self.auto_execute = False  # If True, execution agent will trade
+        self.verbose = False  # If True, final rationale joins every sub-agent rationale
     
     def think(self, context: AgentContext) -> AgentDecision:
         """
         Run the full analysis pipeline and aggregate results.
         """
+        return self._run_async(self.think_async(context))
+    
+    async def think_async(self, context: AgentContext) -> AgentDecision:
+        """
+        Awaitable version of think() for callers already in an event loop.
+        """
         decisions: List[AgentDecision] = []
         
-        # Stage 1: Research
-        context = self.research_agent.run(context)
-        decisions.append(self.research_agent.think(context))
+        # Stage 1: Research (one think + act; the decision is reused below)
+        research_decision, context = await self.research_agent.think_and_act_async(context)
+        decisions.append(research_decision)
         
-        # Stage 2: Risk Assessment
-        context = self.risk_agent.run(context)
-        decisions.append(self.risk_agent.think(context))
+        # Stage 2: Risk Assessment (act sets context.risk_assessment, which
+        # execution planning reads)
+        risk_decision, context = await self.risk_agent.think_and_act_async(context)
+        decisions.append(risk_decision)
         
         # Stage 3: Execution Planning (but not executing yet)
-        exec_decision = self.execution_agent.think(context)
-        decisions.append(exec_decision)
+        decisions.append(await self.execution_agent.think_async(context))
         
         # Aggregate decisions
         return self._aggregate_decisions(decisions, context)
@@ -57,37 +79,29 @@ class ManagerAgent(BaseAgent):
         """
         Combine multiple agent decisions into a final recommendation.
         """
-        # Voting weights by agent
-        weights = {
-            "ResearchAgent": 0.4,
-            "RiskAgent": 0.3,
-            "ExecutionAgent": 0.3
-        }
-        
         # Collect votes
-        action_scores = {
-            AgentAction.BUY: 0.0,
-            AgentAction.SELL: 0.0,
-            AgentAction.HOLD: 0.0,
-            AgentAction.ALERT: 0.0,
-            AgentAction.RESEARCH: 0.0
-        }
+        weights = self._WEIGHTS
+        scores = np.zeros(len(self._ACTION_ORDER))
         
         for decision in decisions:
             weight = weights.get(decision.agent_name, 0.2)
-            action_scores[decision.action] += decision.confidence * weight
+            scores[decision.action.idx] += decision.confidence * weight
         
         # Find winning action
-        best_action = max(action_scores, key=action_scores.get)
-        best_score = action_scores[best_action]
+        best_idx = int(scores.argmax())
+        best_action = self._ACTION_ORDER[best_idx]
+        best_score = float(scores[best_idx])
         
-        # Generate combined rationale
-        rationales = [f"{d.agent_name}: {d.rationale}" for d in decisions]
-        combined_rationale = " | ".join(rationales)
+        # Generate combined rationale (per-agent detail stays in sub_decisions)
+        if self.verbose:
+            combined_rationale = " | ".join(f"{d.agent_name}: {d.rationale}" for d in decisions)
+        else:
+            combined_rationale = "Weighted vote across sub-agents"
         
         # Check for veto conditions
-        risk_decision = next((d for d in decisions if d.agent_name == "RiskAgent"), None)
-        if risk_decision and risk_decision.action == AgentAction.ALERT:
+        by_agent = {d.agent_name: d for d in decisions}
+        risk_decision = by_agent.get("RiskAgent")
+        if risk_decision and risk_decision.action is AgentAction.ALERT:
             best_action = AgentAction.HOLD
             combined_rationale = f"RISK VETO: {risk_decision.rationale}"
         
@@ -98,7 +112,11 @@ class ManagerAgent(BaseAgent):
             rationale=combined_rationale,
             metadata={
                 "sub_decisions": [d.to_dict() for d in decisions],
-                "action_scores": {k.value: round(v, 3) for k, v in action_scores.items()},
+                "sub_decision_index": {d.agent_name: i for i, d in enumerate(decisions)},
+                "action_scores": {
+                    action.value: round(float(score), 3)
+                    for action, score in zip(self._ACTION_ORDER, scores)
+                },
                 "research_report": context.research_report
             }
         )
@@ -109,16 +127,14 @@ class ManagerAgent(BaseAgent):
         """
         if self.auto_execute and decision.action in [AgentAction.BUY, AgentAction.SELL]:
             # Find the execution decision and execute it
-            exec_decision = next(
-                (d for d in decision.metadata.get("sub_decisions", []) 
-                 if d.get("agent") == "ExecutionAgent"),
-                None
-            )
+            sub_decisions = decision.metadata.get("sub_decisions", [])
+            exec_idx = decision.metadata.get("sub_decision_index", {}).get("ExecutionAgent")
+            exec_decision = sub_decisions[exec_idx] if exec_idx is not None else None
             if exec_decision:
                 context = self.execution_agent.act(
                     AgentDecision(
                         agent_name="ExecutionAgent",
-                        action=AgentAction[exec_decision["action"]],
+                        action=self._ACTION_BY_VALUE[exec_decision["action"]],
                         confidence=exec_decision["confidence"],
                         rationale=exec_decision["rationale"],
                         metadata=exec_decision.get("metadata", {})
@@ -145,6 +161,12 @@ class ManagerAgent(BaseAgent):
         Returns:
             Dict with final decision and all sub-decisions.
         """
+        return self._run_async(self.run_pipeline_async(symbol, sentiment_score))
+    
+    async def run_pipeline_async(self, symbol: str, sentiment_score: float = 50.0) -> Dict[str, Any]:
+        """
+        Awaitable version of run_pipeline() for callers already in an event loop.
+        """
         # Create fresh context
         context = AgentContext(
             symbol=symbol,
@@ -152,16 +174,62 @@ class ManagerAgent(BaseAgent):
         )
         
         # Run think -> act
-        decision = self.think(context)
+        decision = await self.think_async(context)
         context = self.act(decision, context)
         
         return {
             "final_decision": decision.to_dict(),
-            "context_messages": context.messages,
+            "context_messages": context.formatted_messages(),
             "research_report": context.research_report,
             "risk_assessment": context.risk_assessment,
             "ml_prediction": context.ml_prediction
         }
+    
+    def run_pipeline_batch(
+        self,
+        symbols: List[str],
+        sentiments: Optional[List[float]] = None,
+        concurrency_limit: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the pipeline for many symbols concurrently.
+        
+        Args:
+            symbols: Trading pairs (e.g., ["BTC/USDT", "ETH/USDT"])
+            sentiments: Optional per-symbol Fear & Greed scores (default 50 each)
+            concurrency_limit: Max pipelines in flight (exchange rate limiting)
+            
+        Returns:
+            List of run_pipeline() results, in input order.
+        """
+        return self._run_async(
+            self.run_pipeline_batch_async(symbols, sentiments, concurrency_limit)
+        )
+    
+    async def run_pipeline_batch_async(
+        self,
+        symbols: List[str],
+        sentiments: Optional[List[float]] = None,
+        concurrency_limit: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Awaitable version of run_pipeline_batch().
+        """
+        if sentiments is None:
+            sentiments = [50.0] * len(symbols)
+        elif len(sentiments) != len(symbols):
+            raise ValueError("sentiments must have one entry per symbol")
+        
+        semaphore = asyncio.Semaphore(concurrency_limit)
+        
+        async def _run_one(symbol: str, sentiment_score: float) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.run_pipeline_async(symbol, sentiment_score)
+        
+        results = await asyncio.gather(
+            *(_run_one(symbol, sentiment) for symbol, sentiment in zip(symbols, sentiments))
+        )
+        return list(results)
 
 
 # Singleton for easy access
@@ -9,10 +9,10 @@ Focuses on:
 """
 
 from .base_agent import BaseAgent, AgentContext, AgentDecision, AgentAction
-from tools.exchange_tools import fetch_ticker, fetch_orderbook
-from tools.strategy_tools import get_trading_signal
+from tools.exchange_tools import fetch_ticker_dict, fetch_orderbook_dict
+from tools.strategy_tools import get_trading_signal_dict
 import asyncio
-import json
+import numpy as np
 
 
 class ResearchAgent(BaseAgent):
@@ -23,27 +23,22 @@ class ResearchAgent(BaseAgent):
     def __init__(self):
         super().__init__("ResearchAgent")
     
-    def _run_async(self, coro):
-        """Helper to run async functions."""
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If already in async context, create task
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    return pool.submit(asyncio.run, coro).result()
-            return loop.run_until_complete(coro)
-        except RuntimeError:
-            return asyncio.run(coro)
-    
     def think(self, context: AgentContext) -> AgentDecision:
         """
         Fetch data and run analysis.
         """
+        return self._run_async(self.think_async(context))
+    
+    async def think_async(self, context: AgentContext) -> AgentDecision:
+        """
+        Fetch data and run analysis without blocking the event loop.
+        """
         try:
-            # 1. Fetch ticker data
-            ticker_json = self._run_async(fetch_ticker(context.symbol))
-            ticker = json.loads(ticker_json)
+            # 1. Fetch ticker and orderbook concurrently (independent round trips)
+            ticker, ob = await asyncio.gather(
+                fetch_ticker_dict(context.symbol),
+                fetch_orderbook_dict(context.symbol)
+            )
             
             if "error" in ticker:
                 return AgentDecision(
@@ -56,23 +51,20 @@ class ResearchAgent(BaseAgent):
             
             context.price = ticker.get("last_price")
             
-            # 2. Fetch orderbook
-            ob_json = self._run_async(fetch_orderbook(context.symbol))
-            ob = json.loads(ob_json)
-            
+            # 2. Use the orderbook (discarded above if the ticker failed)
             if "error" not in ob:
-                context.bids = ob.get("bids", [])
-                context.asks = ob.get("asks", [])
+                # Convert once at ingestion so every consumer gets (N, 2) float arrays
+                context.bids = np.asarray(ob.get("bids", []), dtype=np.float64).reshape(-1, 2)
+                context.asks = np.asarray(ob.get("asks", []), dtype=np.float64).reshape(-1, 2)
             
             # 3. Get trading signal (uses ML + Strategy)
-            if context.bids and context.asks:
-                signal_json = get_trading_signal(
+            if context.bids.size and context.asks.size:
+                signal = get_trading_signal_dict(
                     context.symbol,
                     context.bids,
                     context.asks,
                     context.sentiment_score or 50.0
                 )
-                signal = json.loads(signal_json)
                 
                 context.ml_prediction = signal.get("ml_signal", {})
                 
@@ -86,7 +78,7 @@ class ResearchAgent(BaseAgent):
                 confidence = signal.get("confidence", 0.0)
                 
                 # Generate report
-                report = self._generate_report(ticker, ob, signal)
+                report = self._generate_report(ticker, context.bids, context.asks, signal)
                 context.research_report = report
                 
                 return AgentDecision(
@@ -118,7 +110,7 @@ class ResearchAgent(BaseAgent):
                 metadata={"exception": str(e)}
             )
     
-    def _generate_report(self, ticker: dict, orderbook: dict, signal: dict) -> str:
+    def _generate_report(self, ticker: dict, bids: np.ndarray, asks: np.ndarray, signal: dict) -> str:
         """Generate a human-readable research report."""
         lines = [
             f"## Research Report: {ticker.get('symbol', 'N/A')}",
@@ -131,8 +123,8 @@ class ResearchAgent(BaseAgent):
             f"- **Reason:** {signal.get('reason', 'N/A')}",
             "",
             "### Orderbook",
-            f"- **Top Bid:** ${orderbook.get('bids', [[0]])[0][0]:,.2f}" if orderbook.get('bids') else "- No bids",
-            f"- **Top Ask:** ${orderbook.get('asks', [[0]])[0][0]:,.2f}" if orderbook.get('asks') else "- No asks",
+            f"- **Top Bid:** ${bids[0, 0]:,.2f}" if bids.size else "- No bids",
+            f"- **Top Ask:** ${asks[0, 0]:,.2f}" if asks.size else "- No asks",
         ]
         return "\n".join(lines)
     
@@ -146,3 +138,13 @@ class ResearchAgent(BaseAgent):
             "INFO"
         )
         return context
+
+
+# Shared instance. Agents keep no per-pipeline state (everything flows
+# through AgentContext), so every ManagerAgent can reuse the same one.
+_singleton = ResearchAgent()
+
+
+def get_agent() -> ResearchAgent:
+    """Get the shared ResearchAgent instance."""
+    return _singleton
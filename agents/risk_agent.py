@@ -8,8 +8,45 @@ Focuses on:
 - Stop-loss recommendations
 """
 
+from types import MappingProxyType
+
 from .base_agent import BaseAgent, AgentContext, AgentDecision, AgentAction
+from .execution_agent import _get_positions_cached
 from core.risk_engine import risk_engine
+from core.jit import njit
+
+# Bits set in the _risk_kernel flags result
+RISK_CONCENTRATION = 1
+RISK_EXTREME_FEAR = 2
+RISK_EXTREME_GREED = 4
+
+
+@njit(cache=True)
+def _risk_kernel(position, price, capital, sentiment, max_pct):
+    """
+    Score concentration and sentiment risk.
+    
+    sentiment may be NaN (unknown), in which case no sentiment flag is set.
+    
+    Returns:
+        (risk_score, concentration, flags) where flags is a RISK_* bitmask.
+    """
+    concentration = position * price / capital if capital > 0 else 0.0
+    risk_score = 0.0
+    flags = 0
+    
+    if concentration > max_pct:
+        flags |= RISK_CONCENTRATION
+        risk_score += 0.3
+    
+    if sentiment < 20:
+        flags |= RISK_EXTREME_FEAR
+        risk_score += 0.2
+    elif sentiment > 80:
+        flags |= RISK_EXTREME_GREED
+        risk_score += 0.2
+    
+    return risk_score, concentration, flags
 
 
 class RiskAgent(BaseAgent):
@@ -17,6 +54,16 @@ class RiskAgent(BaseAgent):
     Analyzes risk factors and recommends position sizing.
     """
     
+    # Shared decision for the no-capital path. Read-only: its metadata is a
+    # mappingproxy; use dataclasses.replace() to derive a modified copy.
+    _HOLD_NO_CAPITAL = AgentDecision(
+        agent_name="RiskAgent",
+        action=AgentAction.HOLD,
+        confidence=0.9,
+        rationale="No capital available for trading",
+        metadata=MappingProxyType({"risk_level": "BLOCKED"})
+    )
+    
     def __init__(self):
         super().__init__("RiskAgent")
         self.max_position_pct = 0.10  # Max 10% of capital in one asset
@@ -26,42 +73,40 @@ class RiskAgent(BaseAgent):
         """
         Analyze portfolio risk based on context.
         """
+        # Load account state if the pipeline hasn't populated it yet
+        if context.available_capital <= 0:
+            pos_data = _get_positions_cached()
+            context.available_capital = pos_data.get("balance_usd", 0)
+            asset = context.base_asset
+            context.current_position = pos_data.get("positions", {}).get(asset, 0)
+        
         # Check if we have enough data
         if context.available_capital <= 0:
-            return AgentDecision(
-                agent_name=self.name,
-                action=AgentAction.HOLD,
-                confidence=0.9,
-                rationale="No capital available for trading",
-                metadata={"risk_level": "BLOCKED"}
-            )
+            return self._HOLD_NO_CAPITAL
         
-        # Calculate position concentration
-        position_value = context.current_position * (context.price or 0)
-        concentration = position_value / context.available_capital if context.available_capital > 0 else 0
+        # Numeric scoring (JIT-compiled when numba is available)
+        sentiment = context.sentiment_score
+        risk_score, concentration, flags = _risk_kernel(
+            float(context.current_position),
+            float(context.price or 0.0),
+            float(context.available_capital),
+            float(sentiment) if sentiment is not None else float("nan"),
+            self.max_position_pct
+        )
         
-        # Assess risk level
+        # Only build messages for the factors that actually tripped
         risk_factors = []
-        risk_score = 0.0
-        
-        # Check concentration risk
-        if concentration > self.max_position_pct:
+        if flags & RISK_CONCENTRATION:
             risk_factors.append(f"Position concentration {concentration:.1%} exceeds {self.max_position_pct:.1%}")
-            risk_score += 0.3
-            
-        # Check sentiment risk (extreme fear or greed)
-        if context.sentiment_score is not None:
-            if context.sentiment_score < 20:
-                risk_factors.append(f"Extreme Fear ({context.sentiment_score})")
-                risk_score += 0.2
-            elif context.sentiment_score > 80:
-                risk_factors.append(f"Extreme Greed ({context.sentiment_score})")
-                risk_score += 0.2
+        if flags & RISK_EXTREME_FEAR:
+            risk_factors.append(f"Extreme Fear ({sentiment})")
+        elif flags & RISK_EXTREME_GREED:
+            risk_factors.append(f"Extreme Greed ({sentiment})")
                 
         # Use core risk engine for pre-trade checks
         if context.price and context.current_position > 0:
             allowed, reason = risk_engine.check_order(
-                context.symbol.split('/')[0],  # Extract base asset
+                context.base_asset,
                 "SELL",
                 context.current_position,
                 context.price
@@ -101,10 +146,21 @@ class RiskAgent(BaseAgent):
         """
         Update context with risk assessment.
         """
-        context.risk_assessment = decision.metadata
+        # Own copy: the decision may be a shared flyweight, and the pipeline
+        # hands risk_assessment back to callers
+        context.risk_assessment = dict(decision.metadata)
         context.add_message(
             self.name,
             f"{decision.action.value}: {decision.rationale}",
-            "WARNING" if decision.action == AgentAction.ALERT else "INFO"
+            "WARNING" if decision.action is AgentAction.ALERT else "INFO"
         )
         return context
+
+
+# Shared instance reused by every ManagerAgent
+_singleton = RiskAgent()
+
+
+def get_agent() -> RiskAgent:
+    """Get the shared RiskAgent instance."""
+    return _singleton
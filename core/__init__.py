@@ -3,14 +3,35 @@ Market Intelligence MCP Server - Core Package
 
 This package contains the core analytics and data processing modules
 adapted from Genesis2025 HFT platform for use with MCP.
+
+Exports are imported lazily (PEP 562) so that importing e.g. core.database
+doesn't pull in numpy/numba via core.analytics.
 """
 
-from .analytics import MicrostructureAnalyzer
-from .anomaly_detection import AnomalyDetector
-from .data_validator import DataValidator
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    "MicrostructureAnalyzer": ".analytics",
+    "AnomalyDetector": ".anomaly_detection",
+    "DataValidator": ".data_validator",
+}
 
-__all__ = [
+__all__ = (
     "MicrostructureAnalyzer",
-    "AnomalyDetector", 
+    "AnomalyDetector",
     "DataValidator",
-]
+)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(__all__))
@@ -14,12 +14,17 @@ Features:
 - Market regime classification
 """
 
+from bisect import bisect_right
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
-from collections import deque
 import math
 
+import numpy as np
+
+from .jit import njit, prange, NUMBA_AVAILABLE
+
 
 @dataclass
 class OrderBookLevel:
@@ -28,58 +33,105 @@ class OrderBookLevel:
     volume: float
 
 
-@dataclass
+def _split_levels(levels) -> Tuple[np.ndarray, np.ndarray]:
+    """Split [[price, volume], ...] into contiguous float64 price and volume arrays."""
+    arr = np.asarray(levels, dtype=np.float64)
+    if arr.ndim != 2:
+        arr = arr.reshape(-1, 2)
+    cols = arr[:, :2].T.copy()  # one copy; each row is then C-contiguous
+    return cols[0], cols[1]
+
+
 class OrderBook:
-    """Represents an L2 order book snapshot."""
-    bids: List[OrderBookLevel]
-    asks: List[OrderBookLevel]
-    timestamp: Optional[datetime] = None
+    """
+    Represents an L2 order book snapshot.
+    
+    Stored struct-of-arrays: one float64 array each for bid/ask prices and
+    volumes, best level first. `bids`/`asks` build OrderBookLevel lists on
+    demand for callers that still want per-level objects.
+    """
+    __slots__ = ("bid_prices", "bid_vols", "ask_prices", "ask_vols", "timestamp")
+    
+    def __init__(
+        self,
+        bid_prices: np.ndarray,
+        bid_vols: np.ndarray,
+        ask_prices: np.ndarray,
+        ask_vols: np.ndarray,
+        timestamp: Optional[datetime] = None
+    ):
+        # The compiled kernels take contiguous float64 buffers as-is (the AOT
+        # ones without any type check), so strided views and integer arrays
+        # are normalized here; already-conforming arrays are not copied.
+        self.bid_prices = np.ascontiguousarray(bid_prices, dtype=np.float64)
+        self.bid_vols = np.ascontiguousarray(bid_vols, dtype=np.float64)
+        self.ask_prices = np.ascontiguousarray(ask_prices, dtype=np.float64)
+        self.ask_vols = np.ascontiguousarray(ask_vols, dtype=np.float64)
+        self.timestamp = timestamp
+    
+    @property
+    def bids(self) -> List[OrderBookLevel]:
+        """Bid levels as OrderBookLevel objects (allocates; avoid on hot paths)."""
+        return [OrderBookLevel(p, v) for p, v in zip(self.bid_prices.tolist(), self.bid_vols.tolist())]
+    
+    @property
+    def asks(self) -> List[OrderBookLevel]:
+        """Ask levels as OrderBookLevel objects (allocates; avoid on hot paths)."""
+        return [OrderBookLevel(p, v) for p, v in zip(self.ask_prices.tolist(), self.ask_vols.tolist())]
     
     @property
     def best_bid(self) -> Optional[OrderBookLevel]:
         """Get best bid (highest bid price)."""
-        return self.bids[0] if self.bids else None
+        if not self.bid_prices.size:
+            return None
+        return OrderBookLevel(float(self.bid_prices[0]), float(self.bid_vols[0]))
     
     @property
     def best_ask(self) -> Optional[OrderBookLevel]:
         """Get best ask (lowest ask price)."""
-        return self.asks[0] if self.asks else None
+        if not self.ask_prices.size:
+            return None
+        return OrderBookLevel(float(self.ask_prices[0]), float(self.ask_vols[0]))
     
     @property
     def mid_price(self) -> Optional[float]:
         """Calculate mid-price."""
-        if self.best_bid and self.best_ask:
-            return (self.best_bid.price + self.best_ask.price) / 2
+        if self.bid_prices.size and self.ask_prices.size:
+            return (float(self.bid_prices[0]) + float(self.ask_prices[0])) / 2
         return None
     
     @property
     def spread(self) -> Optional[float]:
         """Calculate bid-ask spread."""
-        if self.best_bid and self.best_ask:
-            return self.best_ask.price - self.best_bid.price
+        if self.bid_prices.size and self.ask_prices.size:
+            return float(self.ask_prices[0]) - float(self.bid_prices[0])
         return None
     
     @property
     def spread_bps(self) -> Optional[float]:
         """Calculate spread in basis points."""
-        if self.spread and self.mid_price:
-            return (self.spread / self.mid_price) * 10000
+        spread = self.spread
+        mid_price = self.mid_price
+        if spread and mid_price:
+            return (spread / mid_price) * 10000
         return None
     
     @classmethod
     def from_raw(cls, bids: List[List[float]], asks: List[List[float]], 
                  timestamp: Optional[datetime] = None) -> "OrderBook":
-        """Create OrderBook from raw [price, volume] lists."""
-        return cls(
-            bids=[OrderBookLevel(price=b[0], volume=b[1]) for b in bids],
-            asks=[OrderBookLevel(price=a[0], volume=a[1]) for a in asks],
-            timestamp=timestamp
-        )
+        """Create OrderBook from raw [price, volume] lists (or (N, 2) arrays)."""
+        bid_prices, bid_vols = _split_levels(bids)
+        ask_prices, ask_vols = _split_levels(asks)
+        return cls(bid_prices, bid_vols, ask_prices, ask_vols, timestamp)
+    
+    def __repr__(self):
+        return (f"OrderBook(bids={self.bid_prices.size} levels, asks={self.ask_prices.size} levels, "
+                f"timestamp={self.timestamp!r})")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MicrostructureMetrics:
-    """Container for calculated microstructure metrics."""
+    """Container for calculated microstructure metrics (immutable)."""
     mid_price: float
     spread: float
     spread_bps: float
@@ -93,6 +145,277 @@ class MicrostructureMetrics:
     depth_imbalance: float
     volatility: Optional[float] = None
     vpin: Optional[float] = None
+    
+    def formatted(self) -> Dict[str, Optional[float]]:
+        """Metrics rounded for display / JSON responses (analyze() returns raw floats)."""
+        return {
+            "mid_price": round(self.mid_price, 6),
+            "spread": round(self.spread, 6),
+            "spread_bps": round(self.spread_bps, 2),
+            "ofi": round(self.ofi, 4),
+            "obi": round(self.obi, 4),
+            "microprice": round(self.microprice, 6),
+            "microprice_divergence": round(self.microprice_divergence, 6),
+            "directional_probability": round(self.directional_probability, 1),
+            "total_bid_depth": round(self.total_bid_depth, 2),
+            "total_ask_depth": round(self.total_ask_depth, 2),
+            "depth_imbalance": round(self.depth_imbalance, 4),
+            "volatility": round(self.volatility, 6) if self.volatility else None
+        }
+
+
+# Columnar equivalent of MicrostructureMetrics, returned by analyze_many()
+# (NaN where the scalar version would be None)
+METRICS_DTYPE = np.dtype([
+    ("mid_price", "f8"),
+    ("spread", "f8"),
+    ("spread_bps", "f8"),
+    ("ofi", "f8"),
+    ("obi", "f8"),
+    ("microprice", "f8"),
+    ("microprice_divergence", "f8"),
+    ("directional_probability", "f8"),
+    ("total_bid_depth", "f8"),
+    ("total_ask_depth", "f8"),
+    ("depth_imbalance", "f8"),
+    ("volatility", "f8"),
+    ("vpin", "f8"),
+])
+
+
+def _ring_push(buf: np.ndarray, head: int, count: int, value: float) -> Tuple[int, int]:
+    """Write value into a ring buffer at head; return the new (head, count)."""
+    buf[head] = value
+    cap = buf.size
+    return (head + 1) % cap, min(count + 1, cap)
+
+
+# --- Numeric kernels (native code when numba is installed) ---
+
+@njit(cache=True, fastmath=True)
+def _ofi_kernel(bp, bv, ap, av, pbp, pap, pbq, paq):
+    """
+    Raw (unnormalized) OFI from the current and previous top of book.
+    
+    Branchless: each side's three cases (price up / down / unchanged) are
+    selected with 0/1 masks so the batch scan can vectorize.
+    """
+    # Bid side: up -> +bv, down -> -pbq, unchanged -> bv - pbq
+    b_up = np.float64(bp > pbp)
+    b_dn = np.float64(bp < pbp)
+    b_eq = 1.0 - b_up - b_dn
+    ofi_b = b_up * bv - b_dn * pbq + b_eq * (bv - pbq)
+    
+    # Ask side (inverted): up -> +paq, down -> -av, unchanged -> -(av - paq)
+    a_up = np.float64(ap > pap)
+    a_dn = np.float64(ap < pap)
+    a_eq = 1.0 - a_up - a_dn
+    ofi_a = a_up * paq - a_dn * av - a_eq * (av - paq)
+    
+    return ofi_b + ofi_a
+
+
+@njit(cache=True, fastmath=True)
+def _book_reduce(bid_vols, ask_vols, weights, obi_n, depth_n):
+    """
+    One sweep per side for total depth and weighted OBI.
+    
+    Sums the first depth_n volumes of each side and weights the first obi_n
+    levels (obi_n must not exceed either side's length). Returns
+    (total_bid, total_ask, obi) with obi in [-1, 1].
+    """
+    total_bid = 0.0
+    weighted_bid = 0.0
+    for i in range(max(min(depth_n, bid_vols.size), obi_n)):
+        v = bid_vols[i]
+        if i < depth_n:
+            total_bid += v
+        if i < obi_n:
+            weighted_bid += v * weights[i]
+    
+    total_ask = 0.0
+    weighted_ask = 0.0
+    for i in range(max(min(depth_n, ask_vols.size), obi_n)):
+        v = ask_vols[i]
+        if i < depth_n:
+            total_ask += v
+        if i < obi_n:
+            weighted_ask += v * weights[i]
+    
+    total_weight = weighted_bid + weighted_ask
+    if total_weight < 1e-9:
+        return total_bid, total_ask, 0.0
+    return total_bid, total_ask, (weighted_bid - weighted_ask) / total_weight
+
+
+@njit(cache=True, fastmath=True)
+def _microprice_kernel(bp, bv, ap, av):
+    """Microprice: each price weighted by the opposite side's volume."""
+    total_volume = bv + av
+    if total_volume < 1e-9:
+        return (bp + ap) / 2
+    return (bv * ap + av * bp) / total_volume
+
+
+# Past |x| = 4.97 the rational tanh below is within 1e-6 of +/-1
+_TANH_CLIP = 4.97
+
+
+@njit(cache=True, fastmath=True)
+def _tanh_rational(x):
+    """Pade [7/6] approximation of tanh, accurate for |x| <= _TANH_CLIP."""
+    x2 = x * x
+    num = x * (135135.0 + x2 * (17325.0 + x2 * (378.0 + x2)))
+    den = 135135.0 + x2 * (62370.0 + x2 * (3150.0 + 28.0 * x2))
+    return num / den
+
+
+@njit(cache=True, fastmath=True)
+def _directional_probability(score):
+    """
+    100 / (1 + exp(-2 * score)) as a percentage, without calling exp.
+    
+    Uses the identity 100 / (1 + exp(-2s)) = 50 * (1 + tanh(s)) with a
+    clipped rational tanh; absolute error stays below 0.005 points.
+    """
+    x = min(_TANH_CLIP, max(-_TANH_CLIP, score))
+    return 50.0 * (1.0 + _tanh_rational(x))
+
+
+@njit(cache=True)
+def _vol_kernel(prices):
+    """Std-dev of log returns over prices (skips non-positive pairs); NaN if none."""
+    # Welford's online update fused with the log-diff: one pass, no temporaries
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    prev = prices[0] if prices.size else 0.0
+    for i in range(1, prices.size):
+        p = prices[i]
+        if prev > 0 and p > 0:
+            r = math.log(p / prev)
+            count += 1
+            delta = r - mean
+            mean += delta / count
+            m2 += delta * (r - mean)
+        prev = p
+    
+    if count == 0:
+        return np.nan
+    return math.sqrt(m2 / count)
+
+
+@njit(cache=True)
+def _vpin_scan(vols, buys, bucket_size, bucket_vol, bucket_buys, bucket_sells,
+               imb_buf, imb_head, imb_count, imb_sum):
+    """
+    Run the VPIN bucket state machine over a batch of trades.
+    
+    imb_buf is updated in place and imb_sum tracks its live total, so each
+    VPIN is an O(1) mean. Returns the per-trade VPIN (NaN until 10 buckets
+    are complete) and the new (bucket_vol, bucket_buys, bucket_sells,
+    imb_head, imb_count, imb_sum) state.
+    """
+    n = vols.size
+    cap = imb_buf.size
+    out = np.full(n, np.nan)
+    
+    for i in range(n):
+        v = vols[i]
+        if buys[i]:
+            bucket_buys += v
+        else:
+            bucket_sells += v
+        bucket_vol += v
+        
+        if bucket_vol >= bucket_size:
+            total = bucket_buys + bucket_sells
+            if total > 0:
+                imbalance = abs(bucket_buys - bucket_sells) / total
+                if imb_count == cap:
+                    imb_sum -= imb_buf[imb_head]  # evict the oldest bucket
+                else:
+                    imb_count += 1
+                imb_buf[imb_head] = imbalance
+                imb_sum += imbalance
+                imb_head = (imb_head + 1) % cap
+            bucket_vol = 0.0
+            bucket_buys = 0.0
+            bucket_sells = 0.0
+        
+        if imb_count >= 10:
+            out[i] = imb_sum / imb_count
+    
+    return out, bucket_vol, bucket_buys, bucket_sells, imb_head, imb_count, imb_sum
+
+
+@njit(cache=True, fastmath=True)
+def _batch_ofi_kernel(bp, bv, ap, av, ofi_window):
+    """Normalized OFI for each row of a (T,) top-of-book series (row 0 is 0)."""
+    T = bp.size
+    out = np.zeros(T, dtype=np.float64)
+    abs_hist = np.zeros(T, dtype=np.float64)
+    # Monotonic queue of row indices with decreasing |OFI|; front is the window max
+    dq = np.empty(T, dtype=np.int64)
+    dq_lo = 0
+    dq_hi = 1
+    dq[0] = 0
+    
+    for t in range(1, T):
+        ofi = _ofi_kernel(bp[t], bv[t], ap[t], av[t], bp[t - 1], ap[t - 1], bv[t - 1], av[t - 1])
+        if ofi_window == 0:
+            out[t] = ofi  # no normalization window: raw OFI
+            continue
+        v = abs(ofi)
+        abs_hist[t] = v
+        
+        if dq[dq_lo] <= t - ofi_window:
+            dq_lo += 1
+        while dq_hi > dq_lo and abs_hist[dq[dq_hi - 1]] <= v:
+            dq_hi -= 1
+        dq[dq_hi] = t
+        dq_hi += 1
+        
+        max_ofi = abs_hist[dq[dq_lo]]
+        if max_ofi > 0:
+            ofi = min(1.0, max(-1.0, ofi / max_ofi))
+        out[t] = ofi
+    
+    return out
+
+
+@njit(cache=True, parallel=True)
+def _batch_vol_kernel(mids, window):
+    """Rolling volatility over the last `window` mids at each row (NaN until full)."""
+    T = mids.size
+    out = np.full(T, np.nan)
+    for t in prange(window - 1, T):
+        out[t] = _vol_kernel(mids[t - window + 1:t + 1])
+    return out
+
+
+# Ahead-of-time compiled kernels (python -m core.aot_build), if built. They
+# only replace the per-snapshot call sites below; the batch kernels keep
+# calling the JIT versions, which numba can inline.
+try:
+    from . import analytics_fast as _fast
+except ImportError:
+    _fast = None
+
+if _fast is not None:
+    _ofi_impl = _fast.ofi_kernel
+    _book_reduce_impl = _fast.book_reduce
+    _microprice_impl = _fast.microprice_kernel
+    _directional_probability_impl = _fast.directional_probability
+    _vol_impl = _fast.vol_kernel
+    _vpin_scan_impl = _fast.vpin_scan
+else:
+    _ofi_impl = _ofi_kernel
+    _book_reduce_impl = _book_reduce
+    _microprice_impl = _microprice_kernel
+    _directional_probability_impl = _directional_probability
+    _vol_impl = _vol_kernel if NUMBA_AVAILABLE else None
+    _vpin_scan_impl = _vpin_scan
 
 
 class MicrostructureAnalyzer:
@@ -113,7 +436,8 @@ class MicrostructureAnalyzer:
         ofi_window: int = 50,
         price_history_size: int = 100,
         vpin_bucket_size: float = 1000.0,
-        decay_factor: float = 0.5
+        decay_factor: float = 0.5,
+        depth_levels: Optional[int] = None
     ):
         """
         Initialize the analyzer.
@@ -123,10 +447,14 @@ class MicrostructureAnalyzer:
             price_history_size: Size of price history for volatility calculation
             vpin_bucket_size: Volume threshold for VPIN bucket completion
             decay_factor: Decay factor for OBI level weighting
+            depth_levels: Levels summed into total bid/ask depth (None = full book)
         """
         self.ofi_window = ofi_window
+        self.depth_levels = depth_levels
         self.price_history_size = price_history_size
         self.vpin_bucket_size = vpin_bucket_size
+        # OBI level weights exp(-decay * i); rebuilt by the decay_factor setter
+        self._max_obi_levels = 16
         self.decay_factor = decay_factor
         
         # State for OFI calculation
@@ -134,16 +462,41 @@ class MicrostructureAnalyzer:
         self._prev_best_ask: Optional[float] = None
         self._prev_bid_qty: float = 0
         self._prev_ask_qty: float = 0
-        self._ofi_history: deque = deque(maxlen=ofi_window)
+        # Ring buffers: preallocated float64 storage + write head + fill count
+        self._ofi_buf = np.empty(ofi_window, dtype=np.float64)
+        self._ofi_seq = 0  # total |OFI| values pushed; slot is seq % ofi_window
+        # Sequence numbers of |OFI| values in decreasing order; front is the window max
+        self._ofi_max_dq: deque = deque()
         
         # State for volatility
-        self._price_history: deque = deque(maxlen=price_history_size)
+        self._price_buf = np.empty(price_history_size, dtype=np.float64)
+        self._price_head = 0
+        self._price_count = 0
         
         # State for VPIN
         self._current_bucket_volume: float = 0
         self._current_bucket_buys: float = 0
         self._current_bucket_sells: float = 0
-        self._bucket_imbalances: deque = deque(maxlen=50)
+        self._imb_buf = np.empty(50, dtype=np.float64)
+        self._imb_head = 0
+        self._imb_count = 0
+        self._imb_sum = 0.0  # running total of the live _imb_buf entries
+    
+    @property
+    def decay_factor(self) -> float:
+        """Decay factor for OBI level weighting."""
+        return self._decay_factor
+    
+    @decay_factor.setter
+    def decay_factor(self, value: float) -> None:
+        self._decay_factor = value
+        self._obi_weights = np.exp(-value * np.arange(self._max_obi_levels, dtype=np.float64))
+    
+    def _obi_weight_vector(self, levels: int) -> np.ndarray:
+        """First `levels` OBI weights (from the table when it is long enough)."""
+        if levels <= self._max_obi_levels:
+            return self._obi_weights[:levels]
+        return np.exp(-self._decay_factor * np.arange(levels, dtype=np.float64))
     
     def analyze(self, book: OrderBook) -> MicrostructureMetrics:
         """
@@ -155,55 +508,144 @@ class MicrostructureAnalyzer:
         Returns:
             MicrostructureMetrics containing all calculated metrics
         """
-        if not book.bids or not book.asks:
+        if not book.bid_prices.size or not book.ask_prices.size:
             raise ValueError("Order book must have at least one level on each side")
         
-        best_bid = book.best_bid
-        best_ask = book.best_ask
-        mid_price = book.mid_price
-        spread = book.spread
+        # Read top of book once and derive mid/spread locally
+        bp = float(book.bid_prices[0])
+        bv = float(book.bid_vols[0])
+        ap = float(book.ask_prices[0])
+        av = float(book.ask_vols[0])
+        mid_price = (bp + ap) / 2
+        spread = ap - bp
+        spread_bps = (spread / mid_price) * 10000 if spread and mid_price else None
         
         # Calculate OFI
-        ofi = self._calculate_ofi(best_bid, best_ask)
-        
-        # Calculate OBI (weighted by level distance)
-        obi = self._calculate_obi(book)
+        ofi = self._calculate_ofi(bp, bv, ap, av)
+        
+        # Total depth and OBI (weighted by level distance) in one fused pass
+        bid_vols = book.bid_vols
+        ask_vols = book.ask_vols
+        obi_n = min(5, bid_vols.size, ask_vols.size)
+        depth_n = self.depth_levels
+        if depth_n is None:
+            depth_n = max(bid_vols.size, ask_vols.size)
+        total_bid_depth, total_ask_depth, obi = _book_reduce_impl(
+            bid_vols, ask_vols, self._obi_weight_vector(obi_n), obi_n, depth_n
+        )
         
         # Calculate Microprice
-        microprice = self._calculate_microprice(best_bid, best_ask)
+        microprice = self._calculate_microprice(bp, bv, ap, av)
         
         # Calculate divergence and directional probability
         divergence = microprice - mid_price
         # Use tick size approximation for normalization
         tick_size = spread / 10 if spread > 0 else 0.01
-        divergence_score = divergence / tick_size if tick_size > 0 else 0
-        directional_prob = 100 / (1 + math.exp(-2 * divergence_score))
+        divergence_score = divergence / tick_size if tick_size > 0 else 0.0
+        directional_prob = _directional_probability_impl(divergence_score)
         
-        # Calculate total depths
-        total_bid_depth = sum(level.volume for level in book.bids)
-        total_ask_depth = sum(level.volume for level in book.asks)
         depth_imbalance = (total_bid_depth - total_ask_depth) / (total_bid_depth + total_ask_depth) if (total_bid_depth + total_ask_depth) > 0 else 0
         
         # Update price history and calculate volatility
-        self._price_history.append(mid_price)
+        self._price_head, self._price_count = _ring_push(
+            self._price_buf, self._price_head, self._price_count, mid_price
+        )
         volatility = self._calculate_volatility()
         
+        # Raw floats; use MicrostructureMetrics.formatted() for display rounding
         return MicrostructureMetrics(
-            mid_price=round(mid_price, 6),
-            spread=round(spread, 6),
-            spread_bps=round(book.spread_bps, 2),
-            ofi=round(ofi, 4),
-            obi=round(obi, 4),
-            microprice=round(microprice, 6),
-            microprice_divergence=round(divergence, 6),
-            directional_probability=round(directional_prob, 1),
-            total_bid_depth=round(total_bid_depth, 2),
-            total_ask_depth=round(total_ask_depth, 2),
-            depth_imbalance=round(depth_imbalance, 4),
-            volatility=round(volatility, 6) if volatility else None
+            mid_price=mid_price,
+            spread=spread,
+            spread_bps=spread_bps,
+            ofi=ofi,
+            obi=obi,
+            microprice=microprice,
+            microprice_divergence=divergence,
+            directional_probability=directional_prob,
+            total_bid_depth=total_bid_depth,
+            total_ask_depth=total_ask_depth,
+            depth_imbalance=depth_imbalance,
+            volatility=volatility if volatility else None
+        )
+    
+    def analyze_many(
+        self,
+        bid_prices: np.ndarray,
+        bid_vols: np.ndarray,
+        ask_prices: np.ndarray,
+        ask_vols: np.ndarray,
+        obi_levels: int = 5,
+        vol_window: int = 20
+    ) -> np.ndarray:
+        """
+        Analyze a stack of T order book snapshots in one call.
+        
+        Inputs are (T, L) arrays, best level first, one row per snapshot.
+        The batch is treated as its own series: row 0 has OFI 0 and the
+        analyzer's streaming state (used by analyze()) is neither read nor
+        updated.
+        
+        Returns:
+            (T,) structured array with METRICS_DTYPE fields.
+        """
+        bp = np.asarray(bid_prices, dtype=np.float64)
+        bv = np.asarray(bid_vols, dtype=np.float64)
+        ap = np.asarray(ask_prices, dtype=np.float64)
+        av = np.asarray(ask_vols, dtype=np.float64)
+        if bp.ndim != 2 or bp.shape[1] == 0 or ap.shape[1] == 0:
+            raise ValueError("Expected (T, L) arrays with at least one level on each side")
+        
+        out = np.empty(bp.shape[0], dtype=METRICS_DTYPE)
+        
+        # Top of book (contiguous copies for the kernels)
+        b0 = np.ascontiguousarray(bp[:, 0])
+        a0 = np.ascontiguousarray(ap[:, 0])
+        bq0 = np.ascontiguousarray(bv[:, 0])
+        aq0 = np.ascontiguousarray(av[:, 0])
+        
+        # Row-independent metrics, vectorized over T
+        mid = (b0 + a0) / 2
+        spread = a0 - b0
+        microprice = np.where(
+            bq0 + aq0 < 1e-9,
+            mid,
+            (bq0 * a0 + aq0 * b0) / np.maximum(bq0 + aq0, 1e-9)
+        )
+        divergence = microprice - mid
+        tick = np.where(spread > 0, spread / 10, 0.01)
+        
+        n = min(obi_levels, bv.shape[1], av.shape[1])
+        w = self._obi_weight_vector(n)
+        wb = bv[:, :n] @ w
+        wa = av[:, :n] @ w
+        wt = wb + wa
+        
+        k = self.depth_levels
+        tbd = bv[:, :k].sum(axis=1)
+        tad = av[:, :k].sum(axis=1)
+        td = tbd + tad
+        
+        out["mid_price"] = mid
+        out["spread"] = spread
+        out["spread_bps"] = spread / mid * 10000
+        out["obi"] = np.where(wt < 1e-9, 0.0, (wb - wa) / np.where(wt < 1e-9, 1.0, wt))
+        out["microprice"] = microprice
+        out["microprice_divergence"] = divergence
+        out["directional_probability"] = 50.0 * (
+            1.0 + _tanh_rational(np.clip(divergence / tick, -_TANH_CLIP, _TANH_CLIP))
         )
+        out["total_bid_depth"] = tbd
+        out["total_ask_depth"] = tad
+        out["depth_imbalance"] = np.where(td > 0, (tbd - tad) / np.where(td > 0, td, 1.0), 0.0)
+        
+        # Sequential / windowed metrics
+        out["ofi"] = _batch_ofi_kernel(b0, bq0, a0, aq0, self.ofi_window)
+        out["volatility"] = _batch_vol_kernel(mid, vol_window)
+        out["vpin"] = np.nan
+        
+        return out
     
-    def _calculate_ofi(self, best_bid: OrderBookLevel, best_ask: OrderBookLevel) -> float:
+    def _calculate_ofi(self, bp: float, bv: float, ap: float, av: float) -> float:
         """
         Calculate Order Flow Imbalance.
         
@@ -213,36 +655,39 @@ class MicrostructureAnalyzer:
         ofi = 0.0
         
         if self._prev_best_bid is not None:
-            # Bid side contribution
-            if best_bid.price > self._prev_best_bid:
-                ofi += best_bid.volume
-            elif best_bid.price < self._prev_best_bid:
-                ofi -= self._prev_bid_qty
-            else:
-                ofi += (best_bid.volume - self._prev_bid_qty)
-            
-            # Ask side contribution (inverted)
-            if best_ask.price > self._prev_best_ask:
-                ofi += self._prev_ask_qty
-            elif best_ask.price < self._prev_best_ask:
-                ofi -= best_ask.volume
-            else:
-                ofi -= (best_ask.volume - self._prev_ask_qty)
+            ofi = _ofi_impl(
+                bp, bv, ap, av,
+                self._prev_best_bid, self._prev_best_ask, self._prev_bid_qty, self._prev_ask_qty
+            )
         
         # Update state
-        self._prev_best_bid = best_bid.price
-        self._prev_best_ask = best_ask.price
-        self._prev_bid_qty = best_bid.volume
-        self._prev_ask_qty = best_ask.volume
-        
-        # Track for normalization
-        self._ofi_history.append(abs(ofi))
+        self._prev_best_bid = bp
+        self._prev_best_ask = ap
+        self._prev_bid_qty = bv
+        self._prev_ask_qty = av
+        
+        if self._ofi_buf.size == 0:
+            return ofi  # ofi_window=0: nothing to normalize against
+        
+        # Track for normalization: evict the expired front, then drop
+        # candidates the new value dominates (amortized O(1) window max)
+        buf = self._ofi_buf
+        window = buf.size
+        dq = self._ofi_max_dq
+        seq = self._ofi_seq
+        value = abs(ofi)
+        if dq and dq[0] <= seq - window:
+            dq.popleft()
+        buf[seq % window] = value
+        while dq and buf[dq[-1] % window] <= value:
+            dq.pop()
+        dq.append(seq)
+        self._ofi_seq = seq + 1
         
         # Normalize OFI to [-1, 1]
-        if self._ofi_history:
-            max_ofi = max(self._ofi_history) if self._ofi_history else 1
-            if max_ofi > 0:
-                ofi = max(-1, min(1, ofi / max_ofi))
+        max_ofi = buf[dq[0] % window]
+        if max_ofi > 0:
+            ofi = max(-1, min(1, ofi / max_ofi))
         
         return ofi
     
@@ -253,38 +698,19 @@ class MicrostructureAnalyzer:
         Levels closer to the top of book are weighted more heavily.
         Returns value in range [-1, 1], where positive indicates bid-heavy book.
         """
-        weighted_bid = 0.0
-        weighted_ask = 0.0
-        total_weight = 0.0
-        
-        num_levels = min(levels, len(book.bids), len(book.asks))
-        
-        for i in range(num_levels):
-            weight = math.exp(-self.decay_factor * i)
-            weighted_bid += book.bids[i].volume * weight
-            weighted_ask += book.asks[i].volume * weight
-            total_weight += (book.bids[i].volume + book.asks[i].volume) * weight
-        
-        if total_weight < 1e-9:
-            return 0.0
-        
-        return (weighted_bid - weighted_ask) / total_weight
+        n = min(levels, book.bid_vols.size, book.ask_vols.size)
+        return _book_reduce_impl(book.bid_vols, book.ask_vols, self._obi_weight_vector(n), n, 0)[2]
     
-    def _calculate_microprice(self, best_bid: OrderBookLevel, best_ask: OrderBookLevel) -> float:
+    def _calculate_microprice(self, bp: float, bv: float, ap: float, av: float) -> float:
         """
         Calculate volume-weighted microprice.
         
         Microprice is the volume-weighted average of bid and ask prices,
         providing a more accurate estimate of fair value than mid-price.
         """
-        total_volume = best_bid.volume + best_ask.volume
-        
-        if total_volume < 1e-9:
-            return (best_bid.price + best_ask.price) / 2
-        
         # Weight each price by the OTHER side's volume
         # (if more volume on bid, price is closer to ask)
-        return (best_bid.volume * best_ask.price + best_ask.volume * best_bid.price) / total_volume
+        return _microprice_impl(bp, bv, ap, av)
     
     def _calculate_volatility(self, window: int = 20) -> Optional[float]:
         """
@@ -292,26 +718,35 @@ class MicrostructureAnalyzer:
         
         Returns annualized volatility estimate or None if insufficient data.
         """
-        if len(self._price_history) < window:
+        if self._price_count < window:
             return None
         
-        prices = list(self._price_history)[-window:]
+        prices = self._price_ring_view(window)
         
-        # Calculate log returns
-        log_returns = []
-        for i in range(1, len(prices)):
-            if prices[i-1] > 0 and prices[i] > 0:
-                log_returns.append(math.log(prices[i] / prices[i-1]))
+        if _vol_impl is not None:
+            std_dev = _vol_impl(prices)
+            return None if math.isnan(std_dev) else std_dev
         
-        if not log_returns:
+        # Without numba, one fused NumPy expression beats a Python loop
+        prev, curr = prices[:-1], prices[1:]
+        if (prices <= 0).any():
+            valid = (prev > 0) & (curr > 0)
+            prev, curr = prev[valid], curr[valid]
+        if not prev.size:
             return None
         
-        # Standard deviation of log returns
-        mean_return = sum(log_returns) / len(log_returns)
-        variance = sum((r - mean_return) ** 2 for r in log_returns) / len(log_returns)
-        std_dev = math.sqrt(variance)
+        return float(np.log(curr / prev).std())
+    
+    def _price_ring_view(self, window: int) -> np.ndarray:
+        """
+        Last `window` prices in chronological order.
         
-        return std_dev
+        Zero-copy slice unless the window wraps past the end of the buffer.
+        """
+        start = self._price_head - window
+        if start >= 0:
+            return self._price_buf[start:self._price_head]
+        return np.concatenate((self._price_buf[start:], self._price_buf[:self._price_head]))
     
     def update_vpin(self, trade_volume: float, is_buy: bool) -> Optional[float]:
         """
@@ -322,32 +757,46 @@ class MicrostructureAnalyzer:
             is_buy: True if buyer-initiated, False if seller-initiated
             
         Returns:
-            Current VPIN value if bucket completed, None otherwise
+            Current VPIN value once 10 buckets have completed, None before that
         """
-        if is_buy:
-            self._current_bucket_buys += trade_volume
-        else:
-            self._current_bucket_sells += trade_volume
+        vpin = self.update_vpin_batch(
+            np.array([trade_volume], dtype=np.float64),
+            np.array([is_buy], dtype=np.bool_)
+        )[0]
+        return None if math.isnan(vpin) else float(vpin)
+    
+    def update_vpin_batch(self, volumes: np.ndarray, is_buy: np.ndarray) -> np.ndarray:
+        """
+        Feed a batch of trades through the VPIN buckets in one call.
         
-        self._current_bucket_volume += trade_volume
+        Equivalent to calling update_vpin() once per trade, in order.
         
-        # Check if bucket is complete
-        if self._current_bucket_volume >= self.vpin_bucket_size:
-            total = self._current_bucket_buys + self._current_bucket_sells
-            if total > 0:
-                imbalance = abs(self._current_bucket_buys - self._current_bucket_sells) / total
-                self._bucket_imbalances.append(imbalance)
+        Args:
+            volumes: (N,) trade volumes
+            is_buy: (N,) True where the trade was buyer-initiated
             
-            # Reset bucket
-            self._current_bucket_volume = 0
-            self._current_bucket_buys = 0
-            self._current_bucket_sells = 0
-        
-        # Calculate VPIN as average of recent imbalances
-        if len(self._bucket_imbalances) >= 10:
-            return sum(self._bucket_imbalances) / len(self._bucket_imbalances)
-        
-        return None
+        Returns:
+            (N,) VPIN after each trade, NaN where update_vpin() would return None
+        """
+        vols = np.ascontiguousarray(volumes, dtype=np.float64)
+        buys = np.ascontiguousarray(is_buy, dtype=np.bool_)
+        if vols.shape != buys.shape or vols.ndim != 1:
+            raise ValueError("volumes and is_buy must be 1-D arrays of the same length")
+        
+        (out,
+         self._current_bucket_volume,
+         self._current_bucket_buys,
+         self._current_bucket_sells,
+         self._imb_head,
+         self._imb_count,
+         self._imb_sum) = _vpin_scan_impl(
+            vols, buys, float(self.vpin_bucket_size),
+            float(self._current_bucket_volume),
+            float(self._current_bucket_buys),
+            float(self._current_bucket_sells),
+            self._imb_buf, self._imb_head, self._imb_count, self._imb_sum
+        )
+        return out
     
     def reset(self) -> None:
         """Reset all internal state."""
@@ -355,12 +804,21 @@ class MicrostructureAnalyzer:
         self._prev_best_ask = None
         self._prev_bid_qty = 0
         self._prev_ask_qty = 0
-        self._ofi_history.clear()
-        self._price_history.clear()
+        self._ofi_seq = 0
+        self._ofi_max_dq.clear()
+        self._price_head = self._price_count = 0
         self._current_bucket_volume = 0
         self._current_bucket_buys = 0
         self._current_bucket_sells = 0
-        self._bucket_imbalances.clear()
+        self._imb_head = self._imb_count = 0
+        self._imb_sum = 0.0
+
+
+# Liquidity classes indexed by how many spread_bps thresholds are reached
+# (bisect_right for one value, np.searchsorted(..., side="right") for arrays)
+LIQUIDITY_CLASSES = ("High", "Medium", "Low")
+_LIQUIDITY_THRESHOLDS = (5.0, 20.0)
+_LIQUIDITY_THRESHOLDS_BPS = np.array(_LIQUIDITY_THRESHOLDS)
 
 
 def analyze_spread(bid_price: float, ask_price: float) -> Dict:
@@ -387,13 +845,8 @@ def analyze_spread(bid_price: float, ask_price: float) -> Dict:
     mid_price = (ask_price + bid_price) / 2
     spread_bps = (spread / mid_price) * 10000
     
-    # Classify liquidity
-    if spread_bps < 5:
-        liquidity = "High"
-    elif spread_bps < 20:
-        liquidity = "Medium"
-    else:
-        liquidity = "Low"
+    # Classify liquidity (<5 bps High, <20 Medium, else Low) with one C-level lookup
+    liquidity = LIQUIDITY_CLASSES[bisect_right(_LIQUIDITY_THRESHOLDS, spread_bps)]
     
     return {
         "valid": True,
@@ -402,3 +855,38 @@ def analyze_spread(bid_price: float, ask_price: float) -> Dict:
         "spread_basis_points": round(spread_bps, 2),
         "liquidity_classification": liquidity
     }
+
+
+def analyze_spread_batch(bids: np.ndarray, asks: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Vectorized analyze_spread over many (bid, ask) pairs.
+    
+    Args:
+        bids: (N,) best bid prices
+        asks: (N,) best ask prices
+        
+    Returns:
+        Dictionary of (N,) arrays: valid, spread_absolute, mid_price,
+        spread_basis_points (NaN where invalid) and liquidity_class
+        (index into LIQUIDITY_CLASSES, -1 where invalid). Values are unrounded.
+    """
+    bids = np.asarray(bids, dtype=np.float64)
+    asks = np.asarray(asks, dtype=np.float64)
+    if bids.shape != asks.shape:
+        raise ValueError("bids and asks must have the same shape")
+    
+    valid = bids < asks
+    spread = np.where(valid, asks - bids, np.nan)
+    mid_price = np.where(valid, (asks + bids) / 2, np.nan)
+    spread_bps = spread / mid_price * 10000
+    
+    liquidity_class = np.searchsorted(_LIQUIDITY_THRESHOLDS_BPS, spread_bps, side="right")
+    liquidity_class = np.where(valid, liquidity_class, -1)
+    
+    return {
+        "valid": valid,
+        "spread_absolute": spread,
+        "mid_price": mid_price,
+        "spread_basis_points": spread_bps,
+        "liquidity_class": liquidity_class
+    }
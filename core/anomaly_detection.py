@@ -13,16 +13,21 @@ Detection capabilities:
 - Spread shock detection
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 from collections import deque
 import math
 
-from .analytics import OrderBook, OrderBookLevel
+import numpy as np
 
+from .analytics import OrderBook, OrderBookLevel, _ring_push
+from .jit import njit, NUMBA_AVAILABLE
 
+
+# Enum members below are singletons: compare them with `is` (a pointer
+# check) rather than `==`, which goes through Enum.__eq__.
 class AnomalySeverity(Enum):
     """Severity levels for detected anomalies."""
     LOW = "low"
@@ -51,29 +56,80 @@ class MarketRegime(Enum):
     MANIPULATION_SUSPECTED = "Manipulation Suspected"
 
 
-@dataclass
+# Enum -> wire string, resolved once instead of per to_dict() call
+_ANOMALY_TYPE_STR = {t: t.value for t in AnomalyType}
+_SEVERITY_STR = {s: s.value for s in AnomalySeverity}
+_REGIME_STR = {r: r.value for r in MarketRegime}
+
+
+# Anomaly message templates, formatted lazily (see Anomaly)
+_MSG_SPOOFING = "Large {} order at level {}: {:.0f} (avg: {:.0f})"
+_MSG_LAYERING = "Layering detected: {} large orders on {} side"
+_MSG_LIQUIDITY_GAP = "Liquidity gap at {} level {}: {:.0f}"
+_MSG_HEAVY_IMBALANCE = "Heavy {} imbalance: {:.1%}"
+_MSG_SPREAD_SHOCK = "Spread shock: {:.4f} (z-score: {:.1f})"
+
+
 class Anomaly:
-    """Represents a detected market anomaly."""
-    type: AnomalyType
-    severity: AnomalySeverity
-    message: str
-    timestamp: datetime = field(default_factory=datetime.now)
-    risk_score: float = 0.0
-    details: Dict = field(default_factory=dict)
+    """
+    Represents a detected market anomaly.
+    
+    `message` is either the final text, or a str.format template when
+    `message_args` is given. Templates are formatted on first access to
+    `message` (e.g. by to_dict()), so anomalies that are only inspected by
+    type/severity never pay for float formatting.
+    """
+    __slots__ = ("type", "severity", "timestamp", "risk_score", "details", "_message", "_message_args")
+    
+    def __init__(
+        self,
+        type: AnomalyType,
+        severity: AnomalySeverity,
+        message: str,
+        timestamp: Optional[datetime] = None,  # filled with datetime.now() only when omitted
+        risk_score: float = 0.0,
+        details: Optional[Dict] = None,
+        message_args: Optional[Tuple] = None
+    ):
+        self.type = type
+        self.severity = severity
+        self.timestamp = timestamp if timestamp is not None else datetime.now()
+        self.risk_score = risk_score
+        self.details = details if details is not None else {}
+        self._message = message
+        self._message_args = message_args
+    
+    @property
+    def message(self) -> str:
+        if self._message_args is not None:
+            self._message = self._message.format(*self._message_args)
+            self._message_args = None
+        return self._message
+    
+    @message.setter
+    def message(self, value: str) -> None:
+        self._message = value
+        self._message_args = None
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "type": self.type.value,
-            "severity": self.severity.value,
+        d = {
+            "type": _ANOMALY_TYPE_STR[self.type],
+            "severity": _SEVERITY_STR[self.severity],
             "message": self.message,
             "timestamp": self.timestamp.isoformat(),
-            "risk_score": round(self.risk_score, 1),
-            **self.details
+            "risk_score": round(self.risk_score, 1)
         }
+        if self.details:
+            d.update(self.details)
+        return d
+    
+    def __repr__(self):
+        return (f"Anomaly(type={self.type}, severity={self.severity}, message={self.message!r}, "
+                f"timestamp={self.timestamp!r}, risk_score={self.risk_score})")
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketState:
     """Current market state assessment."""
     regime: MarketRegime
@@ -85,7 +141,7 @@ class MarketState:
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
         return {
-            "regime": self.regime.value,
+            "regime": _REGIME_STR[self.regime],
             "anomalies": [a.to_dict() for a in self.anomalies],
             "overall_risk_score": round(self.overall_risk_score, 1),
             "spoofing_risk": round(self.spoofing_risk, 1),
@@ -93,6 +149,216 @@ class MarketState:
         }
 
 
+# --- Numeric kernel (native code when numba is installed) ---
+
+# Anomaly codes emitted by _analyze_kernel (0 = empty slot)
+_CODE_SPOOFING = 1
+_CODE_LAYERING = 2
+_CODE_LIQUIDITY_GAP = 3
+_CODE_HEAVY_IMBALANCE = 4
+_CODE_SPREAD_SHOCK = 5
+_CODE_TYPES = (None, AnomalyType.SPOOFING, AnomalyType.LAYERING, AnomalyType.LIQUIDITY_GAP,
+               AnomalyType.HEAVY_IMBALANCE, AnomalyType.SPREAD_SHOCK)
+_SEVERITIES = (AnomalySeverity.LOW, AnomalySeverity.MEDIUM, AnomalySeverity.HIGH, AnomalySeverity.CRITICAL)
+_REGIMES = (MarketRegime.CALM, MarketRegime.EXECUTION_HOT, MarketRegime.STRESSED,
+            MarketRegime.MANIPULATION_SUSPECTED)
+
+# Anomaly types that on their own mark the regime as manipulation
+_SPOOF_OR_LAYER = frozenset({AnomalyType.SPOOFING, AnomalyType.LAYERING})
+
+# Spoofing + layering + 5 gaps + imbalance + spread shock
+_MAX_ANOMALIES = 9
+_MAX_GAPS = 5
+# Level-distance part of the liquidity gap score: (10 - i) * 15
+_GAP_LEVEL_BASE = (10 - np.arange(10)) * 15.0
+
+
+@njit(cache=True)
+def _analyze_kernel(bp, bv, ap, av, ewma, alpha, one_minus_alpha,
+                    spoof_mul, gap_thr, imb_thr, shock_mul, codes, sevs, scores, meta):
+    """
+    All numeric AnomalyDetector work for one (non-empty) snapshot.
+    
+    Mirrors the _update_statistics / _detect_* / _calculate_* /
+    _classify_regime methods. Anomalies come back as parallel arrays (code,
+    severity index, risk score, 4 detector-specific values) in detection
+    order, written into the caller's preallocated (_MAX_ANOMALIES,) codes,
+    sevs, scores and (_MAX_ANOMALIES, 4) meta buffers; the caller turns the
+    first n slots into Anomaly objects (later slots hold stale data).
+    ewma is the detector's [avg_spread, avg_spread_sq, avg_l1_volume] state,
+    updated in place.
+    
+    Returns:
+        (n, regime index, overall risk, spoofing risk, liquidity score)
+    """
+    n = 0
+    
+    nb5 = min(5, bv.size)
+    na5 = min(5, av.size)
+    spread = ap[0] - bp[0]
+    mid = (ap[0] + bp[0]) / 2
+    spread_bps = spread / mid * 10000 if spread != 0 and mid != 0 else 0.0
+    if spread_bps == 0:
+        spread_bps = 100.0
+    
+    # EWMA statistics
+    avg_spread = one_minus_alpha * ewma[0] + alpha * spread
+    avg_spread_sq = one_minus_alpha * ewma[1] + alpha * (spread * spread)
+    avg_l1 = one_minus_alpha * ewma[2] + alpha * ((bv[0] + av[0]) / 2)
+    ewma[0] = avg_spread
+    ewma[1] = avg_spread_sq
+    ewma[2] = avg_l1
+    
+    # Spoofing: first top-5 level (bids, then asks) above the threshold
+    threshold = avg_l1 * spoof_mul
+    for side in range(2):
+        vols = bv if side == 0 else av
+        prices = bp if side == 0 else ap
+        found = False
+        for i in range(min(5, vols.size)):
+            if vols[i] > threshold:
+                risk = min(100.0, vols[i] / threshold * 50)
+                codes[n] = _CODE_SPOOFING
+                sevs[n] = 2 if risk > 70 else 1
+                scores[n] = risk
+                meta[n, 0] = side
+                meta[n, 1] = i
+                meta[n, 2] = prices[i]
+                meta[n, 3] = vols[i]
+                n += 1
+                found = True
+                break
+        if found:
+            break
+    
+    # Layering: several large orders stacked on one side
+    threshold = avg_l1 * 2
+    bid_large = 0
+    ask_large = 0
+    for i in range(nb5):
+        if bv[i] > threshold:
+            bid_large += 1
+    for i in range(na5):
+        if av[i] > threshold:
+            ask_large += 1
+    layer_side = -1
+    layer_count = 0
+    if bid_large >= 3 and bid_large > ask_large + 2:
+        layer_side = 0
+        layer_count = bid_large
+    elif ask_large >= 3 and ask_large > bid_large + 2:
+        layer_side = 1
+        layer_count = ask_large
+    if layer_side >= 0:
+        score = min(100.0, layer_count * 20.0)
+        codes[n] = _CODE_LAYERING
+        sevs[n] = 3 if score > 70 else 2
+        scores[n] = score
+        meta[n, 0] = layer_side
+        meta[n, 1] = layer_count
+        n += 1
+    
+    # Liquidity gaps: first _MAX_GAPS thin levels in the top 10 (bids, then asks)
+    gaps = 0
+    for side in range(2):
+        vols = bv if side == 0 else av
+        prices = bp if side == 0 else ap
+        for i in range(min(10, vols.size)):
+            if gaps == _MAX_GAPS:
+                break
+            if vols[i] < gap_thr:
+                codes[n] = _CODE_LIQUIDITY_GAP
+                sevs[n] = 1 if i > 3 else 2
+                scores[n] = min(100.0, (10 - i) * 15 + (gap_thr - vols[i]) * 2)
+                meta[n, 0] = side
+                meta[n, 1] = i
+                meta[n, 2] = prices[i]
+                meta[n, 3] = vols[i]
+                n += 1
+                gaps += 1
+    
+    # Heavy imbalance over the top 5 levels
+    total_bid = 0.0
+    total_ask = 0.0
+    max_bid = 0.0
+    max_ask = 0.0
+    for i in range(nb5):
+        total_bid += bv[i]
+        max_bid = max(max_bid, bv[i])
+    for i in range(na5):
+        total_ask += av[i]
+        max_ask = max(max_ask, av[i])
+    total = total_bid + total_ask
+    if total >= 1e-9:
+        imbalance = (total_bid - total_ask) / total
+        if abs(imbalance) > imb_thr:
+            codes[n] = _CODE_HEAVY_IMBALANCE
+            sevs[n] = 2
+            scores[n] = min(100.0, abs(imbalance) * 100)
+            meta[n, 0] = 0 if imbalance > 0 else 1
+            meta[n, 1] = imbalance
+            meta[n, 2] = total_bid
+            meta[n, 3] = total_ask
+            n += 1
+    
+    # Spread shock: z-score of the current spread against the EWMA
+    var_spread = avg_spread_sq - avg_spread * avg_spread
+    if var_spread > 0:
+        z_score = (spread - avg_spread) * (1.0 / math.sqrt(var_spread))
+        if z_score > shock_mul:
+            codes[n] = _CODE_SPREAD_SHOCK
+            sevs[n] = 2 if z_score > 5 else 1
+            scores[n] = min(100.0, z_score * 20)
+            meta[n, 0] = spread
+            meta[n, 1] = avg_spread
+            meta[n, 2] = z_score
+            n += 1
+    
+    # Risk scores
+    spoofing_risk = 0.0
+    if avg_l1 > 0:
+        ratio = max(max_bid, max_ask) / avg_l1
+        if ratio > 1:
+            spoofing_risk = min(100.0, (ratio - 1) * 25)
+    liquidity_score = min(50.0, total / 100) + max(0.0, 50 - spread_bps)
+    
+    anomaly_risk = 0.0
+    critical = 0
+    high = 0
+    manipulation = False
+    for k in range(n):
+        anomaly_risk += scores[k]
+        if sevs[k] == 3:
+            critical += 1
+        elif sevs[k] == 2:
+            high += 1
+        if codes[k] == _CODE_SPOOFING or codes[k] == _CODE_LAYERING:
+            manipulation = True
+    overall = min(100.0, (100 - liquidity_score) * 0.3 + anomaly_risk / 5 * 0.4 + spoofing_risk * 0.3)
+    
+    # Regime index into _REGIMES
+    if critical >= 2 or manipulation:
+        regime = 3
+    elif overall > 70 or high >= 3:
+        regime = 2
+    elif overall > 40:
+        regime = 1
+    else:
+        regime = 0
+    
+    return n, regime, overall, spoofing_risk, liquidity_score
+
+
+# Ahead-of-time compiled kernel (python -m core.aot_build), if built: native
+# speed without numba installed and without JIT warm-up in short-lived workers
+try:
+    from .analytics_fast import analyze_anomalies as _analyze_impl
+    _NATIVE_KERNEL = True
+except ImportError:
+    _analyze_impl = _analyze_kernel
+    _NATIVE_KERNEL = NUMBA_AVAILABLE
+
+
 class AnomalyDetector:
     """
     Detects market anomalies and manipulation patterns.
@@ -106,6 +372,12 @@ class AnomalyDetector:
     
     Adapted from Genesis2025 HFT platform.
     """
+    __slots__ = (
+        "spoofing_volume_threshold", "liquidity_gap_threshold", "imbalance_threshold",
+        "spread_shock_multiplier", "_ewma_alpha", "_one_minus_alpha", "_ewma_state",
+        "_prev_book", "_order_timestamps", "_price_history", "_ph_head", "_ph_count",
+        "_spoofing_events", "_codes_buf", "_sevs_buf", "_scores_buf", "_meta_buf",
+    )
     
     def __init__(
         self,
@@ -131,17 +403,47 @@ class AnomalyDetector:
         self.spread_shock_multiplier = spread_shock_multiplier
         self.ewma_alpha = ewma_alpha
         
-        # Rolling statistics
-        self._avg_spread: float = 0.0
-        self._avg_spread_sq: float = 0.0
-        self._avg_l1_volume: float = 100.0
+        # Rolling statistics: [avg_spread, avg_spread_sq, avg_l1_volume],
+        # updated together each snapshot
+        self._ewma_state = np.array([0.0, 0.0, 100.0])
         
         # State tracking
         self._prev_book: Optional[OrderBook] = None
         self._order_timestamps: deque = deque(maxlen=100)
-        self._price_history: deque = deque(maxlen=50)
+        # Mid-price ring buffer (see analytics._ring_push) for momentum detection
+        self._price_history = np.empty(50, dtype=np.float64)
+        self._ph_head = 0
+        self._ph_count = 0
         self._spoofing_events: int = 0
         
+        # Kernel output slots, reused for every snapshot
+        self._codes_buf = np.zeros(_MAX_ANOMALIES, dtype=np.int64)
+        self._sevs_buf = np.zeros(_MAX_ANOMALIES, dtype=np.int64)
+        self._scores_buf = np.zeros(_MAX_ANOMALIES, dtype=np.float64)
+        self._meta_buf = np.zeros((_MAX_ANOMALIES, 4), dtype=np.float64)
+        
+    @property
+    def ewma_alpha(self) -> float:
+        """Smoothing factor for the rolling spread/volume averages."""
+        return self._ewma_alpha
+    
+    @ewma_alpha.setter
+    def ewma_alpha(self, value: float) -> None:
+        self._ewma_alpha = value
+        self._one_minus_alpha = 1.0 - value
+    
+    @property
+    def _avg_spread(self) -> float:
+        return float(self._ewma_state[0])
+    
+    @property
+    def _avg_spread_sq(self) -> float:
+        return float(self._ewma_state[1])
+    
+    @property
+    def _avg_l1_volume(self) -> float:
+        return float(self._ewma_state[2])
+    
     def analyze(self, book: OrderBook) -> MarketState:
         """
         Analyze order book for anomalies and determine market regime.
@@ -152,7 +454,7 @@ class AnomalyDetector:
         Returns:
             MarketState containing regime and detected anomalies
         """
-        if not book.bids or not book.asks:
+        if not book.bid_prices.size or not book.ask_prices.size:
             return MarketState(
                 regime=MarketRegime.CALM,
                 anomalies=[],
@@ -161,22 +463,110 @@ class AnomalyDetector:
                 liquidity_score=100
             )
         
-        anomalies: List[Anomaly] = []
         current_time = book.timestamp or datetime.now()
         
+        # Store price for momentum detection
+        mid_price = book.mid_price
+        if mid_price:
+            self._push_price(mid_price)
+        
+        if _NATIVE_KERNEL:
+            state = self._analyze_native(book, current_time)
+        else:
+            state = self._analyze_python(book, current_time)
+        
+        # Update state
+        self._prev_book = book
+        
+        return state
+    
+    def _analyze_native(self, book: OrderBook, current_time: datetime) -> MarketState:
+        """analyze() via the compiled _analyze_kernel (AOT build or numba JIT)."""
+        codes, sevs, scores, meta = self._codes_buf, self._sevs_buf, self._scores_buf, self._meta_buf
+        # The AOT kernel reads f8[::1] buffers unchecked; OrderBook normalizes
+        # on construction, but its attributes can be reassigned afterwards
+        n, regime, overall_risk, spoofing_risk, liquidity_score = _analyze_impl(
+            np.ascontiguousarray(book.bid_prices, dtype=np.float64),
+            np.ascontiguousarray(book.bid_vols, dtype=np.float64),
+            np.ascontiguousarray(book.ask_prices, dtype=np.float64),
+            np.ascontiguousarray(book.ask_vols, dtype=np.float64),
+            self._ewma_state, self._ewma_alpha, self._one_minus_alpha,
+            self.spoofing_volume_threshold, self.liquidity_gap_threshold,
+            self.imbalance_threshold, self.spread_shock_multiplier,
+            codes, sevs, scores, meta
+        )
+        
+        anomalies = [
+            self._anomaly_from_kernel(int(codes[k]), _SEVERITIES[sevs[k]], float(scores[k]),
+                                      meta[k].tolist(), current_time)
+            for k in range(n)
+        ] if n else []
+        
+        return MarketState(
+            regime=_REGIMES[regime],
+            anomalies=anomalies,
+            overall_risk_score=overall_risk,
+            spoofing_risk=spoofing_risk,
+            liquidity_score=liquidity_score
+        )
+    
+    def _anomaly_from_kernel(self, code: int, severity: AnomalySeverity, risk_score: float,
+                             meta: List[float], timestamp: datetime) -> Anomaly:
+        """Build the Anomaly a _detect_* method would have returned from one kernel slot."""
+        if code == _CODE_SPOOFING:
+            self._spoofing_events += 1
+            side = "BID" if meta[0] == 0 else "ASK"
+            level = int(meta[1]) + 1
+            volume = meta[3]
+            message, args = _MSG_SPOOFING, (side.lower(), level, volume, self._avg_l1_volume)
+            details = {"side": side, "level": level, "price": meta[2], "volume": volume,
+                       "avg_volume": self._avg_l1_volume}
+        elif code == _CODE_LAYERING:
+            side = "BID" if meta[0] == 0 else "ASK"
+            count = int(meta[1])
+            message, args = _MSG_LAYERING, (count, side)
+            details = {"side": side, "large_order_count": count}
+        elif code == _CODE_LIQUIDITY_GAP:
+            side = "bid" if meta[0] == 0 else "ask"
+            level = int(meta[1]) + 1
+            message, args = _MSG_LIQUIDITY_GAP, (side, level, meta[3])
+            details = {"side": side, "level": level, "price": meta[2], "volume": meta[3]}
+        elif code == _CODE_HEAVY_IMBALANCE:
+            side = "BID" if meta[0] == 0 else "ASK"
+            message, args = _MSG_HEAVY_IMBALANCE, (side.lower(), meta[1])
+            details = {"side": side, "imbalance": meta[1], "bid_depth": meta[2], "ask_depth": meta[3]}
+        else:
+            message, args = _MSG_SPREAD_SHOCK, (meta[0], meta[2])
+            details = {"current_spread": meta[0], "avg_spread": meta[1], "z_score": meta[2]}
+        
+        return Anomaly(
+            type=_CODE_TYPES[code],
+            severity=severity,
+            message=message,
+            message_args=args,
+            timestamp=timestamp,
+            risk_score=risk_score,
+            details=details
+        )
+    
+    def _analyze_python(self, book: OrderBook, current_time: datetime) -> MarketState:
+        """analyze() via the per-detector methods (used when numba is unavailable)."""
+        anomalies: List[Anomaly] = []
+        
         # Update rolling statistics
         self._update_statistics(book)
         
-        # Store price for momentum detection
-        if book.mid_price:
-            self._price_history.append(book.mid_price)
+        # Volume thresholds depend only on the fresh EWMA; derive them once
+        avg_l1 = self._avg_l1_volume
+        spoof_threshold = avg_l1 * self.spoofing_volume_threshold
+        layer_threshold = avg_l1 * 2.0
         
         # Run detectors
-        spoofing_anomaly = self._detect_spoofing(book, current_time)
+        spoofing_anomaly = self._detect_spoofing(book, current_time, spoof_threshold)
         if spoofing_anomaly:
             anomalies.append(spoofing_anomaly)
         
-        layering_anomaly = self._detect_layering(book, current_time)
+        layering_anomaly = self._detect_layering(book, current_time, layer_threshold)
         if layering_anomaly:
             anomalies.append(layering_anomaly)
         
@@ -199,9 +589,6 @@ class AnomalyDetector:
         # Determine regime
         regime = self._classify_regime(anomalies, overall_risk)
         
-        # Update state
-        self._prev_book = book
-        
         return MarketState(
             regime=regime,
             anomalies=anomalies,
@@ -210,53 +597,76 @@ class AnomalyDetector:
             liquidity_score=liquidity_score
         )
     
+    def _push_price(self, price: float) -> None:
+        """Append a mid price to the history ring, overwriting the oldest."""
+        self._ph_head, self._ph_count = _ring_push(
+            self._price_history, self._ph_head, self._ph_count, price
+        )
+    
+    def _recent_prices(self) -> np.ndarray:
+        """Price history in chronological order (a copy only once the ring has wrapped)."""
+        if self._ph_count < self._price_history.size:
+            return self._price_history[:self._ph_count]
+        return np.roll(self._price_history, -self._ph_head)
+    
     def _update_statistics(self, book: OrderBook) -> None:
         """Update rolling EWMA statistics."""
         spread = book.spread or 0
-        l1_volume = (book.bids[0].volume + book.asks[0].volume) / 2
+        l1_volume = (float(book.bid_vols[0]) + float(book.ask_vols[0])) / 2
         
-        self._avg_spread = (1 - self.ewma_alpha) * self._avg_spread + self.ewma_alpha * spread
-        self._avg_spread_sq = (1 - self.ewma_alpha) * self._avg_spread_sq + self.ewma_alpha * (spread ** 2)
-        self._avg_l1_volume = (1 - self.ewma_alpha) * self._avg_l1_volume + self.ewma_alpha * l1_volume
+        state = self._ewma_state
+        state *= self._one_minus_alpha
+        state += self._ewma_alpha * np.array([spread, spread * spread, l1_volume])
     
-    def _detect_spoofing(self, book: OrderBook, timestamp: datetime) -> Optional[Anomaly]:
+    def _detect_spoofing(self, book: OrderBook, timestamp: datetime,
+                         threshold: Optional[float] = None) -> Optional[Anomaly]:
         """
         Detect spoofing - large orders significantly larger than normal.
         
         Real spoofing involves orders that are placed and cancelled quickly,
         but we can still flag unusually large orders as potential spoofing.
         """
-        threshold = self._avg_l1_volume * self.spoofing_volume_threshold
-        
-        for side, levels in [("BID", book.bids), ("ASK", book.asks)]:
-            for i, level in enumerate(levels[:5]):
-                if level.volume > threshold:
-                    risk_score = min(100, (level.volume / threshold) * 50)
-                    self._spoofing_events += 1
-                    
-                    return Anomaly(
-                        type=AnomalyType.SPOOFING,
-                        severity=AnomalySeverity.HIGH if risk_score > 70 else AnomalySeverity.MEDIUM,
-                        message=f"Large {side.lower()} order at level {i+1}: {level.volume:.0f} (avg: {self._avg_l1_volume:.0f})",
-                        timestamp=timestamp,
-                        risk_score=risk_score,
-                        details={
-                            "side": side,
-                            "level": i + 1,
-                            "price": level.price,
-                            "volume": level.volume,
-                            "avg_volume": self._avg_l1_volume
-                        }
-                    )
+        if threshold is None:
+            threshold = self._avg_l1_volume * self.spoofing_volume_threshold
+        
+        for side, prices, vols in [("BID", book.bid_prices, book.bid_vols),
+                                   ("ASK", book.ask_prices, book.ask_vols)]:
+            # One vector compare over the top 5; argmax finds the first hit
+            hits = vols[:5] > threshold
+            if not hits.any():
+                continue
+            
+            i = int(hits.argmax())
+            volume = float(vols[i])
+            risk_score = min(100, (volume / threshold) * 50)
+            self._spoofing_events += 1
+            
+            return Anomaly(
+                type=AnomalyType.SPOOFING,
+                severity=AnomalySeverity.HIGH if risk_score > 70 else AnomalySeverity.MEDIUM,
+                message=_MSG_SPOOFING,
+                message_args=(side.lower(), i + 1, volume, self._avg_l1_volume),
+                timestamp=timestamp,
+                risk_score=risk_score,
+                details={
+                    "side": side,
+                    "level": i + 1,
+                    "price": float(prices[i]),
+                    "volume": volume,
+                    "avg_volume": self._avg_l1_volume
+                }
+            )
         
         return None
     
-    def _detect_layering(self, book: OrderBook, timestamp: datetime) -> Optional[Anomaly]:
+    def _detect_layering(self, book: OrderBook, timestamp: datetime,
+                         threshold: Optional[float] = None) -> Optional[Anomaly]:
         """Detect layering - multiple large orders stacked on one side."""
-        threshold = self._avg_l1_volume * 2
+        if threshold is None:
+            threshold = self._avg_l1_volume * 2
         
-        bid_large_count = sum(1 for b in book.bids[:5] if b.volume > threshold)
-        ask_large_count = sum(1 for a in book.asks[:5] if a.volume > threshold)
+        bid_large_count = int((book.bid_vols[:5] > threshold).sum())
+        ask_large_count = int((book.ask_vols[:5] > threshold).sum())
         
         # Layering requires imbalance in large order count
         if bid_large_count >= 3 and bid_large_count > ask_large_count + 2:
@@ -264,7 +674,8 @@ class AnomalyDetector:
             return Anomaly(
                 type=AnomalyType.LAYERING,
                 severity=AnomalySeverity.CRITICAL if score > 70 else AnomalySeverity.HIGH,
-                message=f"Layering detected: {bid_large_count} large orders on BID side",
+                message=_MSG_LAYERING,
+                message_args=(bid_large_count, "BID"),
                 timestamp=timestamp,
                 risk_score=score,
                 details={"side": "BID", "large_order_count": bid_large_count}
@@ -275,7 +686,8 @@ class AnomalyDetector:
             return Anomaly(
                 type=AnomalyType.LAYERING,
                 severity=AnomalySeverity.CRITICAL if score > 70 else AnomalySeverity.HIGH,
-                message=f"Layering detected: {ask_large_count} large orders on ASK side",
+                message=_MSG_LAYERING,
+                message_args=(ask_large_count, "ASK"),
                 timestamp=timestamp,
                 risk_score=score,
                 details={"side": "ASK", "large_order_count": ask_large_count}
@@ -286,32 +698,45 @@ class AnomalyDetector:
     def _detect_liquidity_gaps(self, book: OrderBook, timestamp: datetime) -> List[Anomaly]:
         """Detect price levels with insufficient liquidity."""
         anomalies = []
+        threshold = self.liquidity_gap_threshold
         
-        for side, levels in [("bid", book.bids), ("ask", book.asks)]:
-            for i, level in enumerate(levels[:10]):
-                if level.volume < self.liquidity_gap_threshold:
-                    risk_score = min(100, (10 - i) * 15 + (self.liquidity_gap_threshold - level.volume) * 2)
-                    
-                    anomalies.append(Anomaly(
-                        type=AnomalyType.LIQUIDITY_GAP,
-                        severity=AnomalySeverity.MEDIUM if i > 3 else AnomalySeverity.HIGH,
-                        message=f"Liquidity gap at {side} level {i+1}: {level.volume:.0f}",
-                        timestamp=timestamp,
-                        risk_score=risk_score,
-                        details={
-                            "side": side,
-                            "level": i + 1,
-                            "price": level.price,
-                            "volume": level.volume
-                        }
-                    ))
-        
-        return anomalies[:5]  # Limit to top 5 gaps
+        for side, prices, vols in [("bid", book.bid_prices, book.bid_vols),
+                                   ("ask", book.ask_prices, book.ask_vols)]:
+            remaining = _MAX_GAPS - len(anomalies)
+            if remaining <= 0:
+                break
+            
+            # Score every top-10 level at once; build objects only for the thin ones
+            top = vols[:10]
+            gap_idx = np.flatnonzero(top < threshold)[:remaining]
+            if not gap_idx.size:
+                continue
+            scores = np.minimum(100, _GAP_LEVEL_BASE[gap_idx] + (threshold - top[gap_idx]) * 2)
+            
+            for i, volume, price, risk_score in zip(
+                gap_idx.tolist(), top[gap_idx].tolist(), prices[gap_idx].tolist(), scores.tolist()
+            ):
+                anomalies.append(Anomaly(
+                    type=AnomalyType.LIQUIDITY_GAP,
+                    severity=AnomalySeverity.MEDIUM if i > 3 else AnomalySeverity.HIGH,
+                    message=_MSG_LIQUIDITY_GAP,
+                    message_args=(side, i + 1, volume),
+                    timestamp=timestamp,
+                    risk_score=risk_score,
+                    details={
+                        "side": side,
+                        "level": i + 1,
+                        "price": price,
+                        "volume": volume
+                    }
+                ))
+        
+        return anomalies
     
     def _detect_heavy_imbalance(self, book: OrderBook, timestamp: datetime) -> Optional[Anomaly]:
         """Detect extreme order book imbalance."""
-        total_bid = sum(b.volume for b in book.bids[:5])
-        total_ask = sum(a.volume for a in book.asks[:5])
+        total_bid = float(book.bid_vols[:5].sum())
+        total_ask = float(book.ask_vols[:5].sum())
         total = total_bid + total_ask
         
         if total < 1e-9:
@@ -326,7 +751,8 @@ class AnomalyDetector:
             return Anomaly(
                 type=AnomalyType.HEAVY_IMBALANCE,
                 severity=AnomalySeverity.HIGH,
-                message=f"Heavy {side.lower()} imbalance: {imbalance:.1%}",
+                message=_MSG_HEAVY_IMBALANCE,
+                message_args=(side.lower(), imbalance),
                 timestamp=timestamp,
                 risk_score=risk_score,
                 details={
@@ -342,12 +768,14 @@ class AnomalyDetector:
     def _detect_spread_shock(self, book: OrderBook, timestamp: datetime) -> Optional[Anomaly]:
         """Detect sudden spread widening."""
         spread = book.spread or 0
+        avg_spread = self._avg_spread
         
-        # Calculate spread standard deviation
-        std_spread = math.sqrt(max(0, self._avg_spread_sq - self._avg_spread ** 2))
+        # Spread variance from the EWMA moments; no spread history yet means no shock
+        var_spread = self._avg_spread_sq - avg_spread * avg_spread
         
-        if std_spread > 0:
-            z_score = (spread - self._avg_spread) / std_spread
+        if var_spread > 0:
+            inv_std = 1.0 / math.sqrt(var_spread)
+            z_score = (spread - avg_spread) * inv_std
             
             if z_score > self.spread_shock_multiplier:
                 risk_score = min(100, z_score * 20)
@@ -355,12 +783,13 @@ class AnomalyDetector:
                 return Anomaly(
                     type=AnomalyType.SPREAD_SHOCK,
                     severity=AnomalySeverity.HIGH if z_score > 5 else AnomalySeverity.MEDIUM,
-                    message=f"Spread shock: {spread:.4f} (z-score: {z_score:.1f})",
+                    message=_MSG_SPREAD_SHOCK,
+                    message_args=(spread, z_score),
                     timestamp=timestamp,
                     risk_score=risk_score,
                     details={
                         "current_spread": spread,
-                        "avg_spread": self._avg_spread,
+                        "avg_spread": avg_spread,
                         "z_score": z_score
                     }
                 )
@@ -369,8 +798,8 @@ class AnomalyDetector:
     
     def _calculate_spoofing_risk(self, book: OrderBook) -> float:
         """Calculate overall spoofing risk score (0-100)."""
-        max_bid_vol = max(b.volume for b in book.bids[:5]) if book.bids else 0
-        max_ask_vol = max(a.volume for a in book.asks[:5]) if book.asks else 0
+        max_bid_vol = float(book.bid_vols[:5].max()) if book.bid_vols.size else 0
+        max_ask_vol = float(book.ask_vols[:5].max()) if book.ask_vols.size else 0
         max_vol = max(max_bid_vol, max_ask_vol)
         
         if self._avg_l1_volume > 0:
@@ -381,7 +810,7 @@ class AnomalyDetector:
     
     def _calculate_liquidity_score(self, book: OrderBook) -> float:
         """Calculate liquidity score (0-100, higher is better)."""
-        total_depth = sum(b.volume for b in book.bids[:5]) + sum(a.volume for a in book.asks[:5])
+        total_depth = float(book.bid_vols[:5].sum()) + float(book.ask_vols[:5].sum())
         spread_bps = book.spread_bps or 100
         
         # Score based on depth and spread
@@ -401,10 +830,20 @@ class AnomalyDetector:
     
     def _classify_regime(self, anomalies: List[Anomaly], overall_risk: float) -> MarketRegime:
         """Classify current market regime based on analysis."""
-        critical_count = sum(1 for a in anomalies if a.severity == AnomalySeverity.CRITICAL)
-        high_count = sum(1 for a in anomalies if a.severity == AnomalySeverity.HIGH)
-        
-        if critical_count >= 2 or any(a.type in [AnomalyType.SPOOFING, AnomalyType.LAYERING] for a in anomalies):
+        # Single pass over the anomalies for all three conditions
+        critical_count = 0
+        high_count = 0
+        manipulation = False
+        for a in anomalies:
+            severity = a.severity
+            if severity is AnomalySeverity.CRITICAL:
+                critical_count += 1
+            elif severity is AnomalySeverity.HIGH:
+                high_count += 1
+            if a.type in _SPOOF_OR_LAYER:
+                manipulation = True
+        
+        if critical_count >= 2 or manipulation:
             return MarketRegime.MANIPULATION_SUSPECTED
         
         if overall_risk > 70 or high_count >= 3:
@@ -417,10 +856,8 @@ class AnomalyDetector:
     
     def reset(self) -> None:
         """Reset all internal state."""
-        self._avg_spread = 0.0
-        self._avg_spread_sq = 0.0
-        self._avg_l1_volume = 100.0
+        self._ewma_state[:] = (0.0, 0.0, 100.0)
         self._prev_book = None
         self._order_timestamps.clear()
-        self._price_history.clear()
+        self._ph_head = self._ph_count = 0
         self._spoofing_events = 0
@@ -0,0 +1,90 @@
+"""
+Ahead-of-time build of the analytics kernels.
+
+Compiles the hot numeric kernels from core/analytics.py, the anomaly
+detector kernel from core/anomaly_detection.py and the DeepLOBLite
+inference kernel from core/ml_models.py into a native extension module,
+core/analytics_fast (a .so/.pyd next to this file), using numba's pycc.
+Each of those modules imports it when present, so latency-critical
+deployments skip JIT compilation on first use; without it they fall back to
+the numba JIT (or plain Python) code as usual.
+
+Usage:
+    python -m core.aot_build
+
+Requires numba (with numba.pycc) and a C compiler at build time only; the
+built module needs neither numba nor a compiler at runtime. Rebuild after
+changing any of the kernels listed in KERNELS.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from . import analytics, anomaly_detection, ml_models
+
+# Exported name -> (kernel, signature)
+KERNELS = {
+    "ofi_kernel": (
+        analytics._ofi_kernel,
+        "f8(f8, f8, f8, f8, f8, f8, f8, f8)",
+    ),
+    "book_reduce": (
+        analytics._book_reduce,
+        "UniTuple(f8, 3)(f8[::1], f8[::1], f8[::1], i8, i8)",
+    ),
+    "microprice_kernel": (
+        analytics._microprice_kernel,
+        "f8(f8, f8, f8, f8)",
+    ),
+    "directional_probability": (
+        analytics._directional_probability,
+        "f8(f8)",
+    ),
+    "vol_kernel": (
+        analytics._vol_kernel,
+        "f8(f8[::1])",
+    ),
+    "vpin_scan": (
+        analytics._vpin_scan,
+        "Tuple((f8[::1], f8, f8, f8, i8, i8, f8))"
+        "(f8[::1], b1[::1], f8, f8, f8, f8, f8[::1], i8, i8, f8)",
+    ),
+    "analyze_anomalies": (
+        anomaly_detection._analyze_kernel,
+        "Tuple((i8, i8, f8, f8, f8))"
+        "(f8[::1], f8[::1], f8[::1], f8[::1], f8[::1], f8, f8, f8, f8, f8, f8,"
+        " i8[::1], i8[::1], f8[::1], f8[:, ::1])",
+    ),
+    "predict_kernel": (
+        ml_models._predict_kernel,
+        "Tuple((i8, f8, f8, f8, f8))(f8, f8, f8)",
+    ),
+}
+
+
+def build(output_dir: str = None, verbose: bool = False) -> str:
+    """
+    Compile KERNELS into the analytics_fast extension module.
+
+    Args:
+        output_dir: Where to write the module (defaults to the core package)
+        verbose: Print compiler output
+
+    Returns:
+        Path of the directory the module was written to
+    """
+    cc = CC("analytics_fast")
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    cc.verbose = verbose
+
+    for name, (kernel, signature) in KERNELS.items():
+        # pycc wants the plain Python function, not the JIT dispatcher
+        cc.export(name, signature)(getattr(kernel, "py_func", kernel))
+
+    cc.compile()
+    return cc.output_dir
+
+
+if __name__ == "__main__":
+    print(f"Built analytics_fast in {build(verbose=True)}")
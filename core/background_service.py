@@ -11,19 +11,42 @@ from typing import List, Dict, Any, Optional
 from core.database import db
 
 # Simple in-memory alert store REMOVED in favor of SQLite
-_WATCHLIST: List[str] = ["BTC", "ETH", "SOL"]
+# Display order of the watchlist; _WATCHLIST is the set for membership checks
+_WATCHLIST_ORDER = ("BTC", "ETH", "SOL")
+_WATCHLIST: frozenset = frozenset(_WATCHLIST_ORDER)
+
+# Alerts written per DB transaction by the flush task
+_ALERT_BATCH_SIZE = 64
+
+def _seconds_until_next_hour(now: Optional[datetime] = None) -> float:
+    """
+    Seconds from now until the next HH:00:00.
+    
+    A boundary less than a second away counts as already reached (a sleep
+    that woke marginally early), so the following hour is returned instead.
+    """
+    now = now or datetime.now()
+    secs = 3600 - (now.minute * 60 + now.second + now.microsecond / 1e6)
+    return secs if secs >= 1 else secs + 3600
 
 class MarketMonitor:
     def __init__(self):
         self._running = False
         self._task = None
         self.logger = logging.getLogger("MarketMonitor")
+        # While running, alerts are queued and persisted in batches by _flush_loop
+        self._alert_q: Optional[asyncio.Queue] = None
+        self._flush_task = None
+        self._write_lock: Optional[asyncio.Lock] = None
         
     async def start(self):
         if self._running:
             return
         self._running = True
+        self._alert_q = asyncio.Queue(maxsize=1000)
+        self._write_lock = asyncio.Lock()
         self._task = asyncio.create_task(self._monitor_loop())
+        self._flush_task = asyncio.create_task(self._flush_loop())
         self.logger.info("Market Monitor started.")
 
     async def stop(self):
@@ -34,6 +57,12 @@ class MarketMonitor:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        if self._flush_task:
+            # Sentinel: the flush task writes everything queued before it, then exits
+            await self._alert_q.put(None)
+            await self._flush_task
+            self._flush_task = None
+            self._alert_q = None
         self.logger.info("Market Monitor stopped.")
 
     async def _monitor_loop(self):
@@ -50,12 +79,11 @@ class MarketMonitor:
                 # For this Phase 10 demo, we'll demonstrate the ARCHITECTURE of a background service
                 # that can be expanded.
                 
-                # Example check: Time-based alerts (just to prove it runs)
-                now = datetime.now()
-                if now.minute == 0 and now.second < 10:
-                    await self.add_alert("SYSTEM", "Hourly heartbeat check.")
-                
-                await asyncio.sleep(60) # FAST REFRESH FOR DEMO? No, 60s is safer.
+                # Example check: Time-based alerts (just to prove it runs).
+                # Sleep straight to the next hour boundary instead of polling
+                # the clock every minute; cancellation (stop()) interrupts the sleep.
+                await asyncio.sleep(_seconds_until_next_hour())
+                await self.add_alert("SYSTEM", "Hourly heartbeat check.")
                 
             except Exception as e:
                 self.logger.error(f"Error in monitor loop: {e}")
@@ -64,20 +92,84 @@ class MarketMonitor:
     async def add_alert(self, symbol: str, message: str, severity: str = "INFO"):
         """
         Add an alert to the system (Persistent).
+        
+        While the monitor is running the alert is queued and written by the
+        flush task in a batch, timestamped when the batch is written (one
+        clock read per batch); otherwise it is written immediately.
         """
+        if self._alert_q is not None:
+            await self._alert_q.put((symbol, message, severity))
+            return
+        
         try:
             await db.add_alert(symbol, message, severity)
         except Exception as e:
             self.logger.error(f"Failed to persist alert: {e}")
 
+    async def _flush_loop(self):
+        """Drain queued alerts into the DB, up to _ALERT_BATCH_SIZE per transaction."""
+        q = self._alert_q
+        while True:
+            item = await q.get()
+            done = item is None
+            batch = [] if done else [item]
+            while not done and len(batch) < _ALERT_BATCH_SIZE:
+                try:
+                    item = q.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is None:
+                    done = True
+                else:
+                    batch.append(item)
+            
+            await self._write_alerts(batch)
+            if done:
+                return
+
+    async def _write_alerts(self, batch: List[tuple]):
+        if not batch:
+            return
+        timestamp = datetime.now().isoformat()
+        rows = [(timestamp, symbol, message, severity) for symbol, message, severity in batch]
+        async with self._write_lock:
+            try:
+                await db.add_alerts(rows)
+            except Exception as e:
+                self.logger.error(f"Failed to persist {len(batch)} alert(s): {e}")
+
+    async def flush(self):
+        """Persist any queued alerts now (so reads see every alert added so far)."""
+        q = self._alert_q
+        if q is None:
+            return
+        batch = []
+        while True:
+            try:
+                item = q.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if item is None:
+                q.put_nowait(item)  # leave stop()'s sentinel for the flush task
+                break
+            batch.append(item)
+        if batch:
+            await self._write_alerts(batch)
+        else:
+            # Still wait out a batch the flush task may be writing right now
+            async with self._write_lock:
+                pass
+
     # get_alerts and mark_all_read Removed from Monitor to decouple.
     # Tools should access DB directly or via this service wrapper if preferred.
     # To keep tools simple, we will keep wrappers but delegate to DB.
     
     async def get_alerts(self, unread_only: bool = False) -> List[Dict[str, Any]]:
+        await self.flush()
         return await db.get_alerts(unread_only)
 
     async def mark_all_read(self):
+        await self.flush()
         await db.mark_all_read()
 
 # Global instance
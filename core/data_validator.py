@@ -9,8 +9,40 @@ from dataclasses import dataclass
 from typing import Dict, List, Tuple, Any, Optional
 import math
 
+import numpy as np
 
-@dataclass
+
+_INF = float("inf")
+_NINF = float("-inf")
+
+
+def _is_finite_number(value: Any) -> bool:
+    """Valid, finite number check with a no-call fast path for float/int."""
+    t = type(value)
+    if t is float:
+        # value == value is False only for NaN
+        return value == value and value != _INF and value != _NINF
+    if t is int:
+        return True
+    return _is_finite_number_slow(value)
+
+
+def _is_finite_number_slow(value: Any) -> bool:
+    """General case: None, bool, numpy scalars, numeric strings, ..."""
+    if value is None:
+        return False
+    
+    try:
+        if isinstance(value, (int, float)):
+            return not (math.isnan(value) or math.isinf(value))
+        # Try converting
+        float_val = float(value)
+        return not (math.isnan(float_val) or math.isinf(float_val))
+    except (TypeError, ValueError):
+        return False
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a validation check."""
     is_valid: bool
@@ -65,7 +97,7 @@ class DataValidator:
             errors.append("Bids must be a list")
         elif len(bids) == 0:
             errors.append("Bids list cannot be empty")
-        else:
+        elif not cls._levels_look_valid(bids):
             bid_errors = cls._validate_levels(bids, "bid")
             errors.extend(bid_errors)
         
@@ -74,14 +106,15 @@ class DataValidator:
             errors.append("Asks must be a list")
         elif len(asks) == 0:
             errors.append("Asks list cannot be empty")
-        else:
+        elif not cls._levels_look_valid(asks):
             ask_errors = cls._validate_levels(asks, "ask")
             errors.extend(ask_errors)
         
         # Cross-validation: bid < ask
         if not errors and len(bids) > 0 and len(asks) > 0:
-            best_bid = bids[0][0] if isinstance(bids[0], list) else bids[0]
-            best_ask = asks[0][0] if isinstance(asks[0], list) else asks[0]
+            # Levels already passed _validate_levels, so each is a list/tuple
+            best_bid = bids[0][0]
+            best_ask = asks[0][0]
             
             if cls._is_valid_number(best_bid) and cls._is_valid_number(best_ask):
                 if best_bid >= best_ask:
@@ -107,40 +140,92 @@ class DataValidator:
             warnings=warnings
         )
     
+    @staticmethod
+    def _levels_look_valid(levels: List, max_check: int = 10) -> bool:
+        """
+        Vectorized preflight for the common well-formed case.
+        
+        True only if the first max_check levels form a numeric array with
+        finite positive prices and finite non-negative volumes, i.e. when
+        _validate_levels would find nothing; anything else returns False
+        so the per-level checks can produce the detailed errors.
+        """
+        try:
+            arr = np.asarray(levels[:max_check])
+        except (TypeError, ValueError):
+            return False
+        if arr.dtype.kind not in "fiu" or arr.ndim != 2 or arr.shape[1] < 2:
+            return False
+        
+        prices = arr[:, 0]
+        volumes = arr[:, 1]
+        return bool(
+            np.isfinite(prices).all() and np.isfinite(volumes).all()
+            and (prices > 0).all() and (volumes >= 0).all()
+        )
+    
     @classmethod
     def _validate_levels(cls, levels: List, side: str, max_check: int = 10) -> List[str]:
-        """Validate order book levels."""
+        """Validate order book levels, specialized on the first level's type."""
+        level_type = type(levels[0]) if levels else None
+        if level_type is list or level_type is tuple:
+            return cls._validate_levels_typed(levels, side, level_type, max_check)
+        return cls._validate_levels_generic(levels, side, max_check)
+    
+    @classmethod
+    def _validate_levels_typed(cls, levels: List, side: str, level_type: type,
+                               max_check: int = 10) -> List[str]:
+        """Fast path for [[price, volume], ...] (or tuples): a type identity check per level."""
         errors = []
+        label = side.title()
+        is_valid_number = _is_finite_number
         
         for i, level in enumerate(levels[:max_check]):
-            if not isinstance(level, (list, tuple)) or len(level) < 2:
-                errors.append(f"{side.title()} level {i}: must be [price, volume]")
+            if type(level) is not level_type or len(level) < 2:
+                errors.extend(cls._level_errors(i, level, label))
                 continue
             
-            price, volume = level[0], level[1]
+            price = level[0]
+            volume = level[1]
             
-            if not cls._is_valid_number(price) or price <= 0:
-                errors.append(f"{side.title()} level {i}: invalid price {price}")
+            if not is_valid_number(price) or price <= 0:
+                errors.append(f"{label} level {i}: invalid price {price}")
             
-            if not cls._is_valid_number(volume) or volume < 0:
-                errors.append(f"{side.title()} level {i}: invalid volume {volume}")
+            if not is_valid_number(volume) or volume < 0:
+                errors.append(f"{label} level {i}: invalid volume {volume}")
+        
+        return errors
+    
+    @classmethod
+    def _validate_levels_generic(cls, levels: List, side: str, max_check: int = 10) -> List[str]:
+        """Validate order book levels of arbitrary (possibly mixed) types."""
+        errors = []
+        label = side.title()
+        for i, level in enumerate(levels[:max_check]):
+            errors.extend(cls._level_errors(i, level, label))
+        return errors
+    
+    @classmethod
+    def _level_errors(cls, i: int, level: Any, label: str) -> List[str]:
+        """Errors for a single level (label is the title-cased side)."""
+        if not isinstance(level, (list, tuple)) or len(level) < 2:
+            return [f"{label} level {i}: must be [price, volume]"]
+        
+        errors = []
+        price, volume = level[0], level[1]
+        
+        if not cls._is_valid_number(price) or price <= 0:
+            errors.append(f"{label} level {i}: invalid price {price}")
+        
+        if not cls._is_valid_number(volume) or volume < 0:
+            errors.append(f"{label} level {i}: invalid volume {volume}")
         
         return errors
     
     @staticmethod
     def _is_valid_number(value: Any) -> bool:
         """Check if value is a valid, finite number."""
-        if value is None:
-            return False
-        
-        try:
-            if isinstance(value, (int, float)):
-                return not (math.isnan(value) or math.isinf(value))
-            # Try converting
-            float_val = float(value)
-            return not (math.isnan(float_val) or math.isinf(float_val))
-        except (TypeError, ValueError):
-            return False
+        return _is_finite_number(value)
     
     @classmethod
     def sanitize_snapshot(cls, snapshot: Dict) -> Dict:
@@ -159,24 +244,41 @@ class DataValidator:
         if "mid_price" in result:
             result["mid_price"] = cls._sanitize_number(result["mid_price"], default=100.0)
         
-        # Sanitize bids
+        # Sanitize bids / asks
         if "bids" in result and isinstance(result["bids"], list):
-            result["bids"] = [
-                [cls._sanitize_number(p, 100.0), cls._sanitize_number(v, 0.0)]
-                for p, v in result["bids"]
-                if isinstance((p, v), tuple) or (isinstance(p, (int, float)) and isinstance(v, (int, float)))
-            ]
+            result["bids"] = cls._sanitize_levels(result["bids"])
         
-        # Sanitize asks
         if "asks" in result and isinstance(result["asks"], list):
-            result["asks"] = [
-                [cls._sanitize_number(p, 100.0), cls._sanitize_number(v, 0.0)]
-                for p, v in result["asks"]
-                if isinstance((p, v), tuple) or (isinstance(p, (int, float)) and isinstance(v, (int, float)))
-            ]
+            result["asks"] = cls._sanitize_levels(result["asks"])
         
         return result
     
+    @classmethod
+    def _sanitize_levels(cls, levels: List) -> List[List[float]]:
+        """
+        Sanitize [[price, volume], ...]: non-finite prices become 100.0 and
+        non-finite volumes 0.0; rows that aren't [price, volume] pairs are dropped.
+        """
+        try:
+            # np.array, not asarray: always a copy, so an ndarray input isn't edited in place
+            arr = np.array(levels, dtype=np.float64)
+        except (TypeError, ValueError):
+            arr = None
+        
+        if arr is not None and arr.ndim == 2 and arr.shape[1] == 2:
+            # Numeric (N, 2) input: one vectorized pass
+            finite = np.isfinite(arr)
+            arr[:, 0] = np.where(finite[:, 0], arr[:, 0], 100.0)
+            arr[:, 1] = np.where(finite[:, 1], arr[:, 1], 0.0)
+            return arr.tolist()
+        
+        # Ragged or non-numeric input: per row
+        return [
+            [cls._sanitize_number(level[0], 100.0), cls._sanitize_number(level[1], 0.0)]
+            for level in levels
+            if isinstance(level, (list, tuple)) and len(level) == 2
+        ]
+    
     @classmethod
     def _sanitize_number(cls, value: Any, default: float = 0.0) -> float:
         """Replace invalid numbers with default."""
@@ -6,25 +6,62 @@ Uses aiosqlite for async compatibility with FastMCP.
 """
 
 import aiosqlite
+import asyncio
 import os
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 # Database constants
 DB_FILE = "market_data.db"
 logger = logging.getLogger("Database")
 
+# Connection tuning for file-backed databases: WAL lets readers run while an
+# alert write commits, and NORMAL sync drops the per-commit fsync (WAL stays
+# consistent; only the last transactions can be lost on power failure).
+_FILE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",     # ~64 MB page cache
+    "PRAGMA mmap_size=268435456",   # 256 MB memory-mapped I/O
+    "PRAGMA busy_timeout=5000",
+)
+
+# Hot-path statements. Fixed SQL text (no per-call string building) so
+# sqlite3's per-connection statement cache reuses the compiled statement.
+_SQL_INSERT_ALERT = (
+    "INSERT INTO alerts (timestamp, symbol, message, severity, is_read) VALUES (?, ?, ?, ?, 0)"
+)
+_SQL_SELECT_ALERTS = (
+    "SELECT id, timestamp, symbol, message, severity, is_read FROM alerts ORDER BY id DESC LIMIT ?"
+)
+# is_read is known to be 0 here, so it's not read back (get_alerts fills it in)
+_SQL_SELECT_UNREAD_ALERTS = (
+    "SELECT id, timestamp, symbol, message, severity FROM alerts WHERE is_read = 0 ORDER BY id DESC LIMIT ?"
+)
+_SQL_MARK_ALL_READ = "UPDATE alerts SET is_read = 1 WHERE is_read = 0"
+
+# Compiled statements kept per connection (sqlite3's default is 128)
+_CACHED_STATEMENTS = 256
+
 class Database:
     def __init__(self, db_path: str = DB_FILE):
         self.db_path = db_path
         self._conn = None
+        # One shared connection means one transaction at a time: writers hold
+        # this across execute..commit so a batch can't interleave with (or be
+        # committed early by) another write
+        self._write_lock = asyncio.Lock()
 
     async def connect(self):
         """Establish connection to the database."""
         if not self._conn:
-            self._conn = await aiosqlite.connect(self.db_path)
+            self._conn = await aiosqlite.connect(self.db_path, cached_statements=_CACHED_STATEMENTS)
             self._conn.row_factory = aiosqlite.Row
+            if self.db_path != ":memory:":
+                for pragma in _FILE_PRAGMAS:
+                    await self._conn.execute(pragma)
             await self._init_schema()
             logger.info(f"Connected to database: {self.db_path}")
 
@@ -51,6 +88,11 @@ class Database:
                 is_read INTEGER DEFAULT 0
             )
         """)
+        # Unread-first lookups (get_alerts(unread_only=True), mark_all_read)
+        # read only the unread entries, newest first, instead of scanning the table
+        await self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_alerts_unread ON alerts(is_read, id DESC)"
+        )
 
         # Market Snapshots (for future history tools)
         await self._conn.execute("""
@@ -64,6 +106,9 @@ class Database:
                 obi REAL
             )
         """)
+        await self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_snapshots_symbol_ts ON market_snapshots(symbol, timestamp)"
+        )
         
         await self._conn.commit()
 
@@ -73,37 +118,60 @@ class Database:
             await self.connect()
         
         timestamp = datetime.now().isoformat()
-        await self._conn.execute(
-            "INSERT INTO alerts (timestamp, symbol, message, severity, is_read) VALUES (?, ?, ?, ?, ?)",
-            (timestamp, symbol, message, severity, 0)
-        )
-        await self._conn.commit()
+        async with self._write_lock:
+            await self._conn.execute(_SQL_INSERT_ALERT, (timestamp, symbol, message, severity))
+            await self._conn.commit()
+
+    async def add_alerts(self, alerts: List[Tuple[str, str, str, str]]):
+        """
+        Insert many (timestamp, symbol, message, severity) alerts in one transaction.
+        
+        The write lock is taken up front (BEGIN IMMEDIATE) so, under WAL, a
+        concurrent reader can never force the batch to fail on a lock upgrade.
+        """
+        if not alerts:
+            return
+        if not self._conn:
+            await self.connect()
+        
+        async with self._write_lock:
+            await self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                await self._conn.executemany(_SQL_INSERT_ALERT, alerts)
+            except Exception:
+                await self._conn.rollback()
+                raise
+            await self._conn.commit()
 
     async def get_alerts(self, unread_only: bool = False, limit: int = 50) -> List[Dict[str, Any]]:
         """Retrieve alerts."""
         if not self._conn:
             await self.connect()
 
-        query = "SELECT * FROM alerts"
-        params = []
-        
-        if unread_only:
-            query += " WHERE is_read = 0"
-        
-        query += " ORDER BY id DESC LIMIT ?"
-        params.append(limit)
-
-        async with self._conn.execute(query, params) as cursor:
+        query = _SQL_SELECT_UNREAD_ALERTS if unread_only else _SQL_SELECT_ALERTS
+        async with self._conn.execute(query, (limit,)) as cursor:
+            # Plain tuples: the column order is fixed by the query, so skip
+            # building aiosqlite.Row objects just to look names up again
+            cursor.row_factory = None
             rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        if unread_only:
+            return [
+                {"id": i, "timestamp": ts, "symbol": sym, "message": msg, "severity": sev, "is_read": 0}
+                for i, ts, sym, msg, sev in rows
+            ]
+        return [
+            {"id": i, "timestamp": ts, "symbol": sym, "message": msg, "severity": sev, "is_read": read}
+            for i, ts, sym, msg, sev, read in rows
+        ]
 
     async def mark_all_read(self):
         """Mark all alerts as read."""
         if not self._conn:
             await self.connect()
             
-        await self._conn.execute("UPDATE alerts SET is_read = 1 WHERE is_read = 0")
-        await self._conn.commit()
+        async with self._write_lock:
+            await self._conn.execute(_SQL_MARK_ALL_READ)
+            await self._conn.commit()
 
 # Global database instance
 db = Database()
@@ -0,0 +1,61 @@
+"""
+Pooled HTTP Clients
+
+Keep-alive httpx clients shared per event loop, so repeated API calls reuse
+open connections instead of paying a TCP + TLS handshake each time.
+"""
+
+import asyncio
+import atexit
+import weakref
+from typing import Callable
+
+import httpx
+
+
+class LoopClientPool:
+    """
+    One httpx.AsyncClient per event loop, created on first use.
+
+    httpx clients are bound to the loop they were first used on, so a single
+    global client can't be shared across the agent loop, the MCP server loop
+    and asyncio.run() callers. Entries for loops that have since closed are
+    dropped when another loop's client is created (an open keep-alive
+    connection references its loop, so the weak keys alone never expire).
+    Clients still open at interpreter exit are closed on their loops when
+    possible.
+    """
+
+    def __init__(self, factory: Callable[[], httpx.AsyncClient]):
+        self._factory = factory
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+        atexit.register(self.close_all)
+
+    def get(self) -> httpx.AsyncClient:
+        """Get the pooled client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            self._prune()
+            client = self._factory()
+            self._clients[loop] = client
+        return client
+
+    def _prune(self) -> None:
+        """Forget clients whose loop is closed (they can no longer be used or aclose()d)."""
+        for loop in [loop for loop in self._clients if loop.is_closed()]:
+            del self._clients[loop]
+
+    def close_all(self) -> None:
+        """Close pooled clients whose loops are still usable."""
+        for loop, client in list(self._clients.items()):
+            if client.is_closed or loop.is_closed():
+                continue
+            try:
+                if loop.is_running():
+                    asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=2.0)
+                else:
+                    loop.run_until_complete(client.aclose())
+            except Exception:
+                pass
+        self._clients.clear()
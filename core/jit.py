@@ -0,0 +1,29 @@
+"""
+Optional Numba JIT support.
+
+Numeric kernels import `njit` (and `prange`, `register_jitable`) from here
+instead of from numba directly. `register_jitable` marks small helpers that
+stay plain Python when called from Python but are compiled into any njit
+kernel that calls them.
+When numba is not installed the decorator is a no-op and the kernels run
+as plain Python, so results are identical either way.
+"""
+
+try:
+    from numba import njit, prange
+    from numba.extending import register_jitable
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and called forms)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+    register_jitable = njit
@@ -5,11 +5,77 @@ Core inference logic for price prediction and regime classification.
 Separated from tools to allow internal use by StrategyEngine.
 """
 
+import math
 import numpy as np
 from datetime import datetime
 from typing import Dict, Any, List, Tuple
 
 from core.analytics import OrderBook, MicrostructureAnalyzer
+from core.jit import njit, register_jitable
+
+# Signal labels, indexed like the (up, stationary, down) probability columns
+SIGNALS = ("UP", "STATIONARY", "DOWN")
+
+# Heuristic weights (derived from HFT literature patterns)
+_W_OFI = 2.5
+_W_OBI = 1.5
+_W_MP_DIV = 100.0
+_STATIONARY_BIAS = 2.0
+
+# A direction is signalled when its probability clears this (and beats the opposite one)
+_SIGNAL_THRESHOLD = 0.45
+
+# For logit_up = L > 0 the softmax gives p_up = 1 / (1 + exp(bias - 2L) + exp(-2L)),
+# which rises with L, so p_up > _SIGNAL_THRESHOLD <=> L > _UP_LOGIT (and DOWN
+# mirrors it at L < -_UP_LOGIT). Lets predict_fast skip the softmax.
+_UP_LOGIT = 0.5 * math.log((math.exp(_STATIONARY_BIAS) + 1.0) / (1.0 / _SIGNAL_THRESHOLD - 1.0))
+
+@register_jitable
+def _logit_up(ofi, obi, mp_divergence):
+    """Up-direction logit (scalars or arrays); the only place the feature weights are applied."""
+    return (ofi * _W_OFI) + (obi * _W_OBI) + (mp_divergence * _W_MP_DIV)
+
+def _logits(ofi, obi, mp_divergence):
+    """(up, stationary, down) logits for equal-shape feature arrays."""
+    logit_up = _logit_up(ofi, obi, mp_divergence)
+    return logit_up, _STATIONARY_BIAS - np.abs(logit_up), -logit_up
+
+@njit(cache=True)
+def _predict_kernel(ofi, obi, mp_divergence):
+    """
+    Logits, softmax and signal selection for one snapshot's features.
+    
+    Returns:
+        (index into SIGNALS, confidence, p_up, p_stationary, p_down)
+    """
+    logit_up = _logit_up(ofi, obi, mp_divergence)
+    logit_down = -logit_up
+    logit_stationary = _STATIONARY_BIAS - abs(logit_up) # Bias towards stationary
+    
+    m = max(logit_up, logit_stationary, logit_down)
+    e_up = math.exp(logit_up - m)
+    e_stat = math.exp(logit_stationary - m)
+    e_down = math.exp(logit_down - m)
+    total = e_up + e_stat + e_down
+    p_up = e_up / total
+    p_stat = e_stat / total
+    p_down = e_down / total
+    
+    # Signal index without branching: the two conditions are mutually
+    # exclusive, so 1 (STATIONARY) moves to 0 (UP) or 2 (DOWN)
+    up = (p_up > _SIGNAL_THRESHOLD) & (p_up > p_down)
+    down = (p_down > _SIGNAL_THRESHOLD) & (p_down > p_up)
+    idx = 1 + int(down) - int(up)
+    probs = (p_up, p_stat, p_down)
+    return idx, probs[idx], p_up, p_stat, p_down
+
+# Ahead-of-time compiled kernel (python -m core.aot_build), if built. Without
+# it, plain Python beats the JIT here: for one call on three floats numba's
+# dispatch and tuple boxing cost more than the arithmetic.
+try:
+    from core.analytics_fast import predict_kernel as _predict_impl
+except ImportError:
+    _predict_impl = getattr(_predict_kernel, "py_func", _predict_kernel)
 
 class DeepLOBLite:
     """
@@ -31,30 +97,10 @@ class DeepLOBLite:
         obi = metrics.obi
         mp_divergence = metrics.microprice_divergence
         
-        # 2. Inference Logic (Calibrated Heuristic)
-        # Weights derived from HFT literature patterns
-        logit_up = (ofi * 2.5) + (obi * 1.5) + (mp_divergence * 100.0)
-        logit_down = -(ofi * 2.5) - (obi * 1.5) - (mp_divergence * 100.0)
-        logit_stationary = 2.0 - abs(logit_up) # Bias towards stationary
-        
-        # Softmax
-        logits = np.array([logit_up, logit_stationary, logit_down])
-        exp_logits = np.exp(logits - np.max(logits))
-        probs = exp_logits / np.sum(exp_logits)
+        # 2. Inference + 3. Signal Generation (Calibrated Heuristic)
+        idx, confidence, p_up, p_stat, p_down = _predict_impl(ofi, obi, mp_divergence)
+        signal = SIGNALS[idx]
         
-        p_up, p_stat, p_down = probs
-        
-        # 3. Signal Generation
-        if p_up > 0.45 and p_up > p_down:
-            signal = "UP"
-            confidence = p_up
-        elif p_down > 0.45 and p_down > p_up:
-            signal = "DOWN"
-            confidence = p_down
-        else:
-            signal = "STATIONARY"
-            confidence = p_stat
-            
         return {
             "signal": signal,
             "confidence": float(confidence),
@@ -69,3 +115,62 @@ class DeepLOBLite:
                 "microprice_div": mp_divergence
             }
         }
+
+    def predict_fast(self, bids: List[List[float]], asks: List[List[float]]) -> str:
+        """
+        Signal only ("UP" / "STATIONARY" / "DOWN") for a raw order book snapshot.
+        
+        Same decision and analyzer state update as predict(), but thresholds
+        the up-logit directly instead of computing probabilities.
+        """
+        book = OrderBook.from_raw(bids, asks, datetime.now())
+        metrics = self.analyzer.analyze(book)
+        logit_up = _logit_up(metrics.ofi, metrics.obi, metrics.microprice_divergence)
+        if logit_up > _UP_LOGIT:
+            return "UP"
+        if logit_up < -_UP_LOGIT:
+            return "DOWN"
+        return "STATIONARY"
+
+    def predict_batch(
+        self,
+        bid_prices: np.ndarray,
+        bid_vols: np.ndarray,
+        ask_prices: np.ndarray,
+        ask_vols: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Run inference on a stack of T snapshots ((T, L) arrays, best level first).
+        
+        Features come from MicrostructureAnalyzer.analyze_many, so the batch
+        is its own series (row 0 has OFI 0) and predict()'s streaming state
+        is untouched.
+        
+        Returns:
+            Dict of arrays: "signal" (T,) labels, "confidence" (T,),
+            "probabilities" (T, 3) as (up, stationary, down) and the
+            "ofi" / "obi" / "microprice_div" features.
+        """
+        metrics = self.analyzer.analyze_many(bid_prices, bid_vols, ask_prices, ask_vols)
+        ofi = metrics["ofi"]
+        obi = metrics["obi"]
+        mp_divergence = metrics["microprice_divergence"]
+        
+        # Row-wise softmax over the (T, 3) logits
+        logits = np.stack(_logits(ofi, obi, mp_divergence), axis=1)
+        probs = np.exp(logits - logits.max(axis=1, keepdims=True))
+        probs /= probs.sum(axis=1, keepdims=True)
+        
+        p_up, p_down = probs[:, 0], probs[:, 2]
+        up = (p_up > _SIGNAL_THRESHOLD) & (p_up > p_down)
+        down = (p_down > _SIGNAL_THRESHOLD) & (p_down > p_up)
+        idx = 1 + down.astype(np.intp) - up.astype(np.intp)
+        
+        return {
+            "signal": np.asarray(SIGNALS)[idx],
+            "confidence": probs[np.arange(idx.size), idx],
+            "probabilities": probs,
+            "ofi": ofi,
+            "obi": obi,
+            "microprice_div": mp_divergence
+        }
@@ -17,6 +17,18 @@ from dataclasses import dataclass
 
 from core.ml_models import DeepLOBLite
 
+# Decision table: ML signal -> (action, reason template, use ML confidence)
+# per sentiment regime (0: extreme fear <= 30, 1: neutral, 2: extreme greed >= 70).
+# Alignment strategy: follow the ML signal unless sentiment is at the opposite extreme.
+_BUY = ("BUY", "ML Bullish ({conf:.2f}) + Sentiment Neutral/Bullish ({sentiment})", True)
+_SELL = ("SELL", "ML Bearish ({conf:.2f}) + Sentiment Neutral/Bearish ({sentiment})", True)
+_STATIONARY = ("HOLD", "Market Stationary", False)
+_DECISIONS = {
+    "UP": (("HOLD", "ML Bullish but Sentiment is Extreme Fear (Contrarian Risk)", False), _BUY, _BUY),
+    "DOWN": (_SELL, _SELL, ("HOLD", "ML Bearish but Sentiment is Extreme Greed (Squeeze Risk)", False)),
+    "STATIONARY": (_STATIONARY, _STATIONARY, _STATIONARY),
+}
+
 @dataclass
 class TradingSignal:
     symbol: str
@@ -51,32 +63,13 @@ class StrategyEngine:
         # 2. Sentiment Filter (Macro)
         # Rule: Don't short in Extreme Greed? Or Follow trend?
         # Simple Strategy: Alignment. 
-        # If ML says UP and Sentiment > 40 (Not Extreme Fear), BUY.
-        # If ML says DOWN and Sentiment < 60 (Not Extreme Greed), SELL.
-        
-        action = "HOLD"
-        reason = "Uncertain signal"
-        final_conf = 0.0
+        # If ML says UP and Sentiment > 30 (Not Extreme Fear), BUY.
+        # If ML says DOWN and Sentiment < 70 (Not Extreme Greed), SELL.
+        regime = (sentiment_score > 30) + (sentiment_score >= 70)
+        action, reason, use_conf = _DECISIONS[ml_signal][regime]
+        reason = reason.format(conf=ml_conf, sentiment=sentiment_score)
+        final_conf = ml_conf if use_conf else 0.0
         
-        if ml_signal == "UP":
-            if sentiment_score > 30: # Not extreme fear
-                action = "BUY"
-                reason = f"ML Bullish ({ml_conf:.2f}) + Sentiment Neutral/Bullish ({sentiment_score})"
-                final_conf = ml_conf
-            else:
-                reason = "ML Bullish but Sentiment is Extreme Fear (Contrarian Risk)"
-                
-        elif ml_signal == "DOWN":
-            if sentiment_score < 70: # Not extreme greed
-                action = "SELL"
-                reason = f"ML Bearish ({ml_conf:.2f}) + Sentiment Neutral/Bearish ({sentiment_score})"
-                final_conf = ml_conf
-            else:
-                reason = "ML Bearish but Sentiment is Extreme Greed (Squeeze Risk)"
-                
-        else:
-            reason = "Market Stationary"
-            
         return {
             "symbol": symbol,
             "action": action,
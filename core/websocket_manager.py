@@ -9,18 +9,86 @@ Provides async WebSocket connections to crypto exchanges with:
 """
 
 import asyncio
+import inspect
 import json
 import logging
+import random
+import time
+from operator import itemgetter
 from typing import Dict, Optional, Callable, Any
 from datetime import datetime
 from dataclasses import dataclass
+import numpy as np
 import websockets
-from websockets.exceptions import ConnectionClosed
+from websockets.exceptions import ConnectionClosed, ConnectionClosedOK
+
+# orjson decodes stream frames several times faster; it is optional.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except covers both.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# All Binance subscriptions are multiplexed over one combined-stream socket
+_BINANCE_COMBINED_URL = "wss://stream.binance.com:9443/stream?streams="
+# Subscription changes within this window share one reconnect
+_RESUBSCRIBE_DEBOUNCE = 0.05
+
+# A connection that stayed up this long (s) clears the reconnect attempt count
+_STABLE_SESSION = 60.0
+# Reconnect delays are capped here (s) before jitter
+_MAX_BACKOFF = 32
+
+
+def _reconnect_delay(attempts: int) -> float:
+    """Exponential backoff with +/-50% jitter, so clients dropped together don't reconnect in lockstep."""
+    return min(2 ** attempts, _MAX_BACKOFF) * random.uniform(0.5, 1.5)
+
+
+# get_active_streams() serves a cached snapshot; besides subscription and
+# connection changes, it is rebuilt once last_message times are this stale (s)
+_STATUS_MAX_AGE = 1.0
+
+# Normalized messages buffered per stream between the receive loop and the
+# callback; when a slow callback lets it fill, the oldest message is dropped
+_STREAM_QUEUE_SIZE = 256
+
+
+async def _binary_frames(websocket):
+    """
+    Like `async for message in websocket`, but yields frames as undecoded bytes.
+    
+    The JSON decoders take bytes directly, so text frames skip the UTF-8 to
+    str conversion. Ends quietly on a normal close, as iteration does.
+    """
+    try:
+        while True:
+            yield await websocket.recv(decode=False)
+    except ConnectionClosedOK:
+        return
+
+
+# Binance 24h ticker fields in normalized order: last, volume, change %, high, low
+_TICKER_KEYS = ("c", "v", "P", "h", "l")
+_ticker_fields = itemgetter(*_TICKER_KEYS)
+
+
+def _event_time(data: Dict[str, Any]) -> int:
+    """Exchange event time (ms); the clock is only read when the payload has none."""
+    ts = data.get("E")
+    return ts if ts is not None else int(datetime.now().timestamp() * 1000)
+
+
+def _levels_array(levels) -> np.ndarray:
+    """[[price, qty], ...] (numeric strings or numbers) -> contiguous (N, 2) float64 array."""
+    return np.asarray(levels, dtype=np.float64).reshape(-1, 2)
+
+
 @dataclass
 class StreamSubscription:
     """Represents an active WebSocket stream subscription"""
@@ -32,6 +100,7 @@ class StreamSubscription:
     is_connected: bool
     reconnect_attempts: int
     last_message_time: Optional[datetime]
+    stream_name: Optional[str] = None  # exchange-side stream, e.g. btcusdt@depth20
 
 
 class WebSocketManager:
@@ -45,10 +114,24 @@ class WebSocketManager:
     - Thread-safe subscription management
     """
     
-    def __init__(self, max_reconnect_attempts: int = 5):
+    def __init__(self, max_reconnect_attempts: int = 5, include_raw: bool = False):
         self.subscriptions: Dict[str, StreamSubscription] = {}
         self.callbacks: Dict[str, Callable] = {}
+        # Per-stream message queue and the task that feeds it to the callback
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._consumers: Dict[str, asyncio.Task] = {}
+        # Binance stream name (e.g. btcusdt@depth20) -> stream_id, and the
+        # task running the combined connection for all of them
+        self._binance_streams: Dict[str, str] = {}
+        self._binance_task: Optional[asyncio.Task] = None
+        self._rebuild_task: Optional[asyncio.Task] = None
+        # Cached get_active_streams() result and when it was built (None = dirty)
+        self._status_cache: Dict[str, Dict[str, Any]] = {}
+        self._status_built_at: Optional[float] = None
         self.max_reconnect_attempts = max_reconnect_attempts
+        # Attach the decoded exchange payload to orderbook messages (debugging);
+        # off by default so queued messages don't keep every raw frame alive
+        self.include_raw = include_raw
         self.is_running = False
         
     async def subscribe_binance_orderbook(
@@ -72,8 +155,8 @@ class WebSocketManager:
         binance_symbol = symbol.replace('/', '').lower()
         stream_id = f"binance_{binance_symbol}_orderbook"
         
-        # Binance WebSocket URL
-        ws_url = f"wss://stream.binance.com:9443/ws/{binance_symbol}@depth{depth}"
+        # Binance stream name (served over the shared combined connection)
+        stream_name = f"{binance_symbol}@depth{depth}"
         
         # Create subscription
         subscription = StreamSubscription(
@@ -84,14 +167,15 @@ class WebSocketManager:
             websocket=None,
             is_connected=False,
             reconnect_attempts=0,
-            last_message_time=None
+            last_message_time=None,
+            stream_name=stream_name
         )
         
-        self.subscriptions[stream_id] = subscription
-        self.callbacks[stream_id] = callback
+        self._register(subscription, callback)
+        self._binance_streams[stream_name] = stream_id
         
-        # Start connection task
-        asyncio.create_task(self._maintain_connection(stream_id, ws_url))
+        # (Re)connect the combined stream to include it
+        self._schedule_rebuild()
         
         logger.info(f"Subscribed to Binance orderbook: {symbol} (stream_id: {stream_id})")
         return stream_id
@@ -114,7 +198,7 @@ class WebSocketManager:
         binance_symbol = symbol.replace('/', '').lower()
         stream_id = f"binance_{binance_symbol}_ticker"
         
-        ws_url = f"wss://stream.binance.com:9443/ws/{binance_symbol}@ticker"
+        stream_name = f"{binance_symbol}@ticker"
         
         subscription = StreamSubscription(
             stream_id=stream_id,
@@ -124,76 +208,172 @@ class WebSocketManager:
             websocket=None,
             is_connected=False,
             reconnect_attempts=0,
-            last_message_time=None
+            last_message_time=None,
+            stream_name=stream_name
         )
         
-        self.subscriptions[stream_id] = subscription
-        self.callbacks[stream_id] = callback
+        self._register(subscription, callback)
+        self._binance_streams[stream_name] = stream_id
         
-        asyncio.create_task(self._maintain_connection(stream_id, ws_url))
+        self._schedule_rebuild()
         
         logger.info(f"Subscribed to Binance ticker: {symbol} (stream_id: {stream_id})")
         return stream_id
     
-    async def _maintain_connection(self, stream_id: str, ws_url: str):
+    def _register(self, subscription: StreamSubscription, callback: Callable) -> None:
+        """Record a subscription and start the consumer that runs its callback."""
+        stream_id = subscription.stream_id
+        previous = self.subscriptions.get(stream_id)
+        if previous is not None and previous.stream_name != subscription.stream_name:
+            # Re-subscribed with different parameters (e.g. depth): drop the old stream
+            self._binance_streams.pop(previous.stream_name, None)
+        self.subscriptions[stream_id] = subscription
+        self.callbacks[stream_id] = callback
+        self._status_built_at = None
+        
+        if stream_id in self._consumers:
+            self._consumers.pop(stream_id).cancel()
+        queue = asyncio.Queue(maxsize=_STREAM_QUEUE_SIZE)
+        self._queues[stream_id] = queue
+        self._consumers[stream_id] = asyncio.create_task(self._consume(stream_id, queue))
+    
+    def _enqueue(self, stream_id: str, message: Dict[str, Any]) -> None:
+        """Hand a message to the stream's consumer without blocking the receive loop."""
+        queue = self._queues.get(stream_id)
+        if queue is None:
+            return
+        if queue.full():
+            # Drop the oldest message: a backed-up consumer wants the freshest data
+            queue.get_nowait()
+        queue.put_nowait(message)
+    
+    async def _consume(self, stream_id: str, queue: asyncio.Queue):
         """
-        Maintain WebSocket connection with auto-reconnection.
+        Run the stream's callback for each queued message.
         
-        Args:
-            stream_id: Subscription identifier
-            ws_url: WebSocket URL
+        Callbacks may be plain functions or coroutine functions; either way
+        they run here, off the receive loop, so a slow one cannot stall the
+        socket.
         """
-        subscription = self.subscriptions.get(stream_id)
-        if not subscription:
-            return
+        while True:
+            message = await queue.get()
+            callback = self.callbacks.get(stream_id)
+            if callback is None:
+                continue
+            try:
+                result = callback(message)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Callback error in {stream_id}: {e}")
+    
+    def _schedule_rebuild(self) -> None:
+        """Reconnect the combined Binance stream after the subscription set changed."""
+        if self._rebuild_task is None or self._rebuild_task.done():
+            self._rebuild_task = asyncio.create_task(self._rebuild_binance_connection())
+    
+    async def _rebuild_binance_connection(self):
+        """
+        Replace the combined Binance connection with one for the current streams.
+        
+        Debounced, so a burst of subscribe/unsubscribe calls costs a single
+        reconnect.
+        """
+        await asyncio.sleep(_RESUBSCRIBE_DEBOUNCE)
+        if self._binance_task:
+            self._binance_task.cancel()
+            self._binance_task = None
+        if self._binance_streams:
+            ws_url = _BINANCE_COMBINED_URL + "/".join(self._binance_streams)
+            self._binance_task = asyncio.create_task(self._maintain_connection(ws_url))
+    
+    def _set_binance_status(self, websocket, is_connected: bool, reconnect_attempts: int) -> None:
+        """Mirror the shared connection's state onto every Binance subscription."""
+        self._status_built_at = None
+        for stream_id in self._binance_streams.values():
+            subscription = self.subscriptions.get(stream_id)
+            if subscription:
+                subscription.websocket = websocket
+                subscription.is_connected = is_connected
+                subscription.reconnect_attempts = reconnect_attempts
+    
+    @staticmethod
+    def _next_attempt(attempts: int, connected_at: Optional[float]) -> int:
+        """
+        Attempt count after a disconnect.
         
-        while subscription.reconnect_attempts < self.max_reconnect_attempts:
+        Only a session that outlived _STABLE_SESSION starts the count over, so
+        a connection that keeps dropping right after connecting still runs
+        into max_reconnect_attempts with growing delays.
+        """
+        if connected_at is not None and time.monotonic() - connected_at > _STABLE_SESSION:
+            attempts = 0
+        return attempts + 1
+    
+    async def _maintain_connection(self, ws_url: str):
+        """
+        Maintain the combined Binance connection with auto-reconnection.
+        
+        Frames arrive as {"stream": <stream name>, "data": <payload>} and are
+        routed to the subscription registered under that stream name.
+        
+        Args:
+            ws_url: Combined-stream WebSocket URL
+        """
+        attempts = 0
+        connected_at = None
+        while attempts < self.max_reconnect_attempts:
             try:
                 async with websockets.connect(ws_url) as websocket:
-                    subscription.websocket = websocket
-                    subscription.is_connected = True
-                    subscription.reconnect_attempts = 0
+                    connected_at = time.monotonic()
+                    self._set_binance_status(websocket, True, attempts)
                     
-                    logger.info(f"Connected to {stream_id}")
+                    logger.info(f"Connected to {len(self._binance_streams)} Binance stream(s)")
                     
                     # Message receiving loop
-                    async for message in websocket:
+                    async for message in _binary_frames(websocket):
                         try:
-                            data = json.loads(message)
-                            normalized = self._normalize_message(data, subscription)
+                            frame = _loads(message)
+                            stream_id = self._binance_streams.get(frame.get("stream"))
+                            subscription = self.subscriptions.get(stream_id)
+                            if subscription is None:
+                                continue
+                            
+                            normalized = self._normalize_message(frame.get("data", {}), subscription)
                             
                             # Update last message time
                             subscription.last_message_time = datetime.now()
                             
-                            # Call callback
-                            if stream_id in self.callbacks:
-                                self.callbacks[stream_id](normalized)
+                            # Queue for the callback (run by the stream's consumer task)
+                            self._enqueue(stream_id, normalized)
                                 
                         except json.JSONDecodeError as e:
-                            logger.error(f"JSON decode error in {stream_id}: {e}")
+                            logger.error(f"JSON decode error in Binance stream: {e}")
                         except Exception as e:
-                            logger.error(f"Callback error in {stream_id}: {e}")
+                            logger.error(f"Message error in Binance stream: {e}")
                             
             except ConnectionClosed:
-                subscription.is_connected = False
-                subscription.reconnect_attempts += 1
+                attempts = self._next_attempt(attempts, connected_at)
+                connected_at = None
+                self._set_binance_status(None, False, attempts)
                 
-                # Exponential backoff
-                backoff = min(2 ** subscription.reconnect_attempts, 32)
+                # Exponential backoff (jittered)
+                backoff = _reconnect_delay(attempts)
                 logger.warning(
-                    f"Connection closed for {stream_id}. "
-                    f"Reconnecting in {backoff}s (attempt {subscription.reconnect_attempts})"
+                    f"Binance connection closed. "
+                    f"Reconnecting in {backoff:.1f}s (attempt {attempts})"
                 )
                 await asyncio.sleep(backoff)
                 
             except Exception as e:
-                subscription.is_connected = False
-                subscription.reconnect_attempts += 1
-                logger.error(f"Error in {stream_id}: {e}")
-                await asyncio.sleep(5)
+                attempts = self._next_attempt(attempts, connected_at)
+                connected_at = None
+                self._set_binance_status(None, False, attempts)
+                logger.error(f"Error in Binance stream: {e}")
+                await asyncio.sleep(_reconnect_delay(attempts))
         
-        logger.error(f"Max reconnect attempts reached for {stream_id}")
-        subscription.is_connected = False
+        logger.error("Max reconnect attempts reached for Binance stream")
+        self._set_binance_status(None, False, attempts)
     
     def _normalize_message(
         self,
@@ -212,28 +392,36 @@ class WebSocketManager:
         """
         if subscription.exchange == "binance":
             if subscription.stream_type == "orderbook":
-                # Binance depth update format
-                return {
+                # Binance depth update format. Levels are parsed straight into
+                # (N, 2) float arrays (no per-level Python floats), which
+                # OrderBook.from_raw and the analytics kernels take as-is
+                message = {
                     "type": "orderbook",
                     "symbol": subscription.symbol,
                     "exchange": "binance",
-                    "bids": [[float(p), float(q)] for p, q in data.get("b", [])],
-                    "asks": [[float(p), float(q)] for p, q in data.get("a", [])],
-                    "timestamp": data.get("E", int(datetime.now().timestamp() * 1000)),
-                    "raw": data
+                    "bids": _levels_array(data.get("b", [])),
+                    "asks": _levels_array(data.get("a", [])),
+                    "timestamp": _event_time(data)
                 }
+                if self.include_raw:
+                    message["raw"] = data
+                return message
             elif subscription.stream_type == "ticker":
-                # Binance ticker format
+                # Binance ticker format (one C-level lookup; .get fallback for partial payloads)
+                try:
+                    last, volume, change, high, low = _ticker_fields(data)
+                except KeyError:
+                    last, volume, change, high, low = (data.get(k, 0) for k in _TICKER_KEYS)
                 return {
                     "type": "ticker",
                     "symbol": subscription.symbol,
                     "exchange": "binance",
-                    "last_price": float(data.get("c", 0)),
-                    "volume_24h": float(data.get("v", 0)),
-                    "price_change_24h_percent": float(data.get("P", 0)),
-                    "high_24h": float(data.get("h", 0)),
-                    "low_24h": float(data.get("l", 0)),
-                    "timestamp": data.get("E", int(datetime.now().timestamp() * 1000))
+                    "last_price": float(last),
+                    "volume_24h": float(volume),
+                    "price_change_24h_percent": float(change),
+                    "high_24h": float(high),
+                    "low_24h": float(low),
+                    "timestamp": _event_time(data)
                 }
         
         # Fallback: return raw data
@@ -256,12 +444,19 @@ class WebSocketManager:
             logger.warning(f"Stream {stream_id} not found")
             return
         
-        if subscription.websocket and subscription.is_connected:
-            await subscription.websocket.close()
+        # The socket is shared: reconnect without this stream rather than close it
+        if subscription.exchange == "binance":
+            self._binance_streams.pop(subscription.stream_name, None)
+            self._schedule_rebuild()
         
         del self.subscriptions[stream_id]
+        self._status_built_at = None
         if stream_id in self.callbacks:
             del self.callbacks[stream_id]
+        consumer = self._consumers.pop(stream_id, None)
+        if consumer:
+            consumer.cancel()
+        self._queues.pop(stream_id, None)
         
         logger.info(f"Unsubscribed from {stream_id}")
     
@@ -269,10 +464,18 @@ class WebSocketManager:
         """
         Get status of all active WebSocket streams.
         
+        The result is cached (treat it as read-only): it is rebuilt after a
+        subscription or connection change, or once it is _STATUS_MAX_AGE
+        old, so "last_message" can lag the live stream by that much.
+        
         Returns:
             Dictionary of stream statuses
         """
-        return {
+        now = time.monotonic()
+        if self._status_built_at is not None and now - self._status_built_at < _STATUS_MAX_AGE:
+            return self._status_cache
+        
+        self._status_cache = {
             stream_id: {
                 "symbol": sub.symbol,
                 "exchange": sub.exchange,
@@ -283,6 +486,8 @@ class WebSocketManager:
             }
             for stream_id, sub in self.subscriptions.items()
         }
+        self._status_built_at = now
+        return self._status_cache
     
     def get_stream_status(self, stream_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -12,20 +12,19 @@ Run with: streamlit run dashboard.py
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
 import asyncio
 import json
+import threading
 from datetime import datetime
 import time
 
 # Import Core Logic (Shared Library)
 # Note: These are now module-level functions we can import directly!
+# Only what the header needs is imported up front; pandas, plotly and the
+# strategy/trading stack (numpy + numba kernels) load inside the tabs using
+# them, so the ticker paints before those imports run on a cold start.
 from tools.exchange_tools import fetch_ticker, fetch_orderbook
-from tools.strategy_tools import get_trading_signal
-from tools.trading_tools import get_positions
 from tools.alert_tools import check_alerts
-from core.risk_engine import risk_engine
 
 # Page Config
 st.set_page_config(
@@ -61,9 +60,40 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Utils
+@st.cache_resource
+def get_loop() -> asyncio.AbstractEventLoop:
+    """
+    One event loop for the whole Streamlit server, run on a daemon thread.
+    
+    Loop-bound resources (the pooled exchange HTTP client, the aiosqlite
+    connection behind the alerts DB) are created once on it and reused on
+    every rerun instead of being rebuilt and torn down by asyncio.run().
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="dashboard-loop", daemon=True).start()
+    return loop
+
 def run_async(coro):
-    """Helper to run async tools in Streamlit."""
-    return asyncio.run(coro)
+    """Helper to run async tools in Streamlit (on the shared loop)."""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result()
+
+async def _load_all(symbol: str):
+    """Fetch ticker, orderbook and alerts concurrently (JSON strings, in that order)."""
+    return await asyncio.gather(
+        fetch_ticker(symbol),
+        fetch_orderbook(symbol),
+        check_alerts(unread_only=False)
+    )
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_all(symbol: str, time_bucket: int, refresh_token: int):
+    """
+    Cached _load_all: widget interactions rerun the script but reuse the data.
+    
+    time_bucket (now // refresh rate) expires entries after one refresh
+    interval; refresh_token is bumped by the Manual Refresh button.
+    """
+    return run_async(_load_all(symbol))
 
 # --- Sidebar ---
 st.sidebar.title("🧠 Agent Controls")
@@ -76,6 +106,7 @@ if auto_refresh:
     st.rerun()
 
 if st.sidebar.button("Manual Refresh"):
+    st.session_state["refresh_token"] = st.session_state.get("refresh_token", 0) + 1
     st.rerun()
 
 st.sidebar.markdown("---")
@@ -89,8 +120,10 @@ col_head_1, col_head_2 = st.columns([3, 1])
 
 # Fetch Data Wrapper
 try:
-    # 1. Ticker
-    ticker_json = run_async(fetch_ticker(symbol))
+    # Ticker, orderbook and alerts in one round of concurrent requests
+    ticker_json, ob_json, alerts_json = load_all(
+        symbol, int(time.time() // refresh_rate), st.session_state.get("refresh_token", 0)
+    )
     ticker = json.loads(ticker_json)
     if "error" in ticker:
         st.error(f"Error: {ticker['details']}")
@@ -112,7 +145,6 @@ try:
         st.subheader("Microstructure Analysis")
         
         # Orderbook Data
-        ob_json = run_async(fetch_orderbook(symbol))
         ob = json.loads(ob_json)
         bids = ob.get("bids", [])
         asks = ob.get("asks", [])
@@ -128,6 +160,8 @@ try:
             st.markdown("#### Order Book Depth")
             # Simple Bid/Ask Plot
             if bids and asks:
+                import plotly.graph_objects as go
+                
                 bid_prices = [p[0] for p in bids[:20]]
                 bid_sizes = [p[1] for p in bids[:20]]
                 ask_prices = [p[0] for p in asks[:20]]
@@ -147,6 +181,9 @@ try:
 
     # --- Tab 2: Strategy ---
     with tab2:
+        import pandas as pd
+        from tools.strategy_tools import get_trading_signal
+        
         st.subheader("Agent Reasoning")
         
         # Get Signal
@@ -189,6 +226,10 @@ try:
 
     # --- Tab 3: Execution ---
     with tab3:
+        import pandas as pd
+        from tools.trading_tools import get_positions
+        from core.risk_engine import risk_engine
+        
         st.subheader("Paper Trading Portfolio")
         
         pos_json = get_positions()
@@ -210,9 +251,10 @@ try:
 
     # --- Tab 4: Alerts ---
     with tab4:
+        import pandas as pd
+        
         st.subheader("System Alerts")
         
-        alerts_json = run_async(check_alerts(unread_only=False))
         alerts_data = json.loads(alerts_json)
         alerts_list = alerts_data.get("alerts", [])
         
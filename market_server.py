@@ -6,35 +6,15 @@ with broad market intelligence tools.
 """
 
 import os
-import httpx
+import json
+import importlib
 from pathlib import Path
 from dotenv import load_dotenv
 
 from mcp.server.fastmcp import FastMCP
 
-# Import tool registration functions
-from tools import (
-    register_price_tools,
-    register_microstructure_tools,
-    register_anomaly_tools,
-    register_sentiment_tools,
-    register_defi_tools,
-    register_exchange_tools,
-    register_ml_tools,
-    register_portfolio_tools,
-    register_alert_tools,
-    register_trading_tools,
-    register_strategy_tools,
-    register_agent_tools,
-    register_streaming_tools,
-)
+from tools.price_tools import get_coingecko_client
 from prompts import register_prompts
-from core.background_service import monitor
-from core.database import db
-
-# Import specific agent tools for custom registration
-import asyncio
-from tools.agent_tools import run_analysis_pipeline, get_agent_status, set_auto_execute, auto_trade
 
 # Load environment variables
 env_path = Path(__file__).parent / ".env"
@@ -43,23 +23,49 @@ load_dotenv(dotenv_path=env_path)
 # Initialize the MCP Server
 mcp = FastMCP("Market Intelligence")
 
-# Register all tools
-register_price_tools(mcp)
-register_microstructure_tools(mcp)
-register_anomaly_tools(mcp)
-register_sentiment_tools(mcp)
-register_defi_tools(mcp)
-register_exchange_tools(mcp)
-register_ml_tools(mcp)
-register_portfolio_tools(mcp)
-register_alert_tools(mcp)
-register_trading_tools(mcp)
-register_strategy_tools(mcp)
-register_agent_tools(mcp)
-register_streaming_tools(mcp)
+# Tool groups: name -> (module, registration function). Every group is
+# registered by default; setting MARKET_TOOL_GROUPS (comma-separated names,
+# e.g. "price,sentiment") registers only those, and the modules of the other
+# groups - with their numpy/numba/aiosqlite imports - are never loaded.
+TOOL_GROUPS = {
+    "price": ("tools.price_tools", "register_price_tools"),
+    "microstructure": ("tools.microstructure_tools", "register_microstructure_tools"),
+    "anomaly": ("tools.anomaly_tools", "register_anomaly_tools"),
+    "sentiment": ("tools.sentiment_tools", "register_sentiment_tools"),
+    "defi": ("tools.defi_tools", "register_defi_tools"),
+    "exchange": ("tools.exchange_tools", "register_exchange_tools"),
+    "ml": ("tools.ml_tools", "register_ml_tools"),
+    "portfolio": ("tools.portfolio_tools", "register_portfolio_tools"),
+    "alert": ("tools.alert_tools", "register_alert_tools"),
+    "trading": ("tools.trading_tools", "register_trading_tools"),
+    "strategy": ("tools.strategy_tools", "register_strategy_tools"),
+    "agent": ("tools.agent_tools", "register_agent_tools"),
+    "streaming": ("tools.streaming_tools", "register_streaming_tools"),
+}
+
+
+def _enabled_tool_groups() -> list:
+    """Tool groups to register, from MARKET_TOOL_GROUPS (default: all)."""
+    selected = os.getenv("MARKET_TOOL_GROUPS")
+    if not selected:
+        return list(TOOL_GROUPS)
+    groups = [name.strip() for name in selected.split(",") if name.strip()]
+    unknown = [name for name in groups if name not in TOOL_GROUPS]
+    if unknown:
+        raise ValueError(
+            f"Unknown tool group(s) in MARKET_TOOL_GROUPS: {', '.join(unknown)} "
+            f"(available: {', '.join(TOOL_GROUPS)})"
+        )
+    return groups
+
+
+# Register the enabled tool groups
+ENABLED_TOOL_GROUPS = _enabled_tool_groups()
+for _group in ENABLED_TOOL_GROUPS:
+    _module, _register = TOOL_GROUPS[_group]
+    getattr(importlib.import_module(_module), _register)(mcp)
 
 # Custom agent tool: Autonomous trading
-@mcp.tool()
 async def autonomous_trade(symbol: str, sentiment_score: float = 0.5, position_size: float = 0.01) -> str:
     """
     Autonomous trading: Analyze market and execute trade automatically.
@@ -76,8 +82,12 @@ async def autonomous_trade(symbol: str, sentiment_score: float = 0.5, position_s
     Returns:
         JSON with complete analysis + execution results
     """
+    from tools.agent_tools import auto_trade
     return await auto_trade(symbol, sentiment_score, position_size)
 
+if "agent" in ENABLED_TOOL_GROUPS:
+    mcp.tool()(autonomous_trade)
+
 # Register prompts
 register_prompts(mcp)
 
@@ -102,20 +112,14 @@ async def get_connectivity_status() -> str:
         "coingecko_status": "unknown"
     }
     
-    # Simple ping to CoinGecko
-    url = "https://api.coingecko.com/api/v3/ping"
-    headers = {"accept": "application/json"}
-    if api_key_configured:
-        headers["x-cg-demo-api-key"] = os.getenv("CRYPTO_API_KEY")
-        
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers, timeout=5.0)
-            status["coingecko_status"] = "reachable" if response.status_code == 200 else f"error_{response.status_code}"
-        except Exception as e:
-            status["coingecko_status"] = f"unreachable_{str(e)}"
+    # Simple ping to CoinGecko, over the price tools' keep-alive client
+    try:
+        response = await get_coingecko_client().get("/ping", timeout=5.0)
+        status["coingecko_status"] = "reachable" if response.status_code == 200 else f"error_{response.status_code}"
+    except Exception as e:
+        status["coingecko_status"] = f"unreachable_{str(e)}"
             
-    return str(status)
+    return json.dumps(status)
 
 def main():
     """Main entry point - currently supports stdio mode only"""
@@ -0,0 +1,25 @@
+"""
+Shared Test Helpers
+
+Plain functions rather than fixtures, so the test modules' __main__ runners
+can use them too (import with `from conftest import ...`).
+"""
+
+import sys
+import importlib
+from unittest.mock import patch
+
+
+def real_aiosqlite():
+    """The installed aiosqlite, even if another test module mocked it in sys.modules."""
+    mocked = sys.modules.pop("aiosqlite", None)
+    try:
+        return importlib.import_module("aiosqlite")
+    finally:
+        if mocked is not None:
+            sys.modules["aiosqlite"] = mocked
+
+
+def use_real_aiosqlite():
+    """Patch core.database onto the real aiosqlite, for tests on an in-memory Database."""
+    return patch("core.database.aiosqlite", real_aiosqlite())
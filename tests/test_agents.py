@@ -5,7 +5,6 @@ Tests the agent pipeline with proper mocking.
 
 import sys
 import os
-import json
 from unittest.mock import MagicMock, AsyncMock, patch
 
 # Add project root
@@ -34,8 +33,8 @@ sys.modules["aiosqlite"] = MagicMock()
 
 # Now import agents
 from agents.base_agent import AgentContext, AgentDecision, AgentAction
-from agents.risk_agent import RiskAgent
-from agents.execution_agent import ExecutionAgent
+from agents.risk_agent import RiskAgent, _risk_kernel, RISK_CONCENTRATION, RISK_EXTREME_FEAR
+from agents.execution_agent import ExecutionAgent, _invalidate_positions_cache
 from agents.manager_agent import ManagerAgent
 
 
@@ -95,6 +94,46 @@ def test_risk_agent():
     print("Risk Agent: PASS")
 
 
+def test_shared_decisions_are_not_aliased():
+    """Mutating a pipeline result must not leak into later flyweight decisions."""
+    print("\n--- Testing Shared Decision Isolation ---")
+    
+    risk_agent = RiskAgent()
+    ctx = AgentContext(symbol="BTC/USDT", price=50000.0)
+    with patch("agents.risk_agent._get_positions_cached", return_value={"balance_usd": 0, "positions": {}}):
+        decision = risk_agent.think(ctx)
+    assert decision is RiskAgent._HOLD_NO_CAPITAL
+    
+    # The flyweight's own metadata is read-only...
+    try:
+        decision.metadata["risk_level"] = "LOW"
+        assert False, "shared metadata should be read-only"
+    except TypeError:
+        pass
+    
+    # ...and what callers get back (context / to_dict) are their own copies
+    ctx = risk_agent.act(decision, ctx)
+    ctx.risk_assessment["risk_level"] = "LOW"
+    decision.to_dict()["metadata"]["risk_level"] = "LOW"
+    assert RiskAgent._HOLD_NO_CAPITAL.metadata["risk_level"] == "BLOCKED"
+    assert ExecutionAgent._HOLD_RISK.to_dict()["metadata"] == {"blocked_by": "risk"}
+    print("Shared Decision Isolation: PASS")
+
+def test_risk_kernel_flags():
+    """Test the numeric risk kernel's score and flag bits."""
+    print("\n--- Testing Risk Kernel ---")
+    
+    score, concentration, flags = _risk_kernel(10.0, 50000.0, 100000.0, 10.0, 0.10)
+    assert flags == RISK_CONCENTRATION | RISK_EXTREME_FEAR
+    assert abs(score - 0.5) < 1e-9
+    assert abs(concentration - 5.0) < 1e-9
+    
+    # Unknown sentiment (NaN) and no position: nothing trips
+    score, concentration, flags = _risk_kernel(0.0, 50000.0, 100000.0, float("nan"), 0.10)
+    assert (score, concentration, flags) == (0.0, 0.0, 0)
+    print("Risk Kernel: PASS")
+
+
 def test_execution_agent():
     """Test ExecutionAgent with mocked positions."""
     print("\n--- Testing Execution Agent ---")
@@ -108,13 +147,14 @@ def test_execution_agent():
         ml_prediction={"signal": "UP", "confidence": 0.8}
     )
     
-    # Mock get_positions
-    with patch("agents.execution_agent.get_positions") as mock_pos:
-        mock_pos.return_value = json.dumps({
+    # Mock get_positions (and drop any positions cached by earlier tests)
+    _invalidate_positions_cache()
+    with patch("agents.execution_agent.get_positions_dict") as mock_pos:
+        mock_pos.return_value = {
             "mode": "PAPER",
             "balance_usd": 50000.0,
             "positions": {}
-        })
+        }
         
         decision = exec_agent.think(ctx)
         print(f"Exec Decision: {decision.action.value} - {decision.rationale}")
@@ -126,38 +166,65 @@ def test_execution_agent():
             print(f"Execution Agent: HOLD (expected for low confidence)")
 
 
+def test_execution_agent_skips_positions_without_signal():
+    """Vetoed or non-actionable contexts shouldn't fetch positions."""
+    print("\n--- Testing Execution Agent Short-Circuit ---")
+    
+    exec_agent = ExecutionAgent()
+    _invalidate_positions_cache()
+    with patch("agents.execution_agent.get_positions_dict") as mock_pos:
+        vetoed = AgentContext(
+            symbol="ETH/USDT",
+            price=3000.0,
+            ml_prediction={"signal": "UP", "confidence": 0.9},
+            risk_assessment={"risk_score": 0.8}
+        )
+        assert exec_agent.think(vetoed).metadata == {"blocked_by": "risk"}
+        
+        weak = AgentContext(
+            symbol="ETH/USDT",
+            price=3000.0,
+            ml_prediction={"signal": "UP", "confidence": 0.4}
+        )
+        assert exec_agent.think(weak).action == AgentAction.HOLD
+        
+        mock_pos.assert_not_called()
+    print("Execution Agent Short-Circuit: PASS")
+
+
 def test_manager_pipeline():
     """Test the full ManagerAgent pipeline with mocks."""
     print("\n--- Testing Manager Agent Pipeline ---")
     
     manager = ManagerAgent()
+    _invalidate_positions_cache()
     
     # We need to mock the exchange calls in research agent
-    with patch("agents.research_agent.fetch_ticker") as mock_ticker, \
-         patch("agents.research_agent.fetch_orderbook") as mock_ob, \
-         patch("agents.execution_agent.get_positions") as mock_pos:
+    with patch("agents.research_agent.fetch_ticker_dict") as mock_ticker, \
+         patch("agents.research_agent.fetch_orderbook_dict") as mock_ob, \
+         patch("agents.execution_agent.get_positions_dict") as mock_pos:
         
         # Setup mocks
         async def mock_ticker_fn(*args, **kwargs):
-            return json.dumps({
+            return {
                 "symbol": "BTC/USDT",
                 "last_price": 50000.0,
                 "percentage_change": 2.5
-            })
+            }
         mock_ticker.side_effect = mock_ticker_fn
         
         async def mock_ob_fn(*args, **kwargs):
-            return json.dumps({
+            return {
                 "bids": [[49900, 1.0], [49800, 2.0]],
                 "asks": [[50100, 1.0], [50200, 2.0]]
-            })
+            }
         mock_ob.side_effect = mock_ob_fn
         
-        mock_pos.return_value = json.dumps({
+        mock_pos.return_value = {
             "mode": "PAPER",
             "balance_usd": 100000.0,
             "positions": {"BTC": 0.5}
-        })
+        }
         
         # Run pipeline
         result = manager.run_pipeline("BTC/USDT", sentiment_score=55.0)
@@ -168,12 +235,88 @@ def test_manager_pipeline():
         
         assert "final_decision" in result
         assert "context_messages" in result
+        assert all("timestamp" in m for m in result["context_messages"])
+        # Research runs once per pipeline (no second think after run)
+        assert mock_ticker.call_count == 1
+        assert mock_ob.call_count == 1
         print ("Manager Pipeline: PASS")
 
 
+def test_manager_execution_sees_risk_assessment():
+    """Execution planning runs after RiskAgent.act has populated risk_assessment."""
+    print("\n--- Testing Manager Stage Ordering ---")
+    
+    manager = ManagerAgent()
+    ctx = AgentContext(
+        symbol="BTC/USDT",
+        price=50000.0,
+        sentiment_score=10.0,
+        current_position=20.0,  # $1M position...
+        available_capital=100000.0,  # ...against $100k capital
+        ml_prediction={"signal": "UP", "confidence": 0.95}
+    )
+    research = AgentDecision("ResearchAgent", AgentAction.BUY, 0.9, "mocked")
+    
+    async def mock_research(context):
+        return research, context
+    
+    with patch.object(manager.research_agent, "think_and_act_async", side_effect=mock_research):
+        decision = manager.think(ctx)
+    
+    subs = {d["agent"]: d for d in decision.metadata["sub_decisions"]}
+    assert subs["RiskAgent"]["action"] == "ALERT"
+    assert subs["ExecutionAgent"]["action"] == "HOLD"
+    assert subs["ExecutionAgent"]["metadata"] == {"blocked_by": "risk"}
+    assert decision.action is AgentAction.HOLD
+    print("Manager Stage Ordering: PASS")
+
+
+def test_manager_pipeline_batch():
+    """Test multi-symbol fan-out returns results in input order."""
+    print("\n--- Testing Manager Agent Batch Pipeline ---")
+    
+    manager = ManagerAgent()
+    _invalidate_positions_cache()
+    
+    with patch("agents.research_agent.fetch_ticker_dict") as mock_ticker, \
+         patch("agents.research_agent.fetch_orderbook_dict") as mock_ob, \
+         patch("agents.execution_agent.get_positions_dict") as mock_pos:
+        
+        async def mock_ticker_fn(symbol, *args, **kwargs):
+            return {"symbol": symbol, "last_price": 100.0}
+        mock_ticker.side_effect = mock_ticker_fn
+        
+        async def mock_ob_fn(*args, **kwargs):
+            return {
+                "bids": [[99.9, 1.0], [99.8, 2.0]],
+                "asks": [[100.1, 1.0], [100.2, 2.0]]
+            }
+        mock_ob.side_effect = mock_ob_fn
+        
+        mock_pos.return_value = {
+            "mode": "PAPER",
+            "balance_usd": 100000.0,
+            "positions": {}
+        }
+        
+        symbols = ["BTC/USDT", "ETH/USDT", "SOL/USDT"]
+        results = manager.run_pipeline_batch(symbols, [40.0, 50.0, 60.0], concurrency_limit=2)
+        
+        assert len(results) == len(symbols)
+        for symbol, result in zip(symbols, results):
+            assert "final_decision" in result
+            assert symbol in result["research_report"]
+        print("Manager Batch Pipeline: PASS")
+
+
 if __name__ == "__main__":
     test_base_agent_structures()
     test_risk_agent()
+    test_shared_decisions_are_not_aliased()
+    test_risk_kernel_flags()
     test_execution_agent()
+    test_execution_agent_skips_positions_without_signal()
     test_manager_pipeline()
+    test_manager_execution_sees_risk_assessment()
+    test_manager_pipeline_batch()
     print("\n✅ All Phase 15 Tests Passed!")
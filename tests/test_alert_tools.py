@@ -7,7 +7,7 @@ import sys
 import os
 import json
 import asyncio
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -36,6 +36,7 @@ sys.modules["ccxt.async_support"] = mock_ccxt
 
 from tools.alert_tools import register_alert_tools
 from core.background_service import monitor
+from conftest import use_real_aiosqlite
 
 async def test_phase10():
     print("\n--- Testing Phase 10: Smart Notifications ---")
@@ -82,8 +83,49 @@ async def test_phase10():
     await monitor.stop()
     print("Monitor Stopped: PASS")
 
+def test_queued_alerts_are_persisted():
+    print("\n--- Testing Batched Alert Persistence ---")
+    from core.background_service import MarketMonitor
+    from core.database import Database
+    
+    async def run():
+        db = Database(":memory:")
+        await db.connect()
+        try:
+            with patch("core.background_service.db", db):
+                # get_alerts() flushes whatever is still queued
+                mon = MarketMonitor()
+                await mon.start()
+                for i in range(5):
+                    await mon.add_alert("BTC", f"queued {i}")
+                assert len(await mon.get_alerts()) == 5
+                
+                # stop() persists alerts queued before it
+                for i in range(3):
+                    await mon.add_alert("ETH", f"before stop {i}")
+                await mon.stop()
+                assert len(await db.get_alerts(limit=100)) == 8
+                
+                # flush() that meets stop()'s sentinel puts it back, so the
+                # flush task still exits after writing everything
+                mon = MarketMonitor()
+                await mon.start()
+                await mon.add_alert("SOL", "before sentinel")
+                mon._alert_q.put_nowait(None)
+                await mon.flush()
+                await asyncio.wait_for(mon._flush_task, timeout=1.0)
+                assert len(await db.get_alerts(limit=100)) == 9
+                await mon.stop()
+        finally:
+            await db.close()
+    
+    with use_real_aiosqlite():
+        asyncio.run(run())
+    print("Batched Alert Persistence: PASS")
+
 if __name__ == "__main__":
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     loop.run_until_complete(test_phase10())
+    test_queued_alerts_are_persisted()
     print("\nAll Phase 10 Tests Passed!")
@@ -7,6 +7,7 @@ import sys
 import os
 import asyncio
 import json
+import math
 from datetime import datetime
 from unittest.mock import MagicMock
 
@@ -70,6 +71,119 @@ def test_core_analytics():
     assert metrics_2.ofi > 0 # Buying pressure
     print("Core Analytics: PASS")
 
+def test_volatility_matches_reference():
+    print("\n--- Testing Analyzer Volatility ---")
+    analyzer = MicrostructureAnalyzer()
+    
+    mids = []
+    for i in range(25):
+        bid = 100.0 + (i % 4) * 0.05
+        mids.append((bid + bid + 0.1) / 2)
+        metrics = analyzer.analyze(OrderBook.from_raw([[bid, 5.0]], [[bid + 0.1, 5.0]]))
+    
+    # Reference: population std-dev of log returns over the last 20 mids
+    window = mids[-20:]
+    returns = [math.log(b / a) for a, b in zip(window, window[1:])]
+    mean = sum(returns) / len(returns)
+    expected = math.sqrt(sum((r - mean) ** 2 for r in returns) / len(returns))
+    
+    assert metrics.volatility is not None
+    assert abs(metrics.volatility - expected) < 1e-6
+    print("Analyzer Volatility: PASS")
+
+def test_analyze_many_matches_streaming():
+    print("\n--- Testing Batched analyze_many ---")
+    import numpy as np
+    
+    bid_prices = np.array([[100.0, 99.9], [100.05, 99.9], [100.0, 99.9]])
+    ask_prices = np.array([[100.1, 100.2], [100.1, 100.2], [100.15, 100.2]])
+    bid_vols = np.array([[10.0, 20.0], [15.0, 20.0], [12.0, 20.0]])
+    ask_vols = np.array([[10.0, 20.0], [10.0, 20.0], [8.0, 20.0]])
+    
+    # A longer random walk, so the OFI normalization window rolls over
+    rng = np.random.default_rng(3)
+    T, L = 120, 5
+    top = 100 + np.cumsum(rng.normal(0, 0.05, T))
+    walk_bids = top[:, None] - np.cumsum(rng.uniform(0.01, 0.1, (T, L)), axis=1)
+    walk_asks = top[:, None] + 0.1 + np.cumsum(rng.uniform(0.01, 0.1, (T, L)), axis=1)
+    
+    cases = [
+        (bid_prices, bid_vols, ask_prices, ask_vols),
+        (walk_bids, rng.uniform(0.1, 20, (T, L)), walk_asks, rng.uniform(0.1, 20, (T, L))),
+    ]
+    for bp, bv, ap, av in cases:
+        batch = MicrostructureAnalyzer(ofi_window=20).analyze_many(bp, bv, ap, av)
+        streaming = MicrostructureAnalyzer(ofi_window=20)
+        metrics = [
+            streaming.analyze(OrderBook.from_raw(np.stack([bp[t], bv[t]], axis=1),
+                                                 np.stack([ap[t], av[t]], axis=1)))
+            for t in range(bp.shape[0])
+        ]
+        
+        assert batch.shape == (bp.shape[0],)
+        # Same formulas, only summation order may differ
+        for name in ("mid_price", "ofi", "obi", "microprice", "depth_imbalance"):
+            np.testing.assert_allclose(batch[name], [getattr(m, name) for m in metrics],
+                                       rtol=1e-9, err_msg=name)
+    print("analyze_many: PASS")
+
+def test_ofi_window_zero():
+    print("\n--- Testing OFI With ofi_window=0 ---")
+    import numpy as np
+    
+    # No normalization window: OFI is returned raw, as with an empty history
+    analyzer = MicrostructureAnalyzer(ofi_window=0)
+    assert analyzer.analyze(OrderBook.from_raw([[100.0, 10.0]], [[100.1, 10.0]])).ofi == 0.0
+    m = analyzer.analyze(OrderBook.from_raw([[100.05, 15.0]], [[100.1, 10.0]]))
+    assert m.ofi == 15.0
+    
+    batch = MicrostructureAnalyzer(ofi_window=0).analyze_many(
+        np.array([[100.0], [100.05]]), np.array([[10.0], [15.0]]),
+        np.array([[100.1], [100.1]]), np.array([[10.0], [10.0]])
+    )
+    assert list(batch["ofi"]) == [0.0, 15.0]
+    print("OFI Window Zero: PASS")
+
+def test_order_book_normalizes_arrays():
+    print("\n--- Testing OrderBook Array Normalization ---")
+    import numpy as np
+    
+    raw = np.array([[100.0, 1.0], [99.0, 2.0], [98.0, 3.0]])
+    reference = MicrostructureAnalyzer().analyze(OrderBook.from_raw(raw, raw + [2.0, 0.0]))
+    
+    # Strided column views and integer arrays must give the same metrics
+    strided = OrderBook(raw[:, 0], raw[:, 1], raw[:, 0] + 2, raw[:, 1])
+    as_int = OrderBook(raw[:, 0].astype(np.int64), raw[:, 1].astype(np.int64),
+                       (raw[:, 0] + 2).astype(np.int64), raw[:, 1].astype(np.int64))
+    for book in (strided, as_int):
+        assert book.bid_prices.dtype == np.float64 and book.bid_prices.flags.c_contiguous
+        m = MicrostructureAnalyzer().analyze(book)
+        assert m.total_bid_depth == reference.total_bid_depth == 6.0
+        assert abs(m.obi - reference.obi) < 1e-12
+    print("OrderBook Normalization: PASS")
+
+def test_vpin_batch_matches_per_trade():
+    print("\n--- Testing Batched VPIN ---")
+    import numpy as np
+    
+    rng = np.random.default_rng(7)
+    volumes = rng.uniform(50, 400, size=600)
+    is_buy = rng.random(600) < 0.6
+    
+    single = MicrostructureAnalyzer(vpin_bucket_size=1000.0)
+    expected = [single.update_vpin(v, b) for v, b in zip(volumes, is_buy)]
+    
+    batched = MicrostructureAnalyzer(vpin_bucket_size=1000.0)
+    got = np.concatenate([
+        batched.update_vpin_batch(volumes[:250], is_buy[:250]),
+        batched.update_vpin_batch(volumes[250:], is_buy[250:]),
+    ])
+    
+    assert expected[-1] is not None
+    for e, g in zip(expected, got):
+        assert (e is None and math.isnan(g)) or abs(e - g) < 1e-12
+    print("Batched VPIN: PASS")
+
 def test_anomaly_detection():
     print("\n--- Testing Anomaly Detection ---")
     detector = AnomalyDetector()
@@ -102,6 +216,32 @@ def test_anomaly_detection():
     else:
         print("Liquidity gap detection: FAIL")
 
+def test_anomaly_kernel_matches_methods():
+    print("\n--- Testing Anomaly Kernel vs Detector Methods ---")
+    native = AnomalyDetector()
+    python = AnomalyDetector()
+    ts = datetime(2024, 1, 1)
+    
+    books = [
+        ([[100.0, 10.0], [99.0, 5000.0]], [[100.1, 10.0]]),
+        ([[100.0, 900.0], [99.9, 800.0], [99.8, 700.0]], [[100.1, 5.0], [100.2, 5.0]]),
+        ([[100.0, 120.0]], [[101.5, 130.0]]),
+        ([[100.0, 0.1]], [[100.1, 0.1]]),
+    ]
+    for bids, asks in books:
+        book = OrderBook.from_raw(bids, asks, ts)
+        assert native._analyze_native(book, ts).to_dict() == python._analyze_python(book, ts).to_dict()
+    assert native._spoofing_events == python._spoofing_events
+    
+    # Arrays swapped in after construction (strided, integer) reach the kernel intact
+    import numpy as np
+    raw = np.array([[100, 900, 101, 5], [99, 5000, 102, 5]])
+    book = OrderBook.from_raw([[100.0, 900.0], [99.0, 5000.0]], [[101.0, 5.0], [102.0, 5.0]], ts)
+    expected = AnomalyDetector()._analyze_native(book, ts).to_dict()
+    book.bid_prices, book.bid_vols, book.ask_prices, book.ask_vols = raw[:, 0], raw[:, 1], raw[:, 2], raw[:, 3]
+    assert AnomalyDetector()._analyze_native(book, ts).to_dict() == expected
+    print("Anomaly Kernel: PASS")
+
 def test_data_validation():
     print("\n--- Testing Data Validator ---")
     
@@ -119,6 +259,75 @@ def test_data_validation():
     assert any("Invalid book" in e for e in result.errors)
     print("Data Validation: PASS")
 
+def test_sanitize_levels():
+    print("\n--- Testing Level Sanitization ---")
+    import numpy as np
+    nan, inf = float("nan"), float("inf")
+    
+    # Ragged and non-pair rows are dropped instead of raising
+    assert DataValidator._sanitize_levels([[100.0, 1.0], [99.0]]) == [[100.0, 1.0]]
+    assert DataValidator._sanitize_levels([[100.0, 1.0], [99.0, 2.0, 3.0], "x"]) == [[100.0, 1.0]]
+    assert DataValidator._sanitize_levels([[100.0, 1.0, 0.0]]) == []
+    
+    # Non-finite prices default to 100.0, volumes to 0.0 (vectorized and per-row paths)
+    assert DataValidator._sanitize_levels([[nan, 1.0], [99.0, inf]]) == [[100.0, 1.0], [99.0, 0.0]]
+    assert DataValidator._sanitize_levels([[-inf, None], [99.0]]) == [[100.0, 0.0]]
+    
+    # Numeric (N, 2) ndarray: sanitized into a list, input left untouched
+    arr = np.array([[nan, 1.0], [99.0, -inf]])
+    assert DataValidator._sanitize_levels(arr) == [[100.0, 1.0], [99.0, 0.0]]
+    assert np.isnan(arr[0, 0]) and np.isneginf(arr[1, 1])
+    
+    assert DataValidator.sanitize_snapshot({"bids": [[nan, 1.0]], "asks": [[101.0]]}) == {
+        "bids": [[100.0, 1.0]], "asks": []
+    }
+    print("Level Sanitization: PASS")
+
+def test_level_validation_fast_paths():
+    print("\n--- Testing Level Validation Fast Paths ---")
+    
+    # Vectorized preflight accepts only clean numeric levels
+    assert DataValidator._levels_look_valid([[100.0, 1.0], [99.0, 0.0]])
+    assert DataValidator._levels_look_valid([(100.0, 1.0), (99.0, 2.0)])
+    assert not DataValidator._levels_look_valid([[100.0, -1.0]])
+    assert not DataValidator._levels_look_valid([[float("nan"), 1.0]])
+    assert not DataValidator._levels_look_valid([["100", "1"]])
+    assert not DataValidator._levels_look_valid([[100.0, 1.0], [99.0]])
+    
+    # Typed path: same errors for list and tuple levels, mixed shapes fall back per level
+    for make in (list, tuple):
+        errors = DataValidator._validate_levels([make((0.0, 1.0)), make((99.0, -2.0))], "bid")
+        assert errors == ["Bid level 0: invalid price 0.0", "Bid level 1: invalid volume -2.0"]
+    assert DataValidator._validate_levels([[100.0, 1.0], (99.0, float("inf")), [98.0]], "ask") == [
+        "Ask level 1: invalid volume inf", "Ask level 2: must be [price, volume]"
+    ]
+    
+    # Crossed-book check applies to tuple levels too
+    result = DataValidator.validate_snapshot({"bids": [(101.0, 1.0)], "asks": [(100.0, 1.0)]})
+    assert not result.is_valid
+    assert any("Invalid book" in e for e in result.errors)
+    assert DataValidator.validate_snapshot({"bids": [(100.0, 1.0)], "asks": [(100.1, 1.0)]}).is_valid
+    print("Level Validation Fast Paths: PASS")
+
+def test_spread_batch_tool_matches_scalar():
+    print("\n--- Testing Batched Spread Tool ---")
+    mock_mcp = MockFastMCP()
+    register_microstructure_tools(mock_mcp)
+    
+    bids = [100.0, 99.9, 101.0, 50.0]
+    asks = [100.01, 100.3, 100.5, 50.2]
+    batch = json.loads(mock_mcp.tools["analyze_bid_ask_spreads"](bids, asks))
+    assert batch["count"] == 4
+    for i, (bid, ask) in enumerate(zip(bids, asks)):
+        single = json.loads(mock_mcp.tools["analyze_bid_ask_spread"](bid, ask))
+        assert batch["valid"][i] == single["valid"]
+        if single["valid"]:
+            assert batch["liquidity_classification"][i] == single["liquidity_classification"]
+            assert batch["spread_basis_points"][i] == single["spread_basis_points"]
+        else:
+            assert batch["mid_price"][i] is None
+    print("Batched Spread Tool: PASS")
+
 async def test_mcp_tools():
     print("\n--- Testing MCP Tool Wrappers ---")
     mock_mcp = MockFastMCP()
@@ -148,7 +357,16 @@ async def test_mcp_tools():
 
 if __name__ == "__main__":
     test_core_analytics()
+    test_volatility_matches_reference()
+    test_analyze_many_matches_streaming()
+    test_ofi_window_zero()
+    test_order_book_normalizes_arrays()
+    test_vpin_batch_matches_per_trade()
     test_anomaly_detection()
+    test_anomaly_kernel_matches_methods()
     test_data_validation()
+    test_sanitize_levels()
+    test_level_validation_fast_paths()
+    test_spread_batch_tool_matches_scalar()
     asyncio.run(test_mcp_tools())
     print("\nAll Phase 1 & 2 Tests Passed!")
@@ -0,0 +1,56 @@
+"""
+Verification Tests for the Database Layer
+Tests concurrent writes on the shared SQLite connection (in-memory DB).
+"""
+
+import sys
+import os
+import asyncio
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import Database
+from conftest import use_real_aiosqlite
+
+def test_concurrent_writes():
+    print("\n--- Testing Concurrent Database Writes ---")
+
+    async def run():
+        db = Database(":memory:")
+        await db.connect()
+        try:
+            batch_a = [("2024-01-01T00:00:00", "BTC", f"a{i}", "INFO") for i in range(50)]
+            batch_b = [("2024-01-01T00:00:01", "ETH", f"b{i}", "WARNING") for i in range(50)]
+
+            # Two batch transactions plus single writes, all on the one connection
+            await asyncio.gather(
+                db.add_alerts(batch_a),
+                db.add_alerts(batch_b),
+                db.add_alert("SOL", "single"),
+                db.mark_all_read(),
+            )
+            alerts = await db.get_alerts(limit=1000)
+            assert len(alerts) == 101
+
+            # A failing batch rolls back without affecting the writes around it
+            bad_batch = [("2024-01-01T00:00:02", "BTC", "ok", "INFO"), (None, "BTC", "no timestamp", "INFO")]
+            results = await asyncio.gather(
+                db.add_alerts(bad_batch),
+                db.add_alert("XRP", "after"),
+                return_exceptions=True,
+            )
+            assert isinstance(results[0], Exception) and results[1] is None
+            alerts = await db.get_alerts(limit=1000)
+            assert len(alerts) == 102
+            assert all(a["message"] != "ok" for a in alerts)
+        finally:
+            await db.close()
+
+    with use_real_aiosqlite():
+        asyncio.run(run())
+    print("Concurrent Writes: PASS")
+
+if __name__ == "__main__":
+    test_concurrent_writes()
+    print("\nAll Database Tests Passed!")
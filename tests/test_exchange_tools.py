@@ -98,8 +98,26 @@ async def test_exchange_tools():
         assert "error" in result
         print("Invalid exchange handling: PASS")
 
+def test_client_pool_drops_closed_loops():
+    print("\n--- Testing Per-Loop Client Pool ---")
+    import httpx
+    from core.http_pool import LoopClientPool
+    
+    pool = LoopClientPool(httpx.AsyncClient)
+    loops = []  # kept alive, like loops still referenced by open connections
+    
+    async def use_pool():
+        loops.append(asyncio.get_running_loop())
+        assert pool.get() is pool.get()
+    
+    for _ in range(5):
+        asyncio.run(use_pool())
+    assert len(pool._clients) == 1
+    print("Client Pool Pruning: PASS")
+
 if __name__ == "__main__":
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     loop.run_until_complete(test_exchange_tools())
+    test_client_pool_drops_closed_loops()
     print("\nAll Phase 7 Tests Passed!")
@@ -31,6 +31,7 @@ sys.modules["mcp.server.fastmcp"].FastMCP = MockFastMCP
 
 from tools.sentiment_tools import register_sentiment_tools
 from tools.defi_tools import register_defi_tools
+from tools.price_tools import register_price_tools
 
 async def test_sentiment_tools():
     print("\n--- Testing Sentiment Tools ---")
@@ -49,10 +50,9 @@ async def test_sentiment_tools():
         }]
     }
     
-    with patch("httpx.AsyncClient") as mock_client_cls:
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-        mock_client_cls.return_value.__aenter__.return_value = mock_client
+    mock_client = AsyncMock()
+    mock_client.get.return_value = mock_response
+    with patch("tools.sentiment_tools._get_client", return_value=mock_client):
         
         result_json = await tool()
         result = json.loads(result_json)
@@ -79,10 +79,9 @@ async def test_defi_tools():
         {"name": "Solana", "tvl": 4000000000, "tokenSymbol": "SOL"}
     ]
     
-    with patch("httpx.AsyncClient") as mock_client_cls:
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_chains_response
-        mock_client_cls.return_value.__aenter__.return_value = mock_client
+    mock_client = AsyncMock()
+    mock_client.get.return_value = mock_chains_response
+    with patch("tools.defi_tools._get_client", return_value=mock_client):
         
         result_json = await tool_global()
         result = json.loads(result_json)
@@ -106,9 +105,53 @@ async def test_defi_tools():
     assert "error" in result # "ETHERSCAN_API_KEY not set"
     print("DeFi Gas Tracker (No Key): PASS")
 
+def test_price_fetch_coalescing_and_error_cache():
+    print("\n--- Testing Price Fetch Coalescing ---")
+    import httpx
+    from tenacity import wait_none
+    from tools import price_tools
+    
+    mock_mcp = MockFastMCP()
+    register_price_tools(mock_mcp)
+    tool = mock_mcp.tools["get_crypto_price"]
+    price_tools._price_cache.clear()
+    price_tools._price_error_cache.clear()
+    
+    async def get(url, params=None):
+        await asyncio.sleep(0.01)  # keep the request in flight while the others arrive
+        if params["ids"] == "badcoin":
+            raise httpx.ConnectError("connection refused")
+        response = MagicMock()
+        response.json.return_value = {params["ids"]: {"usd": 42.0}}
+        return response
+    
+    mock_client = MagicMock()
+    mock_client.get = AsyncMock(side_effect=get)
+    
+    async def run():
+        # Concurrent misses share one request
+        results = await asyncio.gather(*[tool("bitcoin") for _ in range(5)])
+        assert mock_client.get.await_count == 1
+        assert all(json.loads(r)["bitcoin"]["usd"] == 42.0 for r in results)
+        
+        # A failure (after the 3 retries) reaches every waiter and is cached
+        mock_client.get.reset_mock()
+        results = await asyncio.gather(*[tool("badcoin") for _ in range(3)])
+        assert mock_client.get.await_count == 3
+        assert all("error" in json.loads(r) for r in results)
+        assert json.loads(await tool("badcoin"))["details"] == "connection refused"
+        assert mock_client.get.await_count == 3
+    
+    fast_retry = price_tools._fetch_with_retry.retry_with(wait=wait_none())
+    with patch("tools.price_tools.get_coingecko_client", return_value=mock_client), \
+         patch("tools.price_tools._fetch_with_retry", fast_retry):
+        asyncio.run(run())
+    print("Price Coalescing / Error Cache: PASS")
+
 if __name__ == "__main__":
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     loop.run_until_complete(test_sentiment_tools())
     loop.run_until_complete(test_defi_tools())
+    test_price_fetch_coalescing_and_error_cache()
     print("\nAll Phase 4 Tests Passed!")
@@ -105,6 +105,31 @@ def test_ml_tools():
     assert "regime" in res_vol
     print("Volatility Analysis: PASS")
 
+def test_predict_batch_matches_predict():
+    print("\n--- Testing Batched DeepLOB Lite ---")
+    import numpy as np
+    from core.ml_models import DeepLOBLite
+    
+    rng = np.random.default_rng(3)
+    T, L = 50, 3
+    bid_prices = 100.0 - np.cumsum(rng.uniform(0.01, 0.05, (T, L)), axis=1)
+    ask_prices = 100.1 + np.cumsum(rng.uniform(0.01, 0.05, (T, L)), axis=1)
+    bid_vols = rng.exponential(20.0, (T, L))
+    ask_vols = rng.exponential(20.0, (T, L))
+    
+    batch = DeepLOBLite().predict_batch(bid_prices, bid_vols, ask_prices, ask_vols)
+    streaming = DeepLOBLite()
+    fast = DeepLOBLite()
+    for t in range(T):
+        bids = np.stack([bid_prices[t], bid_vols[t]], axis=1)
+        asks = np.stack([ask_prices[t], ask_vols[t]], axis=1)
+        res = streaming.predict(bids, asks)
+        assert res["signal"] == batch["signal"][t]
+        assert fast.predict_fast(bids, asks) == res["signal"]
+        assert abs(res["confidence"] - batch["confidence"][t]) < 1e-9
+    print("Batched Prediction: PASS")
+
 if __name__ == "__main__":
     test_ml_tools()
+    test_predict_batch_matches_predict()
     print("\nAll Phase 8 Tests Passed!")
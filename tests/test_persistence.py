@@ -115,9 +115,10 @@ async def test_persistence():
     print("Reading from DB...")
     
     # Inject Mock Data into the cursor for the next fetchall
+    # (plain tuples in the unread query's column order: id, timestamp, symbol, message, severity)
     mock_conn.cursor.rows = [
-        {"id": 1, "timestamp": "2023-01-01", "symbol": "SYSTEM", "message": "Alert created for ETH BELOW 2000.0", "severity": "INFO", "is_read": 0},
-        {"id": 2, "timestamp": "2023-01-01", "symbol": "SYSTEM", "message": "Hourly heartbeat check", "severity": "INFO", "is_read": 0}
+        (1, "2023-01-01", "SYSTEM", "Alert created for ETH BELOW 2000.0", "INFO"),
+        (2, "2023-01-01", "SYSTEM", "Hourly heartbeat check", "INFO")
     ]
     
     res_check = json.loads(await check_alerts(unread_only=True))
@@ -144,7 +145,7 @@ async def test_persistence():
     assert found
     print("Persistence Read/Write: PASS")
     
-    # 4. Verify Data Structure (Row to dict conversion)
+    # 4. Verify Data Structure (tuple to dict conversion)
     first = res_check["alerts"][0]
     assert "timestamp" in first
     assert "is_read" in first
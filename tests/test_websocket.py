@@ -11,9 +11,47 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import pytest
 import asyncio
 import json
+from contextlib import asynccontextmanager
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 
 
+class FakeSocket:
+    """Stands in for a websockets connection; frames are fed in through a queue."""
+    
+    def __init__(self, url):
+        self.url = url
+        self.frames = asyncio.Queue()
+        self.closed = False
+    
+    async def recv(self, decode=True):
+        return await self.frames.get()
+    
+    def push(self, stream, data):
+        self.frames.put_nowait(json.dumps({"stream": stream, "data": data}).encode())
+
+
+def fake_connect(sockets):
+    """A websockets.connect replacement that records every socket it opens."""
+    def connect(url):
+        sock = FakeSocket(url)
+        sockets.append(sock)
+        
+        @asynccontextmanager
+        async def session():
+            try:
+                yield sock
+            finally:
+                sock.closed = True
+        return session()
+    return connect
+
+
+async def settle():
+    """Let debounced rebuilds, receive loops and consumers run."""
+    from core.websocket_manager import _RESUBSCRIBE_DEBOUNCE
+    await asyncio.sleep(_RESUBSCRIBE_DEBOUNCE * 3)
+
+
 def test_stream_subscription_dataclass():
     """Test StreamSubscription dataclass creation"""
     from core.websocket_manager import StreamSubscription
@@ -80,6 +118,123 @@ async def test_stream_subscription_lifecycle():
     print("✅ Stream unsubscription: PASS")
 
 
+def test_combined_stream_routing_and_rebuild():
+    """One combined Binance socket: routing by stream name, debounced rebuilds, teardown"""
+    from core.websocket_manager import WebSocketManager, _BINANCE_COMBINED_URL
+    
+    async def run():
+        manager = WebSocketManager()
+        sockets = []
+        received = []
+        with patch('core.websocket_manager.websockets.connect', fake_connect(sockets)):
+            btc = await manager.subscribe_binance_orderbook("BTC/USDT", received.append)
+            eth = await manager.subscribe_binance_ticker("ETH/USDT", received.append)
+            await settle()
+            
+            # Both subscriptions share a single connection
+            assert len(sockets) == 1
+            assert sockets[0].url == _BINANCE_COMBINED_URL + "btcusdt@depth20/ethusdt@ticker"
+            assert manager.get_stream_status(btc)["connected"] is True
+            
+            # Frames are routed by their "stream" field; unknown streams are ignored
+            sockets[0].push("ethusdt@ticker", {"c": "3000", "v": "1", "P": "0", "h": "3100", "l": "2900"})
+            sockets[0].push("xrpusdt@ticker", {"c": "1"})
+            sockets[0].push("btcusdt@depth20", {"b": [["50000", "1"]], "a": [["50100", "2"]]})
+            await settle()
+            assert [(m["type"], m["symbol"]) for m in received] == [
+                ("ticker", "ETH/USDT"), ("orderbook", "BTC/USDT")
+            ]
+            
+            # Re-subscribing at another depth replaces the old stream
+            await manager.subscribe_binance_orderbook("BTC/USDT", received.append, depth=5)
+            await settle()
+            assert len(sockets) == 2 and sockets[0].closed
+            assert sockets[1].url == _BINANCE_COMBINED_URL + "ethusdt@ticker/btcusdt@depth5"
+            sockets[1].push("btcusdt@depth20", {"b": [], "a": []})
+            sockets[1].push("btcusdt@depth5", {"b": [["50001", "1"]], "a": [["50101", "1"]]})
+            await settle()
+            assert len(received) == 3 and received[-1]["bids"][0].tolist() == [50001.0, 1.0]
+            
+            # Unsubscribing rebuilds without the stream...
+            await manager.unsubscribe(eth)
+            await settle()
+            assert len(sockets) == 3 and sockets[1].closed
+            assert sockets[2].url == _BINANCE_COMBINED_URL + "btcusdt@depth5"
+            
+            # ...and removing the last one tears the connection down
+            await manager.unsubscribe(btc)
+            await settle()
+            assert len(sockets) == 3 and sockets[2].closed
+            assert manager._binance_task is None
+    
+    asyncio.run(run())
+    print("✅ Combined stream routing and rebuild: PASS")
+
+
+def test_stream_queue_drops_oldest():
+    """A full stream queue evicts its oldest message; sync and async callbacks run in the consumer"""
+    from core.websocket_manager import WebSocketManager, StreamSubscription, _STREAM_QUEUE_SIZE
+    
+    def subscription(stream_id):
+        return StreamSubscription(
+            stream_id=stream_id,
+            symbol="BTC/USDT",
+            exchange="binance",
+            stream_type="ticker",
+            websocket=None,
+            is_connected=True,
+            reconnect_attempts=0,
+            last_message_time=None
+        )
+    
+    async def run():
+        manager = WebSocketManager()
+        received = []
+        tasks = set()
+        
+        async def async_callback(message):
+            tasks.add(asyncio.current_task())
+            received.append(message)
+        
+        def sync_callback(message):
+            tasks.add(asyncio.current_task())
+            received.append(message)
+        
+        manager._register(subscription("async"), async_callback)
+        manager._register(subscription("sync"), sync_callback)
+        
+        # The consumers can't run until we yield, so the queue overflows
+        for i in range(_STREAM_QUEUE_SIZE + 3):
+            manager._enqueue("async", i)
+        manager._enqueue("sync", "tick")
+        assert manager._queues["async"].qsize() == _STREAM_QUEUE_SIZE
+        
+        await settle()
+        assert received == list(range(3, _STREAM_QUEUE_SIZE + 3)) + ["tick"]
+        assert tasks == {manager._consumers["async"], manager._consumers["sync"]}
+        
+        for stream_id in ("async", "sync"):
+            await manager.unsubscribe(stream_id)
+    
+    asyncio.run(run())
+    print("✅ Stream queue drop-oldest: PASS")
+
+
+def test_reconnect_attempts_reset_after_stable_session():
+    """Only a session longer than _STABLE_SESSION resets the reconnect attempt count"""
+    import time
+    from core.websocket_manager import WebSocketManager, _STABLE_SESSION
+    
+    now = time.monotonic()
+    # Never connected, or dropped soon after connecting: keep counting
+    assert WebSocketManager._next_attempt(3, None) == 4
+    assert WebSocketManager._next_attempt(3, now) == 4
+    assert WebSocketManager._next_attempt(3, now - _STABLE_SESSION / 2) == 4
+    # A stable session starts the count over
+    assert WebSocketManager._next_attempt(3, now - _STABLE_SESSION - 1) == 1
+    print("✅ Reconnect attempt reset: PASS")
+
+
 def test_message_normalization_binance_orderbook():
     """Test Binance orderbook message normalization"""
     from core.websocket_manager import WebSocketManager, StreamSubscription
@@ -113,8 +268,9 @@ def test_message_normalization_binance_orderbook():
     assert normalized["exchange"] == "binance"
     assert len(normalized["bids"]) == 2
     assert len(normalized["asks"]) == 2
-    assert normalized["bids"][0] == [50000.0, 0.1]
-    assert normalized["asks"][0] == [50100.0, 0.15]
+    assert normalized["bids"].shape == (2, 2)
+    assert normalized["bids"][0].tolist() == [50000.0, 0.1]
+    assert normalized["asks"][0].tolist() == [50100.0, 0.15]
     print("✅ Binance orderbook normalization: PASS")
 
 
@@ -293,6 +449,9 @@ if __name__ == "__main__":
     test_get_active_streams()
     test_get_stream_status()
     test_streaming_tools_get_active_streams()
+    test_combined_stream_routing_and_rebuild()
+    test_stream_queue_drops_oldest()
+    test_reconnect_attempts_reset_after_stable_session()
     
     # Async tests (run with asyncio)
     asyncio.run(test_stream_subscription_lifecycle())
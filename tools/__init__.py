@@ -2,23 +2,32 @@
 Market Intelligence MCP Server - Tools Package
 
 This package contains MCP tool implementations for market analysis.
+
+Registration functions are imported lazily (PEP 562), so importing one tool
+module (e.g. the dashboard's tools.exchange_tools) doesn't pull in every
+tool's dependencies.
 """
 
-from .price_tools import register_price_tools
-from .microstructure_tools import register_microstructure_tools
-from .anomaly_tools import register_anomaly_tools
-from .sentiment_tools import register_sentiment_tools
-from .defi_tools import register_defi_tools
-from .exchange_tools import register_exchange_tools
-from .ml_tools import register_ml_tools
-from .portfolio_tools import register_portfolio_tools
-from .alert_tools import register_alert_tools
-from .trading_tools import register_trading_tools
-from .strategy_tools import register_strategy_tools
-from .agent_tools import register_agent_tools
-from .streaming_tools import register_streaming_tools
-
-__all__ = [
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    "register_price_tools": ".price_tools",
+    "register_microstructure_tools": ".microstructure_tools",
+    "register_anomaly_tools": ".anomaly_tools",
+    "register_sentiment_tools": ".sentiment_tools",
+    "register_defi_tools": ".defi_tools",
+    "register_exchange_tools": ".exchange_tools",
+    "register_ml_tools": ".ml_tools",
+    "register_portfolio_tools": ".portfolio_tools",
+    "register_alert_tools": ".alert_tools",
+    "register_trading_tools": ".trading_tools",
+    "register_strategy_tools": ".strategy_tools",
+    "register_agent_tools": ".agent_tools",
+    "register_streaming_tools": ".streaming_tools",
+}
+
+__all__ = (
     "register_price_tools",
     "register_microstructure_tools",
     "register_anomaly_tools",
@@ -32,4 +41,17 @@ __all__ = [
     "register_strategy_tools",
     "register_agent_tools",
     "register_streaming_tools",
-]
+)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(__all__))
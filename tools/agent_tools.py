@@ -118,7 +118,7 @@ async def auto_trade(symbol: str, sentiment_score: float = 0.5, position_size: f
     try:
         # Run full analysis
         manager = ManagerAgent()
-        analysis = await manager.run_pipeline(symbol, sentiment_score)
+        analysis = await manager.run_pipeline_async(symbol, sentiment_score)
         
         final_decision = analysis.get("final_decision")
         confidence = analysis.get("confidence", 0)
@@ -16,7 +16,8 @@ from core.anomaly_detection import (
     AnomalyDetector,
     MarketState,
     MarketRegime,
-    AnomalyType
+    AnomalyType,
+    AnomalySeverity
 )
 from core.data_validator import validate_order_book
 
@@ -94,7 +95,7 @@ def register_anomaly_tools(mcp: FastMCP) -> None:
             "anomalies": [a.to_dict() for a in state.anomalies],
             "anomaly_count": len(state.anomalies),
             "has_critical_anomalies": any(
-                a.severity.value == "critical" for a in state.anomalies
+                a.severity is AnomalySeverity.CRITICAL for a in state.anomalies
             ),
             "timestamp": datetime.now().isoformat()
         })
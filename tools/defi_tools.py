@@ -13,12 +13,18 @@ import httpx
 from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
 
+from core.http_pool import LoopClientPool
+
 # Cache for API responses
 _defi_cache: TTLCache = TTLCache(maxsize=50, ttl=300)  # 5 min TTL
 _chain_cache: TTLCache = TTLCache(maxsize=20, ttl=60)   # 1 min TTL
 
 DEFI_LLAMA_BASE = "https://api.llama.fi"
 
+# Keep-alive HTTP client per event loop, shared by the DeFi Llama and Etherscan calls
+_CLIENTS = LoopClientPool(httpx.AsyncClient)
+_get_client = _CLIENTS.get
+
 def register_defi_tools(mcp: FastMCP) -> None:
     """
     Register DeFi and blockchain data MCP tools.
@@ -41,10 +47,9 @@ def register_defi_tools(mcp: FastMCP) -> None:
         url = f"{DEFI_LLAMA_BASE}/v2/chains"
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, timeout=10.0)
-                response.raise_for_status()
-                data = response.json()
+            response = await _get_client().get(url, timeout=10.0)
+            response.raise_for_status()
+            data = response.json()
             
             # Calculate total TVL and top chains
             total_tvl = sum(c.get("tvl", 0) for c in data)
@@ -93,10 +98,9 @@ def register_defi_tools(mcp: FastMCP) -> None:
         url = f"{DEFI_LLAMA_BASE}/protocol/{protocol_slug}"
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, timeout=10.0)
-                response.raise_for_status()
-                data = response.json()
+            response = await _get_client().get(url, timeout=10.0)
+            response.raise_for_status()
+            data = response.json()
                 
             result = {
                 "name": data.get("name"),
@@ -152,10 +156,9 @@ def register_defi_tools(mcp: FastMCP) -> None:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params, timeout=10.0)
-                # Etherscan returns 200 even on error, check status field
-                data = response.json()
+            response = await _get_client().get(url, params=params, timeout=10.0)
+            # Etherscan returns 200 even on error, check status field
+            data = response.json()
                 
             if data.get("status") != "1" and api_key:
                  # Error from API (or key invalid)
@@ -16,6 +16,15 @@ from typing import Optional, Dict, Any, List
 import httpx
 from mcp.server.fastmcp import FastMCP
 
+from core.http_pool import LoopClientPool
+
+# orjson parses exchange payloads several times faster; it is optional
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # Exchange API endpoints
 EXCHANGE_APIS = {
     "binance": {
@@ -38,6 +47,11 @@ EXCHANGE_FALLBACK_ORDER = ["binance", "kraken", "coinbase"]
 # Supported exchanges
 SUPPORTED_EXCHANGES = list(EXCHANGE_APIS.keys())
 
+# Keep-alive HTTP client shared by all exchange calls on an event loop
+_CLIENT_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60.0)
+_CLIENTS = LoopClientPool(lambda: httpx.AsyncClient(timeout=30.0, limits=_CLIENT_LIMITS))
+_get_client = _CLIENTS.get
+
 
 def _convert_symbol(symbol: str, exchange: str) -> str:
     """Convert unified symbol format to exchange-specific format"""
@@ -55,7 +69,11 @@ def _convert_symbol(symbol: str, exchange: str) -> str:
     return symbol
 
 
-async def _fetch_binance_orderbook(symbol: str, limit: int) -> Dict[str, Any]:
+async def _fetch_binance_orderbook(
+    symbol: str,
+    limit: int,
+    client: Optional[httpx.AsyncClient] = None
+) -> Dict[str, Any]:
     """Fetch orderbook from Binance using direct API"""
     import sys
     
@@ -65,19 +83,23 @@ async def _fetch_binance_orderbook(symbol: str, limit: int) -> Dict[str, Any]:
     
     print(f"[DEBUG] Binance API: GET {url}?symbol={symbol_formatted}&limit={limit}", file=sys.stderr)
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        return {
-            "bids": [[float(p), float(q)] for p, q in data.get("bids", [])],
-            "asks": [[float(p), float(q)] for p, q in data.get("asks", [])],
-            "timestamp": data.get("lastUpdateId")
-        }
+    client = client or _get_client()
+    response = await client.get(url, params=params)
+    response.raise_for_status()
+    data = _loads(response.content)
+    
+    return {
+        "bids": [[float(p), float(q)] for p, q in data.get("bids", [])],
+        "asks": [[float(p), float(q)] for p, q in data.get("asks", [])],
+        "timestamp": data.get("lastUpdateId")
+    }
 
 
-async def _fetch_kraken_orderbook(symbol: str, limit: int) -> Dict[str, Any]:
+async def _fetch_kraken_orderbook(
+    symbol: str,
+    limit: int,
+    client: Optional[httpx.AsyncClient] = None
+) -> Dict[str, Any]:
     """Fetch orderbook from Kraken using direct API"""
     import sys
     
@@ -87,26 +109,30 @@ async def _fetch_kraken_orderbook(symbol: str, limit: int) -> Dict[str, Any]:
     
     print(f"[DEBUG] Kraken API: GET {url}?pair={symbol_formatted}&count={limit}", file=sys.stderr)
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        if data.get("error"):
-            raise Exception(f"Kraken API error: {data['error']}")
-        
-        # Kraken returns data with pair as key
-        result_key = list(data["result"].keys())[0]
-        orderbook = data["result"][result_key]
-        
-        return {
-            "bids": [[float(p), float(q)] for p, q, _ in orderbook.get("bids", [])],
-            "asks": [[float(p), float(q)] for p, q, _ in orderbook.get("asks", [])],
-            "timestamp": None
-        }
+    client = client or _get_client()
+    response = await client.get(url, params=params)
+    response.raise_for_status()
+    data = _loads(response.content)
+    
+    if data.get("error"):
+        raise Exception(f"Kraken API error: {data['error']}")
+    
+    # Kraken returns data with pair as key
+    result_key = list(data["result"].keys())[0]
+    orderbook = data["result"][result_key]
+    
+    return {
+        "bids": [[float(p), float(q)] for p, q, _ in orderbook.get("bids", [])],
+        "asks": [[float(p), float(q)] for p, q, _ in orderbook.get("asks", [])],
+        "timestamp": None
+    }
 
 
-async def _fetch_coinbase_orderbook(symbol: str, limit: int) -> Dict[str, Any]:
+async def _fetch_coinbase_orderbook(
+    symbol: str,
+    limit: int,
+    client: Optional[httpx.AsyncClient] = None
+) -> Dict[str, Any]:
     """Fetch orderbook from Coinbase using direct API"""
     import sys
     
@@ -116,39 +142,39 @@ async def _fetch_coinbase_orderbook(symbol: str, limit: int) -> Dict[str, Any]:
     
     print(f"[DEBUG] Coinbase API: GET {url}", file=sys.stderr)
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        return {
-            "bids": [[float(p), float(q)] for p, q, _ in data.get("bids", [])[:limit]],
-            "asks": [[float(p), float(q)] for p, q, _ in data.get("asks", [])[:limit]],
-            "timestamp": data.get("sequence")
-        }
+    client = client or _get_client()
+    response = await client.get(url, params=params)
+    response.raise_for_status()
+    data = _loads(response.content)
+    
+    return {
+        "bids": [[float(p), float(q)] for p, q, _ in data.get("bids", [])[:limit]],
+        "asks": [[float(p), float(q)] for p, q, _ in data.get("asks", [])[:limit]],
+        "timestamp": data.get("sequence")
+    }
+
+
+# Raw REST depth fetcher per exchange (tried in EXCHANGE_FALLBACK_ORDER)
+_ORDERBOOK_FETCHERS = {
+    "binance": _fetch_binance_orderbook,
+    "kraken": _fetch_kraken_orderbook,
+    "coinbase": _fetch_coinbase_orderbook,
+}
 
 
 # --- Shared Tools (Accessible by Dashboard & MCP) ---
 
-async def fetch_orderbook(
+async def fetch_orderbook_dict(
     symbol: str,
     exchange: str = "binance",
     limit: int = 20,
-    fallback: bool = True
-) -> str:
+    fallback: bool = True,
+    client: Optional[httpx.AsyncClient] = None
+) -> Dict[str, Any]:
     """
-    Fetch real-time Level 2 order book data with multi-exchange fallback.
+    Same as fetch_orderbook() but returns the raw dict (for in-process callers).
     
-    **NEW:** Uses direct HTTP API calls (no CCXT dependency issues!)
-    
-    Args:
-        symbol: Trading pair symbol (e.g., 'BTC/USDT', 'ETH/USD').
-        exchange: Exchange name (default: 'binance').
-        limit: Depth of the order book (default: 20).
-        fallback: Enable multi-exchange fallback (default: True).
-        
-    Returns:
-        JSON string with 'bids', 'asks', 'symbol', and 'timestamp'.
+    client defaults to the pooled client for the running event loop.
     """
     # If fallback is enabled, try multiple exchanges
     exchanges_to_try = [exchange]
@@ -166,14 +192,10 @@ async def fetch_orderbook(
             print(f"[INFO] Fetching orderbook for {symbol} from {attempt_exchange}", file=sys.stderr)
             
             # Call exchange-specific function
-            if attempt_exchange == "binance":
-                orderbook = await _fetch_binance_orderbook(symbol, limit)
-            elif attempt_exchange == "kraken":
-                orderbook = await _fetch_kraken_orderbook(symbol, limit)
-            elif attempt_exchange == "coinbase":
-                orderbook = await _fetch_coinbase_orderbook(symbol, limit)
-            else:
+            fetcher = _ORDERBOOK_FETCHERS.get(attempt_exchange)
+            if fetcher is None:
                 raise ValueError(f"Exchange {attempt_exchange} not supported yet")
+            orderbook = await fetcher(symbol, limit, client)
             
             print(f"[SUCCESS] Got {len(orderbook['bids'])} bids, {len(orderbook['asks'])} asks", file=sys.stderr)
             
@@ -187,7 +209,7 @@ async def fetch_orderbook(
                 "fallback_used": attempt_exchange != exchange
             }
             
-            return json.dumps(result)
+            return result
             
         except Exception as e:
             import sys
@@ -202,27 +224,47 @@ async def fetch_orderbook(
     # All exchanges failed
     import sys
     print(f"[ERROR] All exchanges failed. Last error: {last_error}", file=sys.stderr)
-    return json.dumps({
+    return {
         "error": "Failed to fetch order book from all exchanges",
         "requested_exchange": exchange,
         "attempted_exchanges": exchanges_to_try,
         "last_error": str(last_error),
         "error_type": type(last_error).__name__
-    })
+    }
 
 
-async def fetch_ticker(symbol: str, exchange: str = "binance") -> str:
+async def fetch_orderbook(
+    symbol: str,
+    exchange: str = "binance",
+    limit: int = 20,
+    fallback: bool = True
+) -> str:
     """
-    Fetch 24-hour ticker data using direct HTTP API.
+    Fetch real-time Level 2 order book data with multi-exchange fallback.
     
-    **NEW:** No CCXT dependency!
+    **NEW:** Uses direct HTTP API calls (no CCXT dependency issues!)
     
     Args:
-        symbol: Trading pair symbol (e.g., 'BTC/USDT').
+        symbol: Trading pair symbol (e.g., 'BTC/USDT', 'ETH/USD').
         exchange: Exchange name (default: 'binance').
+        limit: Depth of the order book (default: 20).
+        fallback: Enable multi-exchange fallback (default: True).
         
     Returns:
-        JSON string with ticker data.
+        JSON string with 'bids', 'asks', 'symbol', and 'timestamp'.
+    """
+    return json.dumps(await fetch_orderbook_dict(symbol, exchange, limit, fallback))
+
+
+async def fetch_ticker_dict(
+    symbol: str,
+    exchange: str = "binance",
+    client: Optional[httpx.AsyncClient] = None
+) -> Dict[str, Any]:
+    """
+    Same as fetch_ticker() but returns the raw dict (for in-process callers).
+    
+    client defaults to the pooled client for the running event loop.
     """
     try:
         import sys
@@ -233,40 +275,56 @@ async def fetch_ticker(symbol: str, exchange: str = "binance") -> str:
             url = EXCHANGE_APIS["binance"]["ticker"]
             params = {"symbol": symbol_formatted}
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-                
-                result = {
-                    "symbol": symbol.upper(),
-                    "exchange": "binance",
-                    "last_price": float(data.get("lastPrice", 0)),
-                    "volume_24h": float(data.get("volume", 0)),
-                    "quote_volume_24h": float(data.get("quoteVolume", 0)),
-                    "price_change_24h": float(data.get("priceChange", 0)),
-                    "price_change_percent_24h": float(data.get("priceChangePercent", 0)),
-                    "high_24h": float(data.get("highPrice", 0)),
-                    "low_24h": float(data.get("lowPrice", 0)),
-                    "bid": float(data.get("bidPrice", 0)),
-                    "ask": float(data.get("askPrice", 0)),
-                    "timestamp": datetime.now().isoformat()
-                }
-                
-                print(f"[SUCCESS] Ticker: ${result['last_price']}", file=sys.stderr)
-                return json.dumps(result)
-                
+            client = client or _get_client()
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            data = _loads(response.content)
+            
+            result = {
+                "symbol": symbol.upper(),
+                "exchange": "binance",
+                "last_price": float(data.get("lastPrice", 0)),
+                "volume_24h": float(data.get("volume", 0)),
+                "quote_volume_24h": float(data.get("quoteVolume", 0)),
+                "price_change_24h": float(data.get("priceChange", 0)),
+                "price_change_percent_24h": float(data.get("priceChangePercent", 0)),
+                "high_24h": float(data.get("highPrice", 0)),
+                "low_24h": float(data.get("lowPrice", 0)),
+                "bid": float(data.get("bidPrice", 0)),
+                "ask": float(data.get("askPrice", 0)),
+                "timestamp": datetime.now().isoformat()
+            }
+            
+            print(f"[SUCCESS] Ticker: ${result['last_price']}", file=sys.stderr)
+            return result
+            
         else:
             raise ValueError(f"Exchange {exchange} not supported for ticker yet")
             
     except Exception as e:
         import sys
         print(f"[ERROR] Ticker fetch failed: {type(e).__name__}: {e}", file=sys.stderr)
-        return json.dumps({
+        return {
             "error": f"Failed to fetch ticker from {exchange}",
             "details": str(e),
             "error_type": type(e).__name__
-        })
+        }
+
+
+async def fetch_ticker(symbol: str, exchange: str = "binance") -> str:
+    """
+    Fetch 24-hour ticker data using direct HTTP API.
+    
+    **NEW:** No CCXT dependency!
+    
+    Args:
+        symbol: Trading pair symbol (e.g., 'BTC/USDT').
+        exchange: Exchange name (default: 'binance').
+        
+    Returns:
+        JSON string with ticker data.
+    """
+    return json.dumps(await fetch_ticker_dict(symbol, exchange))
 
 
 def list_supported_exchanges() -> str:
@@ -9,6 +9,7 @@ from typing import List, Optional
 import json
 from datetime import datetime
 
+import numpy as np
 from mcp.server.fastmcp import FastMCP
 
 from core.analytics import (
@@ -16,7 +17,9 @@ from core.analytics import (
     OrderBook,
     OrderBookLevel,
     MicrostructureMetrics,
-    analyze_spread
+    LIQUIDITY_CLASSES,
+    analyze_spread,
+    analyze_spread_batch
 )
 from core.data_validator import DataValidator, validate_order_book
 
@@ -84,20 +87,7 @@ def register_microstructure_tools(mcp: FastMCP) -> None:
         return json.dumps({
             "valid": True,
             "symbol": symbol,
-            "metrics": {
-                "mid_price": metrics.mid_price,
-                "spread": metrics.spread,
-                "spread_bps": metrics.spread_bps,
-                "ofi": metrics.ofi,
-                "obi": metrics.obi,
-                "microprice": metrics.microprice,
-                "microprice_divergence": metrics.microprice_divergence,
-                "directional_probability": metrics.directional_probability,
-                "total_bid_depth": metrics.total_bid_depth,
-                "total_ask_depth": metrics.total_ask_depth,
-                "depth_imbalance": metrics.depth_imbalance,
-                "volatility": metrics.volatility
-            },
+            "metrics": metrics.formatted(),
             "interpretation": {
                 "ofi_signal": "bullish" if metrics.ofi > 0.2 else "bearish" if metrics.ofi < -0.2 else "neutral",
                 "obi_signal": "bid-heavy" if metrics.obi > 0.3 else "ask-heavy" if metrics.obi < -0.3 else "balanced",
@@ -124,6 +114,48 @@ def register_microstructure_tools(mcp: FastMCP) -> None:
         result["timestamp"] = datetime.now().isoformat()
         return json.dumps(result)
     
+    @mcp.tool()
+    def analyze_bid_ask_spreads(bid_prices: List[float], ask_prices: List[float]) -> str:
+        """
+        Spread metrics and liquidity classification for many bid/ask pairs at once.
+        
+        Batch form of analyze_bid_ask_spread (e.g. one pair per book level or
+        per symbol) computed in a single vectorized pass.
+        
+        Args:
+            bid_prices: Bid prices
+            ask_prices: Ask prices, paired with bid_prices by position
+            
+        Returns:
+            JSON string with "count" and parallel lists indexed by pair:
+            "valid", "spread_absolute", "mid_price", "spread_basis_points" and
+            "liquidity_classification". Pairs whose bid is not below the ask
+            have valid=false and null in the other lists.
+        """
+        if len(bid_prices) != len(ask_prices):
+            return json.dumps({
+                "error": "bid_prices and ask_prices must have the same length",
+                "valid": False
+            })
+        
+        batch = analyze_spread_batch(bid_prices, ask_prices)
+        valid = batch["valid"].tolist()
+        
+        def _rounded(values: np.ndarray, digits: int) -> list:
+            return [v if ok else None for v, ok in zip(np.round(values, digits).tolist(), valid)]
+        
+        return json.dumps({
+            "count": len(valid),
+            "valid": valid,
+            "spread_absolute": _rounded(batch["spread_absolute"], 6),
+            "mid_price": _rounded(batch["mid_price"], 6),
+            "spread_basis_points": _rounded(batch["spread_basis_points"], 2),
+            "liquidity_classification": [
+                LIQUIDITY_CLASSES[c] if c >= 0 else None for c in batch["liquidity_class"].tolist()
+            ],
+            "timestamp": datetime.now().isoformat()
+        })
+    
     @mcp.tool()
     def calculate_microprice(
         bid_price: float,
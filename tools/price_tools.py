@@ -6,7 +6,8 @@ MCP tools for fetching and analyzing cryptocurrency prices.
 
 import os
 import json
-from typing import Optional
+import asyncio
+from typing import Optional, Dict, Tuple
 from datetime import datetime, timedelta
 from functools import lru_cache
 
@@ -16,6 +17,17 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 
 from mcp.server.fastmcp import FastMCP
 
+from core.http_pool import LoopClientPool
+
+# orjson serializes the (sometimes year-long) price series in C; it is optional
+try:
+    import orjson
+    
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
+
 
 # API Configuration
 COINGECKO_BASE_URL = "https://api.coingecko.com/api/v3"
@@ -23,6 +35,10 @@ COINGECKO_BASE_URL = "https://api.coingecko.com/api/v3"
 # Cache for API responses (60 second TTL)
 _price_cache: TTLCache = TTLCache(maxsize=100, ttl=60)
 _coin_details_cache: TTLCache = TTLCache(maxsize=50, ttl=300)
+# Failed price lookups are answered from here briefly instead of re-hitting the API
+_price_error_cache: TTLCache = TTLCache(maxsize=100, ttl=5)
+# Price requests in flight; concurrent misses on the same key await one fetch
+_price_inflight: Dict[Tuple, "asyncio.Task[str]"] = {}
 
 
 def _get_headers() -> dict:
@@ -34,16 +50,46 @@ def _get_headers() -> dict:
     return headers
 
 
+def _new_client() -> httpx.AsyncClient:
+    # Built on first use in a loop, i.e. after the server has loaded .env,
+    # so the API key header can be fixed on the client
+    return httpx.AsyncClient(
+        base_url=COINGECKO_BASE_URL,
+        headers=_get_headers(),
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60.0),
+    )
+
+
+# Keep-alive CoinGecko client per event loop (also used by market_server's status check)
+_CLIENTS = LoopClientPool(_new_client)
+get_coingecko_client = _CLIENTS.get
+
+
 @retry(
     stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=1, max=10)
+    wait=wait_exponential(multiplier=1, min=1, max=10),
+    reraise=True  # surface the last httpx error, not tenacity.RetryError
 )
 async def _fetch_with_retry(url: str, params: dict) -> dict:
     """Fetch data with retry logic for rate limits."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params, headers=_get_headers(), timeout=10.0)
-        response.raise_for_status()
-        return response.json()
+    response = await get_coingecko_client().get(url, params=params)
+    response.raise_for_status()
+    return response.json()
+
+
+async def _fetch_price(cache_key: Tuple, params: dict) -> str:
+    """Fetch a price, caching the result (or, briefly, the error) under cache_key."""
+    try:
+        data = await _fetch_with_retry(f"{COINGECKO_BASE_URL}/simple/price", params)
+    except httpx.HTTPError as e:
+        error = f'{{"error": "Failed to fetch price", "details": "{str(e)}"}}'
+        _price_error_cache[cache_key] = error
+        return error
+    data["cached"] = False
+    data["timestamp"] = datetime.now().isoformat()
+    _price_cache[cache_key] = data
+    return _dumps(data)
 
 
 def register_price_tools(mcp: FastMCP) -> None:
@@ -75,15 +121,21 @@ def register_price_tools(mcp: FastMCP) -> None:
         Returns:
             JSON string with price data and market metrics
         """
-        cache_key = f"{asset_id}_{vs_currencies}"
+        cache_key = (asset_id, vs_currencies, include_market_cap, include_24h_vol, include_24h_change)
         
         # Check cache first
         if cache_key in _price_cache:
             cached = _price_cache[cache_key]
             cached["cached"] = True
-            return json.dumps(cached)
+            return _dumps(cached)
+        if cache_key in _price_error_cache:
+            return _price_error_cache[cache_key]
+        
+        # Join a fetch already running for this key rather than starting another
+        task = _price_inflight.get(cache_key)
+        if task is not None:
+            return await asyncio.shield(task)
         
-        url = f"{COINGECKO_BASE_URL}/simple/price"
         params = {
             "ids": asset_id,
             "vs_currencies": vs_currencies,
@@ -92,14 +144,11 @@ def register_price_tools(mcp: FastMCP) -> None:
             "include_24hr_change": str(include_24h_change).lower()
         }
         
-        try:
-            data = await _fetch_with_retry(url, params)
-            data["cached"] = False
-            data["timestamp"] = datetime.now().isoformat()
-            _price_cache[cache_key] = data
-            return json.dumps(data)
-        except httpx.HTTPError as e:
-            return f'{{"error": "Failed to fetch price", "details": "{str(e)}"}}'
+        task = asyncio.ensure_future(_fetch_price(cache_key, params))
+        _price_inflight[cache_key] = task
+        task.add_done_callback(lambda _: _price_inflight.pop(cache_key, None))
+        # Shielded so one caller's cancellation doesn't fail the others waiting on it
+        return await asyncio.shield(task)
     
     @mcp.tool()
     async def get_coin_details(asset_id: str) -> str:
@@ -115,7 +164,7 @@ def register_price_tools(mcp: FastMCP) -> None:
             JSON string with comprehensive coin information
         """
         if asset_id in _coin_details_cache:
-            return json.dumps({**_coin_details_cache[asset_id], "cached": True})
+            return _dumps({**_coin_details_cache[asset_id], "cached": True})
         
         url = f"{COINGECKO_BASE_URL}/coins/{asset_id}"
         params = {
@@ -158,7 +207,7 @@ def register_price_tools(mcp: FastMCP) -> None:
             }
             
             _coin_details_cache[asset_id] = result
-            return json.dumps(result)
+            return _dumps(result)
             
         except httpx.HTTPError as e:
             return f'{{"error": "Failed to fetch coin details", "details": "{str(e)}"}}'
@@ -216,7 +265,7 @@ def register_price_tools(mcp: FastMCP) -> None:
                 "timestamp": datetime.now().isoformat()
             }
             
-            return str(result)
+            return _dumps(result)
             
         except httpx.HTTPError as e:
             return f'{{"error": "Failed to fetch historical data", "details": "{str(e)}"}}'
@@ -248,7 +297,7 @@ def register_price_tools(mcp: FastMCP) -> None:
                     "score": coin.get("score")
                 })
             
-            return json.dumps({
+            return _dumps({
                 "trending_coins": coins,
                 "count": len(coins),
                 "timestamp": datetime.now().isoformat()
@@ -284,7 +333,7 @@ def register_price_tools(mcp: FastMCP) -> None:
                 "timestamp": datetime.now().isoformat()
             }
             
-            return str(result)
+            return _dumps(result)
             
         except httpx.HTTPError as e:
             return f'{{"error": "Failed to fetch global market data", "details": "{str(e)}"}}'
@@ -13,9 +13,16 @@ import httpx
 from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
 
+from core.http_pool import LoopClientPool
+
 # Cache for API responses
 _sentiment_cache: TTLCache = TTLCache(maxsize=10, ttl=3600)  # 1 hour TTL for F&G
 
+# Keep-alive HTTP client per event loop: the host is resolved and the TLS
+# session set up once per connection, not on every index lookup
+_CLIENTS = LoopClientPool(httpx.AsyncClient)
+_get_client = _CLIENTS.get
+
 def register_sentiment_tools(mcp: FastMCP) -> None:
     """
     Register sentiment analysis MCP tools.
@@ -42,10 +49,9 @@ def register_sentiment_tools(mcp: FastMCP) -> None:
         params = {"limit": "1", "format": "json"}
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params, timeout=10.0)
-                response.raise_for_status()
-                data = response.json()
+            response = await _get_client().get(url, params=params, timeout=10.0)
+            response.raise_for_status()
+            data = response.json()
                 
             item = data.get("data", [{}])[0]
             value = int(item.get("value", 50))
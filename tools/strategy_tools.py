@@ -5,13 +5,24 @@ MCP tools exposing the Strategy Engine's decision making.
 """
 
 import json
-from typing import List
+from typing import List, Dict, Any
 from mcp.server.fastmcp import FastMCP
 
 from core.strategy_engine import strategy_engine
 
 # --- Shared Tools ---
 
+def get_trading_signal_dict(
+    symbol: str, 
+    bids: List[List[float]], 
+    asks: List[List[float]], 
+    sentiment_score: float = 50.0
+) -> Dict[str, Any]:
+    """
+    Same as get_trading_signal() but returns the raw signal dict.
+    """
+    return strategy_engine.generate_signal(symbol, bids, asks, sentiment_score)
+
 def get_trading_signal(
     symbol: str, 
     bids: List[List[float]], 
@@ -32,8 +43,7 @@ def get_trading_signal(
     Returns:
         JSON signal with Action (BUY/SELL/HOLD) and Rationale.
     """
-    signal_data = strategy_engine.generate_signal(symbol, bids, asks, sentiment_score)
-    return json.dumps(signal_data)
+    return json.dumps(get_trading_signal_dict(symbol, bids, asks, sentiment_score))
 
 def register_strategy_tools(mcp: FastMCP) -> None:
     """
@@ -23,29 +23,20 @@ _PAPER_BALANCE = 1000000.0 # $1M paper money
 
 # --- Shared Tools ---
 
-def execute_order(symbol: str, side: str, quantity: float, price: float) -> str:
+def execute_order_dict(symbol: str, side: str, quantity: float, price: float) -> Dict[str, Any]:
     """
-    Execute a trade order (Buy/Sell).
-    
-    Args:
-        symbol: Asset symbol (e.g. BTC)
-        side: "BUY" or "SELL"
-        quantity: Amount to trade
-        price: Execution price (Limit) or estimated price
-        
-    Returns:
-        JSON execution report.
+    Same as execute_order() but returns the raw report dict.
     """
     global _PAPER_BALANCE
     
     # 1. Risk Check
     allowed, reason = risk_engine.check_order(symbol, side, quantity, price)
     if not allowed:
-        return json.dumps({
+        return {
             "status": "REJECTED",
             "reason": reason,
             "symbol": symbol
-        })
+        }
         
     # 2. Execution (Paper vs Live)
     trade_value = quantity * price
@@ -56,18 +47,18 @@ def execute_order(symbol: str, side: str, quantity: float, price: float) -> str:
         
         if side.upper() == "BUY":
             if _PAPER_BALANCE < trade_value:
-                return json.dumps({"status": "REJECTED", "reason": "Insufficient paper funds"})
+                return {"status": "REJECTED", "reason": "Insufficient paper funds"}
             _PAPER_BALANCE -= trade_value
             _PAPER_POSITIONS[symbol] = _PAPER_POSITIONS.get(symbol, 0.0) + quantity
         
         elif side.upper() == "SELL":
             current_qty = _PAPER_POSITIONS.get(symbol, 0.0)
             if current_qty < quantity:
-                return json.dumps({"status": "REJECTED", "reason": "Insufficient position"})
+                return {"status": "REJECTED", "reason": "Insufficient position"}
             _PAPER_BALANCE += trade_value
             _PAPER_POSITIONS[symbol] = current_qty - quantity
         
-        return json.dumps({
+        return {
             "status": "FILLED",
             "mode": "PAPER",
             "order_id": order_id,
@@ -77,25 +68,46 @@ def execute_order(symbol: str, side: str, quantity: float, price: float) -> str:
             "quantity": quantity,
             "value": trade_value,
             "remaining_balance": _PAPER_BALANCE
-        })
+        }
     else:
         # Real execution would go here (using exchange_tools/ccxt private api)
         pass
         
-    return json.dumps({"status": "ERROR", "message": "Live trading not fully implemented yet"})
+    return {"status": "ERROR", "message": "Live trading not fully implemented yet"}
 
-def get_positions() -> str:
+def execute_order(symbol: str, side: str, quantity: float, price: float) -> str:
     """
-    Get current portfolio positions.
+    Execute a trade order (Buy/Sell).
+    
+    Args:
+        symbol: Asset symbol (e.g. BTC)
+        side: "BUY" or "SELL"
+        quantity: Amount to trade
+        price: Execution price (Limit) or estimated price
+        
+    Returns:
+        JSON execution report.
+    """
+    return json.dumps(execute_order_dict(symbol, side, quantity, price))
+
+def get_positions_dict() -> Dict[str, Any]:
+    """
+    Same as get_positions() but returns the raw dict.
     """
     if PAPER_TRADING:
-        return json.dumps({
+        return {
             "mode": "PAPER",
             "balance_usd": _PAPER_BALANCE,
-            "positions": _PAPER_POSITIONS
-        })
+            "positions": dict(_PAPER_POSITIONS)  # snapshot, like the JSON version
+        }
     else:
-        return json.dumps({"status": "ERROR", "message": "Live positioning not implemented"})
+        return {"status": "ERROR", "message": "Live positioning not implemented"}
+
+def get_positions() -> str:
+    """
+    Get current portfolio positions.
+    """
+    return json.dumps(get_positions_dict())
 
 
 def get_balance() -> str: